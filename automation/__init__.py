@@ -7,6 +7,6 @@ Modules:
     skeleton: Template for creating new automation scripts
     example: A working example scheduler implementation
 """
-from .api import Scheduler, Page, Process, IoQueue
+from .api import Scheduler, Page, Process, IoQueue, EVENT_TYPES, EVENT_CODES
 
-__all__ = ['Scheduler', 'Page', 'Process', 'IoQueue']
+__all__ = ['Scheduler', 'Page', 'Process', 'IoQueue', 'EVENT_TYPES', 'EVENT_CODES']
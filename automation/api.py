@@ -36,16 +36,56 @@ Event types received:
 - 'PAGE_FREE': Page freed
 - 'PROC_NEW': New process created
 - 'PROC_CPU': Process moved to/from CPU
-- 'PROC_STARV': Process starvation level changed
+- 'PROC_STARV': Process starvation deadline set (on creation, when its
+  starvation level changes and when its I/O event becomes available)
 - 'PROC_WAIT_IO': Process waiting for I/O status changed
 - 'PROC_WAIT_PAGE': Process waiting for page status changed
 - 'PROC_TERM': Process terminated successfully
 - 'PROC_KILL': Process killed (starvation too high)
 - 'PROC_END': Terminated process removed from CPU
 
+Each event also has a `code`, the position of its type in `EVENT_TYPES`
+plus one (its value in `EventType` from `src/game_monitor.py`).
+
 See `src/game_monitor.py` for more details on events.
 """
 from dataclasses import dataclass, field
+from itertools import groupby
+import heapq
+
+# Event types, in the order of their codes.
+EVENT_TYPES = (
+    'IO_QUEUE',
+    'PAGE_NEW',
+    'PAGE_USE',
+    'PAGE_SWAP_QUEUE',
+    'PAGE_SWAP_START',
+    'PAGE_SWAP',
+    'PAGE_FREE',
+    'PROC_NEW',
+    'PROC_CPU',
+    'PROC_STARV',
+    'PROC_WAIT_IO',
+    'PROC_WAIT_PAGE',
+    'PROC_TERM',
+    'PROC_KILL',
+    'PROC_END',
+)
+
+EVENT_CODES = {etype: code for code, etype in enumerate(EVENT_TYPES, start=1)}
+
+def _set_index_membership(index, key, value, is_member):
+    if is_member:
+        index[key] = value
+    else:
+        index.pop(key, None)
+
+def _event_code(event):
+    try:
+        return event.code
+    except AttributeError:
+        # Events built by hand, such as in tests, may only have a type.
+        return EVENT_CODES.get(event.etype, 0)
 
 @dataclass
 class Page:
@@ -86,6 +126,10 @@ class Process:
         starvation_level: Current starvation level (0=happy, 6=dead)
         time_to_termination: Time in ms until process dies from starvation
                              (float('inf') if running or has gracefully terminated)
+                             as of the last change of its starvation level
+        deadline: Game time in ms at which the process dies from starvation if
+                  it stays off the CPU (float('inf') if it has gracefully terminated).
+                  Unlike time_to_termination, it does not go stale.
         waiting_for_io: True if blocked waiting for I/O
         waiting_for_page: True if blocked waiting for a page swap
         has_ended: True if process has terminated
@@ -95,6 +139,7 @@ class Process:
     has_cpu: bool = False
     starvation_level: int = 1
     time_to_termination: float = float('inf')    
+    deadline: float = float('inf')
     waiting_for_io: bool = False
     waiting_for_page: bool = False
     has_ended: bool = False
@@ -128,16 +173,192 @@ class Scheduler:
     
     Subclasses should override the schedule() method to implement
     their scheduling algorithm.
+
+    Handlers are looked up once per class, into a table indexed by event
+    code. A subclass may also define `_update_batch_<EVENT_TYPE>(self, events)`
+    to handle consecutive events of the same type in one call, instead of
+    calling `_update_<EVENT_TYPE>` for each of them.
+
+    Handlers of the types in EVENT_TYPES must therefore be defined in the
+    class body: a handler assigned to an instance, or set on the class after
+    it was created, is not called. Events of other types, or whose code is
+    not in the table, are dispatched by name to `_update_<etype>`, looked up
+    on the instance.
+
+    Besides `processes` and `pages`, the handlers keep indexes of the
+    processes and pages in some states, updated on each event, so that
+    schedule() does not need to scan all of them every frame:
+        running_processes: processes on a CPU, by pid
+        processes_waiting_for_page: processes blocked on a page swap, by pid
+        idle_processes_by_starvation: for each starvation level, the processes
+            that are ready to run but not on a CPU, by pid
+            (see iter_idle_processes())
+        idle processes by deadline: see next_idle_process_to_die() and
+            idle_processes_by_deadline()
+        pages_on_disk_in_use: pages in use but on disk, by key
+        evictable_pages: pages in RAM that are not in use nor being swapped,
+            by key (see iter_evictable_pages())
+    The indexes follow the events: changing the attributes of processes or
+    pages directly does not update them.
+
+    Attributes:
+        wakeup_interval_ms: Longest time in ms the game may go without calling
+                            the scheduler when no new event is available.
+                            0 (default) means the scheduler is called every frame.
+                            None means it is only called when there are new events.
+                            Set it only if schedule() returns no action when it
+                            is called again with no new events. This lets headless
+                            runs with --skip-idle-frames skip idle frames.
+        accepts_current_time: True if the game may call the scheduler with the
+                              game time as second argument. The game only
+                              passes it to schedulers that set this to True.
+                              It is False for subclasses that override
+                              __call__, unless they set it again.
     """
 
+    wakeup_interval_ms: int | None = 0
+    accepts_current_time: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '__call__' in cls.__dict__ and 'accepts_current_time' not in cls.__dict__:
+            # An overridden __call__ may only take the events.
+            cls.accepts_current_time = False
+        cls._build_dispatch_tables()
+
+    @classmethod
+    def _build_dispatch_tables(cls):
+        """Look up the handlers of each event type, indexed by event code.
+        Code 0 is for unknown event types, which have no handler."""
+        cls._event_handlers = [None] + [
+            getattr(cls, f"_update_{etype}", None) for etype in EVENT_TYPES
+        ]
+        cls._batch_event_handlers = [None] + [
+            getattr(cls, f"_update_batch_{etype}", None) for etype in EVENT_TYPES
+        ]
+        cls._has_batch_event_handlers = any(cls._batch_event_handlers)
+
     def __init__(self):
         """Initialize the automation state."""
         self.processes: dict[int, Process] = {}
         self.pages: dict[tuple[int, int], Page] = {}
         self.used_cpus: int = 0
         self.io_queue: IoQueue = IoQueue()
+        self.running_processes: dict[int, Process] = {}
+        self.processes_waiting_for_page: dict[int, Process] = {}
+        self.idle_processes_by_starvation: dict[int, dict[int, Process]] = {}
+        self.pages_on_disk_in_use: dict[tuple[int, int], Page] = {}
+        self.evictable_pages: dict[tuple[int, int], Page] = {}
+        self._idle_process_levels: dict[int, int] = {}
+        self._page_numbers: dict[tuple[int, int], int] = {}
+        self._next_page_number: int = 0
+        self._idle_process_deadlines: dict[int, float] = {}
+        self._idle_deadline_heap: list[tuple[float, int]] = []
+        self.current_time: int | None = None
         self._event_queue: list = []
 
+    # ==================== Indexes ====================
+
+    def iter_idle_processes(self):
+        """Iterate over the processes that are ready to run but not on a CPU,
+        most starved first, and by pid, that is oldest first, within a starvation level."""
+        for level in sorted(self.idle_processes_by_starvation, reverse=True):
+            bucket = self.idle_processes_by_starvation[level]
+            for pid in sorted(bucket):
+                yield bucket[pid]
+
+    def iter_evictable_pages(self):
+        """Iterate over the evictable pages in the order of `pages`, oldest first.
+        Takes O(n log n) time in the number of evictable pages when iteration starts."""
+        page_numbers = self._page_numbers
+        yield from sorted(
+            self.evictable_pages.values(), key=lambda page: page_numbers[page.key])
+
+    def next_idle_process_to_die(self):
+        """Return the idle process with the earliest deadline, or None if there is
+        no idle process. Takes O(log n) amortized time."""
+        heap = self._idle_deadline_heap
+        while heap:
+            deadline, pid = heap[0]
+            if self._idle_process_deadlines.get(pid) == deadline:
+                return self.processes[pid]
+            # The process is no longer idle, or its deadline changed.
+            heapq.heappop(heap)
+        return None
+
+    def idle_processes_by_deadline(self, count):
+        """Return up to `count` idle processes, earliest deadline first.
+        Takes O(n log count) time."""
+        deadlines = self._idle_process_deadlines
+        entries = heapq.nsmallest(count, deadlines.items(), key=lambda entry: entry[1])
+        return [self.processes[pid] for pid, _ in entries]
+
+    def _set_idle_process_deadline(self, pid, deadline):
+        if deadline is None:
+            self._idle_process_deadlines.pop(pid, None)
+            return
+        if self._idle_process_deadlines.get(pid) == deadline:
+            return
+        self._idle_process_deadlines[pid] = deadline
+        heap = self._idle_deadline_heap
+        heapq.heappush(heap, (deadline, pid))
+        if len(heap) > 2 * len(self._idle_process_deadlines) + 64:
+            # Drop the stale entries, which are only removed when they reach the top.
+            heap[:] = [(deadline, pid) for pid, deadline in self._idle_process_deadlines.items()]
+            heapq.heapify(heap)
+
+    def _index_process(self, proc):
+        """Update the indexes of a process after a change of its state."""
+        pid = proc.pid
+        _set_index_membership(self.running_processes, pid, proc, proc.has_cpu)
+        _set_index_membership(
+            self.processes_waiting_for_page, pid, proc, proc.waiting_for_page)
+
+        is_idle = not (
+            proc.has_cpu or proc.has_ended or proc.waiting_for_io or proc.waiting_for_page
+        )
+        self._set_idle_process_deadline(pid, proc.deadline if is_idle else None)
+        level = self._idle_process_levels.get(pid)
+        if level == proc.starvation_level and is_idle:
+            return
+        if level is not None:
+            self._remove_idle_process(pid, level)
+        if is_idle:
+            level = proc.starvation_level
+            self.idle_processes_by_starvation.setdefault(level, {})[pid] = proc
+            self._idle_process_levels[pid] = level
+
+    def _remove_idle_process(self, pid, level):
+        bucket = self.idle_processes_by_starvation[level]
+        del bucket[pid]
+        if not bucket:
+            del self.idle_processes_by_starvation[level]
+        del self._idle_process_levels[pid]
+
+    def _unindex_process(self, proc):
+        pid = proc.pid
+        self.running_processes.pop(pid, None)
+        self.processes_waiting_for_page.pop(pid, None)
+        self._idle_process_deadlines.pop(pid, None)
+        level = self._idle_process_levels.get(pid)
+        if level is not None:
+            self._remove_idle_process(pid, level)
+
+    def _index_page(self, page):
+        """Update the indexes of a page after a change of its state."""
+        key = page.key
+        _set_index_membership(
+            self.pages_on_disk_in_use, key, page, page.on_disk and page.in_use)
+        _set_index_membership(
+            self.evictable_pages, key, page,
+            not (page.on_disk or page.in_use or page.swap_in_progress or page.waiting_to_swap)
+        )
+
+    def _unindex_page(self, page):
+        self.pages_on_disk_in_use.pop(page.key, None)
+        self.evictable_pages.pop(page.key, None)
+        self._page_numbers.pop(page.key, None)
+
     # ==================== Action Methods ====================
 
     def move_page(self, pid, idx):
@@ -174,7 +395,7 @@ class Scheduler:
 
     # ==================== Main Entry Point ====================
 
-    def __call__(self, events: list):
+    def __call__(self, events: list, current_time: int | None = None):
         """Entry point called by the game each frame.
         
         Dispatches each event to the appropriate handler,
@@ -182,23 +403,64 @@ class Scheduler:
         
         Args:
             events: List of game events to process
+            current_time: Game time in ms, available to schedule() as
+                          self.current_time (None if the caller does not pass it)
             
         Returns:
             List of action events to send back to the game
         """
         self._event_queue.clear()
+        self.current_time = current_time
         
         # Update internal state from game events
-        for event in events:
-            handler = getattr(self, f"_update_{event.etype}", None)
-            if handler is not None:
-                handler(event)
+        if self._has_batch_event_handlers:
+            self._dispatch_event_batches(events)
+        else:
+            handlers = self._event_handlers
+            handler_count = len(handlers)
+            for event in events:
+                try:
+                    code = event.code
+                except AttributeError:
+                    code = _event_code(event)
+                if 0 < code < handler_count:
+                    handler = handlers[code]
+                    if handler is not None:
+                        handler(self, event)
+                else:
+                    self._dispatch_event_by_name(event)
         
         # Run the scheduling algorithm
         self.schedule()
         
         return self._event_queue
 
+    def _dispatch_event_batches(self, events):
+        """Dispatch runs of consecutive events of the same type to the batch
+        handler of their type, if any, or else to the handler of each event."""
+        handlers = self._event_handlers
+        batch_handlers = self._batch_event_handlers
+        for code, run in groupby(events, key=_event_code):
+            if not 0 < code < len(handlers):
+                for event in run:
+                    self._dispatch_event_by_name(event)
+                continue
+            batch_handler = batch_handlers[code]
+            if batch_handler is not None:
+                batch_handler(self, list(run))
+                continue
+            handler = handlers[code]
+            if handler is not None:
+                for event in run:
+                    handler(self, event)
+
+    def _dispatch_event_by_name(self, event):
+        """Dispatch an event that has no entry in the handler tables to the
+        `_update_<etype>` method of the instance, if any."""
+        handler = getattr(self, f"_update_{event.etype}", None)
+        if handler is not None:
+            handler(event)
+
     # ==================== Event Handlers ====================
     # These update internal state based on game events.
     # All handlers are defensive - they check if entities exist
@@ -224,6 +486,9 @@ class Scheduler:
         """
         page = Page(event.pid, event.idx, event.swap, event.use)
         self.pages[(event.pid, event.idx)] = page
+        self._page_numbers[page.key] = self._next_page_number
+        self._next_page_number += 1
+        self._index_page(page)
         proc = self.processes.get(event.pid)
         if proc:
             proc.pages.append(page)
@@ -239,6 +504,7 @@ class Scheduler:
         page = self.pages.get((event.pid, event.idx))
         if page:
             page.in_use = event.use
+            self._index_page(page)
 
     def _update_PAGE_SWAP_QUEUE(self, event):
         """Handle page queued for swap (or cancelled).
@@ -255,6 +521,7 @@ class Scheduler:
                 # Swap was cancelled
                 page.swap_in_progress = False
                 page.swap_percentage_completed = 0.0
+            self._index_page(page)
 
     def _update_PAGE_SWAP_START(self, event):
         """Handle page swap started.
@@ -268,6 +535,7 @@ class Scheduler:
             page.waiting_to_swap = False
             page.swap_in_progress = True
             page.swap_percentage_completed = 0.0
+            self._index_page(page)
 
     def _update_PAGE_SWAP(self, event):
         """Handle page swap completed (RAM <-> disk).
@@ -282,6 +550,7 @@ class Scheduler:
             page.on_disk = event.swap
             page.swap_in_progress = False
             page.swap_percentage_completed = 0.0
+            self._index_page(page)
 
     def _update_PAGE_FREE(self, event):
         """Handle page being freed.
@@ -292,9 +561,14 @@ class Scheduler:
         """
         page = self.pages.pop((event.pid, event.idx), None)
         if page:
+            self._unindex_page(page)
             proc = self.processes.get(event.pid)
-            if proc and page in proc.pages:
-                proc.pages.remove(page)
+            if proc:
+                # Pages compare equal to their key, compare identities instead.
+                for index, proc_page in enumerate(proc.pages):
+                    if proc_page is page:
+                        del proc.pages[index]
+                        break
 
     def _update_PROC_NEW(self, event):
         """Handle new process creation.
@@ -302,7 +576,9 @@ class Scheduler:
         Args:
             event.pid: New process ID
         """
-        self.processes[event.pid] = Process(event.pid)
+        proc = Process(event.pid)
+        self.processes[event.pid] = proc
+        self._index_process(proc)
 
     def _update_PROC_CPU(self, event):
         """Handle process moved to/from CPU.
@@ -318,6 +594,7 @@ class Scheduler:
                 self.used_cpus += 1
             else:
                 self.used_cpus -= 1
+            self._index_process(proc)
 
     def _update_PROC_STARV(self, event):
         """Handle process starvation level change.
@@ -326,11 +603,18 @@ class Scheduler:
             event.pid: Process ID
             event.starvation_level: New starvation level (0-6)
             event.time_to_termination: Time in ms until process dies from starvation
+            event.deadline: Game time in ms at which the process dies from starvation
+                            if it stays off the CPU
         """
         proc = self.processes.get(event.pid)
         if proc:
             proc.starvation_level = event.starvation_level
             proc.time_to_termination = event.time_to_termination
+            # Events built by hand, or sent without one, may have no deadline.
+            deadline = getattr(event, 'deadline', None)
+            if deadline is not None:
+                proc.deadline = deadline
+            self._index_process(proc)
 
     def _update_PROC_WAIT_IO(self, event):
         """Handle process I/O wait status change.
@@ -342,6 +626,7 @@ class Scheduler:
         proc = self.processes.get(event.pid)
         if proc:
             proc.waiting_for_io = event.waiting_for_io
+            self._index_process(proc)
 
     def _update_PROC_WAIT_PAGE(self, event):
         """Handle process page wait status change.
@@ -353,6 +638,7 @@ class Scheduler:
         proc = self.processes.get(event.pid)
         if proc:
             proc.waiting_for_page = event.waiting_for_page
+            self._index_process(proc)
 
     def _update_PROC_TERM(self, event):
         """Handle process termination (ready to be removed).
@@ -363,6 +649,7 @@ class Scheduler:
         proc = self.processes.get(event.pid)
         if proc:
             proc.has_ended = True
+            self._index_process(proc)
 
     def _update_PROC_KILL(self, event):
         """Handle process killed (starvation too high).
@@ -372,8 +659,10 @@ class Scheduler:
         """
         proc = self.processes.pop(event.pid, None)
         if proc:
+            self._unindex_process(proc)
             for page in proc.pages:
                 self.pages.pop(page.key, None)
+                self._unindex_page(page)
 
     def _update_PROC_END(self, event):
         """Handle terminated process removed from CPU.
@@ -384,8 +673,10 @@ class Scheduler:
         proc = self.processes.pop(event.pid, None)
         if proc:
             self.used_cpus -= 1
+            self._unindex_process(proc)
             for page in proc.pages:
                 self.pages.pop(page.key, None)
+                self._unindex_page(page)
 
     # ==================== Override This ====================
 
@@ -396,6 +687,10 @@ class Scheduler:
         have been processed. Use the action methods (move_page,
         move_process, do_io) to send commands back to the game.
         
-        Access self.processes, self.pages, self.io_queue and self.used_cpus for current state.
+        Access self.processes, self.pages, self.io_queue and self.used_cpus for current state,
+        and the indexes described in the class docstring to find processes and pages by state.
+        self.current_time is the game time in ms, to compare with process deadlines.
         """
         pass
+
+Scheduler._build_dispatch_tables() # pylint: disable=protected-access
@@ -1,3 +1,5 @@
+from itertools import takewhile
+
 from automation import Scheduler
 
 MAX_PROCESS_MOVES_PER_FRAME = 2
@@ -5,6 +7,10 @@ MAX_PAGE_SWAPS_PER_FRAME = 4
 STARVATION_THRESHOLD_TO_YIELD = 3
 
 class SimpleScheduler(Scheduler):
+    # wakeup_interval_ms stays 0: moves and swaps are limited per frame, and
+    # recently moved processes are counted in frames, so schedule() must be
+    # called every frame. --skip-idle-frames gives this scheduler no speedup.
+
     def __init__(self):
         super().__init__()
         self._recently_moved_processes = []
@@ -15,6 +21,9 @@ class SimpleScheduler(Scheduler):
         self._pending_swap_ins = set()
         self._process_moves_this_frame = 0
         self._page_swaps_this_frame = 0
+        # The pages do not change state until the next events, so the pages
+        # skipped by one call of _make_room_in_ram are skipped by the next ones.
+        self._pages_to_evict = self.iter_evictable_pages()
         self._handle_io_queue()
         self._handle_page_swaps()
         self._handle_terminated_processes()
@@ -50,10 +59,8 @@ class SimpleScheduler(Scheduler):
     def _make_room_in_ram(self):
         if not self._can_swap_page():
             return False
-        for page in self.pages.values():
-            if (not page.on_disk and not page.in_use 
-                    and not page.swap_in_progress and not page.waiting_to_swap
-                    and page.key not in self._pending_swap_outs):
+        for page in self._pages_to_evict:
+            if page.key not in self._pending_swap_outs:
                 self.move_page(page.pid, page.idx)
                 self._pending_swap_outs.add(page.key)
                 self._page_swaps_this_frame += 1
@@ -66,15 +73,14 @@ class SimpleScheduler(Scheduler):
                 self.move_process(proc.pid)
 
     def _schedule_processes(self):
-        active_procs = [p for p in self.processes.values() if not p.has_ended]
-        running = [p for p in active_procs if p.has_cpu]
-        waiting = [p for p in active_procs if not p.has_cpu and not p.waiting_for_io and not p.waiting_for_page and p.starvation_level > 0]
-        waiting.sort(key=lambda p: p.starvation_level, reverse=True)
+        running = [p for p in self.running_processes.values() if not p.has_ended]
         recently_moved = set()
         for s in self._recently_moved_processes:
             recently_moved.update(s)
-        happy_running = [p for p in running if p.starvation_level == 0]
-        waiting_to_assign = [p for p in waiting if p.starvation_level > 0]
+        happy_running = sorted(
+            (p for p in running if p.starvation_level == 0), key=lambda p: p.pid)
+        waiting_to_assign = list(takewhile(
+            lambda p: p.starvation_level > 0, self.iter_idle_processes()))
         for proc in happy_running:
             if not waiting_to_assign:
                 break
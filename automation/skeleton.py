@@ -28,6 +28,13 @@ class MyScheduler(Scheduler):
         self.pages: dict[tuple[int,int], Page] - all memory pages
         self.used_cpus: int - number of CPUs currently in use
         self.io_queue.io_count: int - number of I/O events ready
+        self.running_processes: dict[int, Process] - processes on a CPU
+        self.processes_waiting_for_page: dict[int, Process] - processes blocked on a page
+        self.iter_idle_processes() - processes ready to run, most starved first
+        self.pages_on_disk_in_use: dict[tuple[int,int], Page] - pages to swap in
+        self.evictable_pages: dict[tuple[int,int], Page] - pages that can be swapped out
+        self.next_idle_process_to_die() - idle process with the earliest deadline
+        self.current_time: int - game time in ms, to compare with Process.deadline
     
     Available actions:
         self.move_process(pid) - toggle process on/off CPU
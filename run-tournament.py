@@ -0,0 +1,10 @@
+import subprocess
+import sys
+
+args = sys.argv[1:]
+
+subprocess.run([
+    'python',
+    'tournament.py',
+    *args
+], cwd='src')
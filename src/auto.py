@@ -4,26 +4,35 @@ Entry point to run the game with an automated script.
 This just runs the Stage scene, with the difficulty and script
 provided from the command line. A sandbox config module can
 also be provided.
+
+With `--headless`, the stage is simulated without a window and
+without frame cap, and a summary of the run is printed at the end.
+
+With `--record`, the events passed to the script and the actions it
+returns are written to a binary file (see event_recorder.py). Headless
+recorded runs can be replayed with replay.py.
 """
 
 import asyncio
-from importlib import import_module
 from os import path
 import argparse
+import secrets
 import sys
+import time
 
-from config.difficulty_levels import default_difficulty, difficulty_levels_map
+from cli_utils import get_stage_or_difficulty
+from constants import ONE_MINUTE, ONE_SECOND
+from engine import profiler
 from engine.game_manager import GameManager
 from engine.window_config import WindowConfig
+from event_recorder import EventRecorder
 from scenes.stage import Stage
 from game_info import TITLE
 from window_size import WINDOW_SIZE
 
-def parse_arguments():
-    """Parse command line arguments.
+_DEFAULT_HEADLESS_TIME_LIMIT_MINUTES = 30
 
-    Returns the script filename and either a Stage or (config, name) tuple.
-    """
+def _parse_args():
     parser = argparse.ArgumentParser(
         prog="pipenv run auto",
         description="Run the game with an automated script"
@@ -49,32 +58,39 @@ def parse_arguments():
     config_group.add_argument('--sandbox', metavar='MODULE',
         help="use a sandbox config module (e.g., sandbox.sample)")
 
-    args = parser.parse_args()
-
-    if args.sandbox is not None:
-        return args.filename, _load_sandbox_module(args.sandbox)
-
-    return args.filename, _get_difficulty_config(args.difficulty)
-
-def _load_sandbox_module(module_path):
+    parser.add_argument('--seed', type=int,
+        help="seed of the random number generator, to make a run reproducible")
+    parser.add_argument('--headless', action='store_true',
+        help="simulate the stage as fast as possible without opening a window")
+    parser.add_argument('--skip-idle-frames', action='store_true',
+        help="in a headless run, jump straight to the next frame at which "
+            "something may change (same results, fewer frames to simulate)")
+    parser.add_argument('--profile', action='store_true',
+        help="measure the time spent updating and drawing each class of game objects, "
+            f"shown in game with {profiler.OVERLAY_HOTKEY.upper()} and printed at exit")
+    parser.add_argument('--record', metavar='FILE',
+        help="write the game events and the actions of the script to FILE")
+    parser.add_argument('--time-limit', metavar='MINUTES', type=float,
+        default=_DEFAULT_HEADLESS_TIME_LIMIT_MINUTES,
+        help="simulated time after which a headless run stops "
+            f"(default: {_DEFAULT_HEADLESS_TIME_LIMIT_MINUTES})")
+
+    return parser.parse_args()
+
+def _get_stage_or_difficulty(args):
     try:
-        config_module = import_module(module_path)
-    except ModuleNotFoundError:
-        print(f"Error: sandbox module '{module_path}' not found.", file=sys.stderr)
-        sys.exit(1)
-
-    if not hasattr(config_module, 'stage'):
-        print("Error: Sandbox module must define 'stage'.", file=sys.stderr)
+        return get_stage_or_difficulty(args.difficulty, args.sandbox)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    return config_module.stage
+def parse_arguments():
+    """Parse command line arguments.
 
-def _get_difficulty_config(difficulty_name):
-    """Get configuration for a difficulty preset."""
-    difficulty = default_difficulty
-    if difficulty_name is not None:
-        difficulty = difficulty_levels_map[difficulty_name]
-    return difficulty.config, f"Difficulty: {difficulty.name.upper()}"
+    Returns the script filename and either a Stage or (config, name) tuple.
+    """
+    args = _parse_args()
+    return args.filename, _get_stage_or_difficulty(args)
 
 def compile_auto_script(source_file):
     if not path.isabs(source_file):
@@ -84,10 +100,7 @@ def compile_auto_script(source_file):
     return compile(source, source_file, 'exec')
 
 
-async def main():
-    script_filename, stage_or_difficulty = parse_arguments()
-    compiled_script = compile_auto_script(script_filename)
-
+def create_stage(compiled_script, stage_or_difficulty):
     if isinstance(stage_or_difficulty, Stage):
         stage_scene = stage_or_difficulty
         stage_scene.standalone = True
@@ -95,14 +108,100 @@ async def main():
     else:
         stage_config, stage_name = stage_or_difficulty
         stage_scene = Stage(stage_name, stage_config, script=compiled_script, standalone=True)
+    return stage_scene
 
+def create_game_manager(stage_scene):
     game_manager = GameManager()
     game_manager.window_config = WindowConfig(WINDOW_SIZE, TITLE, path.join('assets', 'icon.png'))
 
     game_manager.register_scene(stage_scene)
     game_manager.startup_scene = stage_scene
+    return game_manager
+
+def simulate_stage(stage_scene, time_limit_ms, *, skip_idle_frames=False):
+    """Simulate the stage headlessly until it is completed or the time limit is reached.
 
-    await game_manager.play(ignore_events=True)
+    Returns a dict summarizing the run.
+    """
+    game_manager = create_game_manager(stage_scene)
+
+    wall_time_start = time.perf_counter()
+    simulated_time_ms = game_manager.simulate(
+        time_limit_ms,
+        stop_condition=lambda: stage_scene.stage_completed,
+        skip_idle_frames=skip_idle_frames
+    )
+    wall_time = time.perf_counter() - wall_time_start
+
+    return {
+        'stage': stage_scene.name,
+        'state': stage_scene.state.name,
+        'score': stage_scene.score_manager.score,
+        'uptime_ms': stage_scene.uptime_manager.uptime_ms,
+        'uptime': stage_scene.uptime_manager.uptime_text,
+        'user_terminated_process_count':
+            stage_scene.process_manager.user_terminated_process_count,
+        'simulated_time_ms': simulated_time_ms,
+        'wall_time_s': wall_time,
+    }
+
+def _print_summary(result):
+    simulated_seconds = result['simulated_time_ms'] / ONE_SECOND
+    wall_time = result['wall_time_s']
+    print(f"{result['stage']} - {result['state']}")
+    print(f"Score: {result['score']}")
+    print(f"Uptime: {result['uptime']}")
+    print(f"User ragequits: {result['user_terminated_process_count']}")
+    print(
+        f"Simulated {simulated_seconds:.1f} s in {wall_time:.2f} s "
+        f"({simulated_seconds / wall_time if wall_time > 0 else float('inf'):.1f} "
+        "simulated seconds per wall second)"
+    )
+
+def _create_event_recorder(args):
+    record_file = args.record
+    if not path.isabs(record_file):
+        record_file = '../' + record_file
+    return EventRecorder(record_file, metadata={
+        'script': args.filename,
+        'difficulty': args.difficulty,
+        'sandbox': args.sandbox,
+        'seed': args.seed,
+        # Runs played in real time have irregular frames, and cannot be replayed.
+        'step_ms': 1000 // GameManager.fps if args.headless else None,
+    })
+
+async def main():
+    args = _parse_args()
+    if args.record is not None and args.seed is None:
+        # A recorded run is replayed from its seed.
+        args.seed = secrets.randbelow(2 ** 32)
+    if args.profile:
+        profiler.enable(dump_at_exit=True)
+    compiled_script = compile_auto_script(args.filename)
+    stage_scene = create_stage(compiled_script, _get_stage_or_difficulty(args))
+    stage_scene.seed = args.seed
+
+    if args.record is not None:
+        stage_scene.event_recorder = _create_event_recorder(args)
+
+    try:
+        if args.headless:
+            result = simulate_stage(
+                stage_scene,
+                int(args.time_limit * ONE_MINUTE),
+                skip_idle_frames=args.skip_idle_frames
+            )
+            if stage_scene.event_recorder is not None:
+                stage_scene.event_recorder.record_end(result['simulated_time_ms'], result['score'])
+            _print_summary(result)
+            return
+
+        game_manager = create_game_manager(stage_scene)
+        await game_manager.play(ignore_events=True)
+    finally:
+        if stage_scene.event_recorder is not None:
+            stage_scene.event_recorder.close()
 
 if __name__ == '__main__':
     asyncio.run(main())
@@ -0,0 +1,217 @@
+"""
+Entry point to benchmark the stage at every difficulty level.
+
+A stage is built for each built-in difficulty level, plus a synthetic
+max-load config, and driven by the example automated script. The wall
+time of each `Stage.update` and `Stage.render` call is measured
+separately, and their median, 99th percentile and maximum are reported.
+
+Results can be saved as a JSON baseline, and later runs can be compared
+against it to flag performance regressions.
+"""
+
+from os import path
+import argparse
+import json
+import sys
+import time
+
+from cli_utils import from_project_root, percentile
+from constants import (
+    MAX_CPU_COUNT, MAX_PROCESSES, MAX_PROCESSES_AT_STARTUP, MAX_RAM_ROWS, ONE_SECOND
+)
+from config.cpu_config import CpuConfig
+from config.difficulty_levels import difficulty_levels_map
+from config.stage_config import StageConfig
+from scenes.stage import Stage
+from auto import compile_auto_script, create_game_manager
+
+MAX_LOAD_CONFIG_NAME = 'max-load'
+
+_DEFAULT_SCRIPT = 'automation/example.py'
+_DEFAULT_DURATION_SECONDS = 60
+_DEFAULT_THRESHOLD_PERCENT = 20
+
+_max_load_config = StageConfig(
+    cpu_config=CpuConfig(num_cores=MAX_CPU_COUNT),
+    num_processes_at_startup=MAX_PROCESSES_AT_STARTUP,
+    max_processes=MAX_PROCESSES,
+    num_ram_rows=MAX_RAM_ROWS,
+    parallel_swaps=4,
+    new_process_probability=1,
+    io_probability=0.1,
+)
+
+benchmark_configs = {
+    **{name: level.config for name, level in difficulty_levels_map.items()},
+    MAX_LOAD_CONFIG_NAME: _max_load_config,
+}
+
+# Statistics compared against the baseline. The maximum is reported,
+# but too noisy to be compared.
+_COMPARED_STATS = ('p50', 'p99')
+_TIMED_METHODS = ('update', 'render')
+
+class _TimedStage(Stage):
+    """Stage that records the wall time of each update and render call."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.update_times_ms = []
+        self.render_times_ms = []
+
+    def update(self, current_time, events):
+        start = time.perf_counter()
+        super().update(current_time, events)
+        self.update_times_ms.append((time.perf_counter() - start) * ONE_SECOND)
+
+    def render(self):
+        start = time.perf_counter()
+        super().render()
+        self.render_times_ms.append((time.perf_counter() - start) * ONE_SECOND)
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        prog="pipenv run benchmark",
+        description="Measure the time spent updating and rendering the stage"
+    )
+
+    parser.add_argument('--configs', nargs='+', metavar='CONFIG',
+        choices=list(benchmark_configs.keys()), default=list(benchmark_configs.keys()),
+        help="configs to benchmark (default: all difficulty levels and "
+            f"{MAX_LOAD_CONFIG_NAME})")
+    parser.add_argument('--script', metavar='FILENAME', default=_DEFAULT_SCRIPT,
+        help=f"automated script driving the stage (default: {_DEFAULT_SCRIPT})")
+    parser.add_argument('--duration', metavar='SECONDS', type=float,
+        default=_DEFAULT_DURATION_SECONDS,
+        help="simulated time to benchmark each config for, unless the stage ends "
+            f"before (default: {_DEFAULT_DURATION_SECONDS})")
+    parser.add_argument('--seed', type=int, default=0,
+        help="seed of the random number generator (default: 0)")
+    parser.add_argument('--save', metavar='FILE',
+        help="save the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='FILE',
+        help="compare the results against a JSON baseline, "
+            "and exit with an error if there is any regression")
+    parser.add_argument('--threshold', metavar='PERCENT', type=float,
+        default=_DEFAULT_THRESHOLD_PERCENT,
+        help="slowdown from the baseline above which a statistic is flagged "
+            f"as a regression (default: {_DEFAULT_THRESHOLD_PERCENT})")
+
+    return parser.parse_args()
+
+def summarize_times(times_ms):
+    sorted_times = sorted(times_ms)
+    return {
+        'p50': percentile(sorted_times, 50),
+        'p99': percentile(sorted_times, 99),
+        'max': sorted_times[-1],
+    }
+
+def run_benchmark(config_name, script_filename, duration_ms, seed):
+    """Simulate the stage with the given config, and time each update and render.
+
+    Returns a dict with the number of frames, and a summary of the time in ms
+    spent in each method.
+    """
+    stage_scene = _TimedStage(
+        config_name,
+        benchmark_configs[config_name],
+        script=compile_auto_script(script_filename),
+        standalone=True
+    )
+    stage_scene.seed = seed
+    create_game_manager(stage_scene).simulate(
+        duration_ms,
+        stop_condition=lambda: stage_scene.stage_completed,
+        render=True
+    )
+    return {
+        'frames': len(stage_scene.update_times_ms),
+        'update': summarize_times(stage_scene.update_times_ms),
+        'render': summarize_times(stage_scene.render_times_ms),
+    }
+
+def compare_results(baseline, results, threshold_percent):
+    """Return the statistics of `results` that are slower than in `baseline`
+    by more than `threshold_percent`. Configs missing from the baseline are ignored.
+    """
+    regressions = []
+    for config_name, result in results.items():
+        if config_name not in baseline:
+            continue
+        for method in _TIMED_METHODS:
+            for stat in _COMPARED_STATS:
+                baseline_ms = baseline[config_name][method][stat]
+                current_ms = result[method][stat]
+                if current_ms > baseline_ms * (1 + threshold_percent / 100):
+                    regressions.append({
+                        'config': config_name,
+                        'method': method,
+                        'stat': stat,
+                        'baseline_ms': baseline_ms,
+                        'current_ms': current_ms,
+                    })
+    return regressions
+
+def format_results(results):
+    header = ['config', 'frames', 'method', 'p50 (ms)', 'p99 (ms)', 'max (ms)']
+    lines = []
+    for config_name, result in results.items():
+        for method in _TIMED_METHODS:
+            summary = result[method]
+            lines.append([
+                config_name,
+                str(result['frames']),
+                method,
+                *(f"{summary[stat]:.3f}" for stat in ('p50', 'p99', 'max')),
+            ])
+    widths = [max(len(line[i]) for line in [header] + lines) for i in range(len(header))]
+    return '\n'.join(
+        '  '.join(
+            cell.ljust(width) if i in (0, 2) else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(line, widths))
+        )
+        for line in [header] + lines
+    )
+
+def _format_slowdown(baseline_ms, current_ms):
+    if baseline_ms == 0:
+        # No relative slowdown from a zero baseline.
+        return f"+{current_ms - baseline_ms:.3f} ms"
+    return f"+{(current_ms / baseline_ms - 1) * 100:.0f}%"
+
+def format_regressions(regressions):
+    return '\n'.join(
+        f"REGRESSION {regression['config']} {regression['method']} {regression['stat']}: "
+        f"{regression['baseline_ms']:.3f} ms -> {regression['current_ms']:.3f} ms "
+        f"({_format_slowdown(regression['baseline_ms'], regression['current_ms'])})"
+        for regression in regressions
+    )
+
+def main():
+    args = parse_arguments()
+    script_filename = from_project_root(args.script)
+
+    results = {}
+    for config_name in args.configs:
+        results[config_name] = run_benchmark(
+            config_name, script_filename, int(args.duration * ONE_SECOND), args.seed
+        )
+    print(format_results(results))
+
+    if args.save is not None:
+        with open(from_project_root(args.save), 'w', encoding='utf_8') as out_file:
+            json.dump(results, out_file, indent=2)
+
+    if args.compare is not None:
+        with open(from_project_root(args.compare), encoding='utf_8') as in_file:
+            baseline = json.load(in_file)
+        regressions = compare_results(baseline, results, args.threshold)
+        if regressions:
+            print(format_regressions(regressions), file=sys.stderr)
+            sys.exit(1)
+        print(f"No regression above {args.threshold:g}% from {path.basename(args.compare)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Helpers shared by the command line entry points: auto, tournament,
+benchmark, replay and replay_viewer.
+
+They are run from `src`, so the filenames given on the command line
+are resolved from the project root.
+"""
+
+from importlib import import_module, reload
+from os import path
+import sys
+
+from config.difficulty_levels import default_difficulty, difficulty_levels_map
+from event_recorder import EventLogReader
+
+def from_project_root(filename):
+    """Return the absolute path of `filename`, relative to the project root
+    unless it is already absolute."""
+    if path.isabs(filename):
+        return filename
+    return path.abspath(path.join('..', filename))
+
+def percentile(sorted_values, percent):
+    """Linearly interpolated percentile of an already sorted list."""
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def get_difficulty_config(difficulty_name):
+    """Get configuration for a difficulty preset."""
+    difficulty = default_difficulty
+    if difficulty_name is not None:
+        difficulty = difficulty_levels_map[difficulty_name]
+    return difficulty.config, f"Difficulty: {difficulty.name.upper()}"
+
+def load_sandbox_stage(module_path):
+    """Return the stage defined by a sandbox config module.
+
+    The module is executed again if it was already imported, so that each
+    call returns a new stage rather than one that may already have been played.
+    Raises ValueError if the module is not found or does not define `stage`.
+    """
+    try:
+        config_module = sys.modules.get(module_path)
+        if config_module is None:
+            config_module = import_module(module_path)
+        else:
+            config_module = reload(config_module)
+    except ModuleNotFoundError as exc:
+        raise ValueError(f"sandbox module '{module_path}' not found.") from exc
+
+    if not hasattr(config_module, 'stage'):
+        raise ValueError("Sandbox module must define 'stage'.")
+
+    return config_module.stage
+
+def get_stage_or_difficulty(difficulty_name=None, sandbox=None):
+    """Return the stage of the `sandbox` module if provided, otherwise
+    the (config, name) tuple of the difficulty preset."""
+    if sandbox is not None:
+        return load_sandbox_stage(sandbox)
+    return get_difficulty_config(difficulty_name)
+
+def read_recording(filename):
+    """Read a run recorded with `auto --headless --record`, to replay it.
+
+    Returns its metadata, the (time, score) of its end and its actions,
+    as (time, action) tuples. Raises ValueError if the run cannot be replayed.
+    """
+    with EventLogReader(filename) as recording:
+        metadata = recording.metadata
+        end = recording.end
+        actions = list(recording.actions())
+    if metadata.get('seed') is None or metadata.get('step_ms') is None:
+        raise ValueError(
+            f'{filename} was not recorded from a headless run with a seed, '
+            'and cannot be replayed'
+        )
+    if end is None:
+        raise ValueError(f'{filename} does not record a complete run')
+    return metadata, end, actions
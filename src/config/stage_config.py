@@ -33,6 +33,8 @@ class StageConfig:
     priority_process_graceful_termination_probability: float | None = None
     time_ms_to_show_sort_button: int = 6 * ONE_MINUTE
     time_ms_to_show_auto_sort_checkbox: int = 12 * ONE_MINUTE
+    # Compute the sort keys of the processes with NumPy, which must be installed.
+    vectorized_process_table: bool = False
 
     def __post_init__(self):
         object.__setattr__(
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from engine.drawable import Drawable
+
+@dataclass
+class _Animation:
+    x_speed: int
+    y_speed: int
+    on_complete: Optional[Callable[[Drawable], None]]
+
+def _has_pending_move(drawable: Drawable):
+    # A target that is only set on one axis is cleared by the move that follows
+    # its arrival, so the drawable keeps moving until then.
+    return (
+        (drawable.target_x is not None or drawable.target_y is not None)
+        and (drawable.target_x != drawable.x or drawable.target_y != drawable.y)
+    )
+
+def _has_arrived(drawable: Drawable):
+    return (
+        (drawable.target_x is None or drawable.x == drawable.target_x)
+        and (drawable.target_y is None or drawable.y == drawable.target_y)
+    )
+
+class AnimationManager:
+    """Moves drawables towards their target position.
+
+    Drawables are registered once with their speed, and are then animated
+    whenever a target position is set on them. Only the drawables that have
+    not reached their target yet are advanced by update(), in the order in
+    which they started moving.
+    """
+
+    def __init__(self):
+        self._animations = {}
+        self._moving = {}
+
+    def __len__(self):
+        return len(self._animations)
+
+    def __contains__(self, drawable):
+        return drawable in self._animations
+
+    @property
+    def is_animating(self):
+        """Whether any registered drawable is moving."""
+        return len(self._moving) > 0
+
+    def is_moving(self, drawable):
+        return drawable in self._moving
+
+    def register(self, drawable: Drawable, speed=None, *, x_speed=0, y_speed=0,
+                 on_complete: Callable[[Drawable], None] = None):
+        """Animate `drawable` whenever its target position is set.
+
+        `on_complete` is called with the drawable each time it arrives at its target.
+        """
+        if speed is not None:
+            x_speed = speed
+            y_speed = speed
+        self._animations[drawable] = _Animation(x_speed, y_speed, on_complete)
+        drawable.attach_animation_manager(self)
+        self.notify_target_change(drawable)
+
+    def unregister(self, drawable: Drawable):
+        if self._animations.pop(drawable, None) is not None:
+            drawable.attach_animation_manager(None)
+            self._moving.pop(drawable, None)
+
+    def notify_target_change(self, drawable: Drawable):
+        """Called by the registered drawables when their target position changes."""
+        if _has_pending_move(drawable):
+            self._moving[drawable] = None
+        else:
+            self._moving.pop(drawable, None)
+
+    def update(self):
+        for drawable in list(self._moving):
+            if drawable not in self._moving:
+                continue
+            animation = self._animations[drawable]
+            had_arrived = _has_arrived(drawable)
+            drawable.move_towards_target_xy(
+                x_speed=animation.x_speed, y_speed=animation.y_speed
+            )
+            arrived = not had_arrived and _has_arrived(drawable)
+            if not _has_pending_move(drawable):
+                drawable.set_target_xy(None, None)
+            if arrived and animation.on_complete is not None:
+                animation.on_complete(drawable)
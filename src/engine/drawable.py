@@ -4,6 +4,9 @@ import pygame
 
 
 class Drawable(ABC):
+    _move_listeners = ()
+    _animation_manager = None
+
     def __init__(self, x=0, y=0):
         self._x = x
         self._y = y
@@ -17,6 +20,8 @@ class Drawable(ABC):
     @x.setter
     def x(self, x):
         self._x = x
+        for listener in self._move_listeners:
+            listener(self)
 
     @property
     def y(self):
@@ -25,6 +30,21 @@ class Drawable(ABC):
     @y.setter
     def y(self, y):
         self._y = y
+        for listener in self._move_listeners:
+            listener(self)
+
+    def add_move_listener(self, listener):
+        """Register a function called with the drawable whenever its position changes."""
+        self._move_listeners = (*self._move_listeners, listener)
+
+    def remove_move_listener(self, listener):
+        self._move_listeners = tuple(
+            other for other in self._move_listeners if other is not listener
+        )
+
+    def attach_animation_manager(self, animation_manager):
+        """Set the animation manager to notify whenever the target position changes."""
+        self._animation_manager = animation_manager
 
     def set_xy(self, x, y):
         self.x = x
@@ -37,6 +57,8 @@ class Drawable(ABC):
     @target_x.setter
     def target_x(self, target_x):
         self._target_x = target_x
+        if self._animation_manager is not None:
+            self._animation_manager.notify_target_change(self)
 
     @property
     def target_y(self):
@@ -45,11 +67,31 @@ class Drawable(ABC):
     @target_y.setter
     def target_y(self, target_y):
         self._target_y = target_y
+        if self._animation_manager is not None:
+            self._animation_manager.notify_target_change(self)
 
     def set_target_xy(self, target_x, target_y):
         self.target_x = target_x
         self.target_y = target_y
 
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Area of the surface that draw() paints.
+
+        Override if draw() paints outside of the position and size of the drawable.
+        """
+        return pygame.Rect(self._x, self._y, self.width, self.height)
+
+    @property
+    def visual_state(self):
+        """Hashable value that changes whenever draw() would paint something different
+        within the same bounds, so that the scene only redraws the drawables that changed.
+
+        The default is None, meaning that the visual state is unknown, and that
+        the drawable is redrawn every frame.
+        """
+        return None
+
     def collides(self, x, y):
         return pygame.Rect(self._x, self._y, self.width,
                            self.height).collidepoint(x, y)
@@ -1,8 +1,10 @@
 import asyncio
+from math import ceil
 from typing import Union
 
 import pygame
 
+from engine import profiler
 from engine.game_event import GameEvent
 from engine.game_event_type import GameEventType
 from engine.scene import Scene
@@ -132,6 +134,12 @@ class GameManager():
             for event in events:
                 if event.type == GameEventType.QUIT:
                     return
+                if (
+                    event.type == GameEventType.KEY_UP
+                    and event.get_property('key') == profiler.OVERLAY_HOTKEY
+                    and profiler.is_enabled()
+                ):
+                    profiler.toggle_overlay()
 
             if ignore_events:
                 events = []
@@ -139,11 +147,18 @@ class GameManager():
             self._scene_manager.update(pygame.time.get_ticks(), events)
 
             self._scene_manager.current_scene.render()
+            profiler.end_frame()
 
             clock.tick(self.fps)
 
             await asyncio.sleep(0)
 
+    def _init_headless_screen(self):
+        if self.window_config is None:
+            raise ValueError('Property `window_config` needs to be set.')
+        self._screen = pygame.Surface(self.window_config.size)
+        self._scene_manager.screen = self._screen
+
     async def play(self, ignore_events=False):
         self._init_pygame()
         self._init_screen()
@@ -152,3 +167,56 @@ class GameManager():
         self.start_scene(self.startup_scene)
 
         await self._main_loop(ignore_events)
+
+    def simulate(self, time_limit_ms, *, step_ms=None, stop_condition=None,
+                 skip_idle_frames=False, render=False, on_frame=None):
+        """Run the startup scene headlessly, as fast as possible.
+
+        No window is opened, and the scene is only rendered, to an
+        offscreen surface, if `render` is True. The scene is updated from
+        a virtual clock that advances by `step_ms` (one frame at `fps` by
+        default) with no frame cap, until `time_limit_ms` of simulated time
+        have elapsed or `stop_condition` returns True.
+
+        With `skip_idle_frames`, the clock jumps straight to the next frame
+        at which the scene reports that something may change (see
+        `Scene.next_update_time`). The frame right before each jump is still
+        simulated, so that the scene sees the same previous frame time as in
+        a run that does not skip frames, and the results of both are the same.
+
+        `on_frame`, if provided, is called with the time of each frame once
+        it has been updated (and rendered), for instance to save the screen.
+
+        Returns the simulated time of the last frame, in milliseconds.
+        """
+        if step_ms is None:
+            step_ms = 1000 // self.fps
+        pygame.font.init()
+        self._init_headless_screen()
+        if self.startup_scene is None:
+            raise ValueError('Property `startup_scene` needs to be set.')
+        self._scene_manager.start_scene(self.startup_scene, 0)
+
+        last_frame_time = time_limit_ms - time_limit_ms % step_ms
+        current_time = 0
+        while True:
+            self._scene_manager.update(current_time, [])
+            if render:
+                self._scene_manager.current_scene.render()
+            profiler.end_frame()
+            if on_frame is not None:
+                on_frame(current_time)
+            if (
+                current_time >= last_frame_time
+                or (stop_condition is not None and stop_condition())
+            ):
+                return current_time
+            next_time = current_time + step_ms
+            if skip_idle_frames:
+                idle_until = self._scene_manager.next_update_time()
+                if idle_until > last_frame_time:
+                    return last_frame_time
+                if idle_until > next_time + step_ms:
+                    next_time = current_time + ceil((idle_until - current_time) / step_ms) * step_ms
+                    self._scene_manager.update(next_time - step_ms, [])
+            current_time = next_time
@@ -0,0 +1,205 @@
+"""
+Opt-in profiler of the scene graph.
+
+Once enabled, every `update` method of the game objects (scenes and scene
+objects) and every `draw` method of the drawables is wrapped to accumulate,
+per class, the number of calls and the time spent in them. The time spent
+in an object's own code (self time) is reported separately from the time
+including nested updates or draws of its children (total time).
+
+Classes are instrumented when the profiler is enabled, so it must be
+enabled after the scenes and scene objects to profile have been imported.
+
+When disabled, the methods are not wrapped and there is no overhead.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+import atexit
+import sys
+
+import pygame
+
+from engine.drawable import Drawable
+from engine.game_object import GameObject
+from ui.color import Color
+from ui.text_cache import text_cache
+
+OVERLAY_HOTKEY = 'f3'
+
+_OVERLAY_MAX_LINES = 20
+_OVERLAY_REFRESH_FRAMES = 30
+_OVERLAY_PADDING = 5
+
+@dataclass
+class ProfileStats:
+    calls: int = 0
+    total_time: float = 0
+    self_time: float = 0
+
+_INSTRUMENTED_METHODS = [
+    (GameObject, 'update'),
+    (Drawable, 'draw'),
+]
+
+@dataclass
+class _ProfilerState:
+    # pylint: disable=too-many-instance-attributes
+    enabled: bool = False
+    dump_at_exit_registered: bool = False
+    wrapped_methods: list = field(default_factory=list)
+    stats: dict[tuple[str, str], ProfileStats] = field(default_factory=dict)
+    call_stack: list = field(default_factory=list)
+    frame_count: int = 0
+    overlay_visible: bool = False
+    overlay_surface: pygame.Surface | None = None
+    overlay_frame_count: int | None = None
+    clock: Callable[[], float] = perf_counter
+
+_state = _ProfilerState()
+
+def _all_subclasses(cls):
+    subclasses = [cls]
+    for subclass in cls.__subclasses__():
+        subclasses.extend(_all_subclasses(subclass))
+    return subclasses
+
+def _instrument(method, method_name):
+    @wraps(method)
+    def instrumented(obj, *args, **kwargs):
+        call_stack = _state.call_stack
+        if call_stack and call_stack[-1][0] is obj and call_stack[-1][1] == method_name:
+            # Call to the method of a parent class: already measured.
+            return method(obj, *args, **kwargs)
+        stack_entry = [obj, method_name, 0]
+        call_stack.append(stack_entry)
+        clock = _state.clock
+        start = clock()
+        try:
+            return method(obj, *args, **kwargs)
+        finally:
+            elapsed = clock() - start
+            call_stack.pop()
+            key = (type(obj).__name__, method_name)
+            stats = _state.stats.get(key)
+            if stats is None:
+                stats = _state.stats[key] = ProfileStats()
+            stats.calls += 1
+            stats.total_time += elapsed
+            stats.self_time += elapsed - stack_entry[2]
+            if call_stack:
+                call_stack[-1][2] += elapsed
+    return instrumented
+
+def is_enabled():
+    return _state.enabled
+
+def enable(dump_at_exit=False, clock=perf_counter):
+    """Instrument the classes of the scene graph and start profiling.
+
+    If `dump_at_exit` is True, the collected stats are printed to stderr
+    when the program exits. `clock` returns the current time in seconds.
+    """
+    _state.clock = clock
+    if dump_at_exit and not _state.dump_at_exit_registered:
+        atexit.register(dump)
+        _state.dump_at_exit_registered = True
+    if _state.enabled:
+        return
+    for base_class, method_name in _INSTRUMENTED_METHODS:
+        for cls in _all_subclasses(base_class):
+            method = cls.__dict__.get(method_name)
+            if method is None or getattr(method, '__isabstractmethod__', False):
+                continue
+            _state.wrapped_methods.append((cls, method_name, method))
+            setattr(cls, method_name, _instrument(method, method_name))
+    _state.enabled = True
+
+def disable():
+    """Restore the original methods. Collected stats are kept until reset()."""
+    for cls, method_name, method in _state.wrapped_methods:
+        setattr(cls, method_name, method)
+    _state.wrapped_methods.clear()
+    _state.call_stack.clear()
+    _state.overlay_visible = False
+    _state.enabled = False
+
+def reset():
+    _state.stats.clear()
+    _state.frame_count = 0
+
+def end_frame():
+    """Called by the game manager after each frame, to report stats per frame."""
+    if _state.enabled:
+        _state.frame_count += 1
+
+def get_stats():
+    """Return the collected stats, keyed by (class name, method name),
+    sorted by decreasing self time."""
+    return dict(sorted(_state.stats.items(), key=lambda item: item[1].self_time, reverse=True))
+
+def format_stats(max_lines=None):
+    frame_count = max(_state.frame_count, 1)
+    header = ['class', 'method', 'calls/frame', 'self ms/frame', 'total ms/frame']
+    lines = [
+        [
+            class_name,
+            method_name,
+            f"{stats.calls / frame_count:.1f}",
+            f"{stats.self_time * 1000 / frame_count:.3f}",
+            f"{stats.total_time * 1000 / frame_count:.3f}",
+        ]
+        for (class_name, method_name), stats in list(get_stats().items())[:max_lines]
+    ]
+    widths = [max(len(line[i]) for line in [header] + lines) for i in range(len(header))]
+    return '\n'.join(
+        '  '.join(
+            cell.ljust(width) if i < 2 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(line, widths))
+        )
+        for line in [header] + lines
+    )
+
+def dump(file=None):
+    """Print the collected stats."""
+    if file is None:
+        file = sys.stderr
+    print(f"Scene graph profile over {_state.frame_count} frames:", file=file)
+    print(format_stats(), file=file)
+    print(f"Text cache: {text_cache.hits} hits, {text_cache.misses} misses", file=file)
+
+def is_overlay_visible():
+    return _state.overlay_visible
+
+def toggle_overlay():
+    _state.overlay_visible = _state.enabled and not _state.overlay_visible
+    _state.overlay_frame_count = None
+
+def draw_overlay(surface):
+    """Draw the stats of the most expensive classes on top of the surface.
+
+    The overlay is refreshed every few frames only, to limit its own cost.
+    """
+    if (
+        _state.overlay_frame_count is None
+        or _state.frame_count - _state.overlay_frame_count >= _OVERLAY_REFRESH_FRAMES
+    ):
+        from ui.fonts import FONT_SECONDARY_XSMALL # pylint: disable=import-outside-toplevel
+        text_lines = format_stats(_OVERLAY_MAX_LINES).splitlines()
+        line_surfaces = [
+            FONT_SECONDARY_XSMALL.render(line, True, Color.WHITE)
+            for line in text_lines
+        ]
+        line_height = FONT_SECONDARY_XSMALL.get_linesize()
+        overlay_surface = pygame.Surface((
+            max(line.get_width() for line in line_surfaces) + 2 * _OVERLAY_PADDING,
+            line_height * len(line_surfaces) + 2 * _OVERLAY_PADDING
+        ), pygame.SRCALPHA)
+        overlay_surface.fill((*Color.BLACK, 200))
+        for i, line in enumerate(line_surfaces):
+            overlay_surface.blit(line, (_OVERLAY_PADDING, _OVERLAY_PADDING + i * line_height))
+        _state.overlay_surface = overlay_surface
+        _state.overlay_frame_count = _state.frame_count
+    surface.blit(_state.overlay_surface, (0, 0))
@@ -1,15 +1,95 @@
 """
 Wraps the `random` module to allow injection of a mock while testing.
+
+Random numbers are drawn from separate named streams, one per source of
+randomness in the game. Once seeded, each stream produces the same sequence
+whatever is drawn from the other streams, so that the actions of the player
+(or of an automated script) on one part of the game do not alter the random
+outcomes of the other parts.
+
+Each stage has its own `RandomStreams`, passed to its game objects, so that
+stages that run side by side in the same process do not draw from each
+other's streams. The module-level functions act on default streams, used by
+game objects created without any.
 """
 
+from enum import Enum
 import random
 
+RandomStream = Enum('RandomStream', [
+    'DEFAULT',
+    'PROCESS_SPAWN',
+    'PROCESS_TYPE',
+    'IO',
+    'PAGES',
+    'TERMINATION',
+])
+
 # pylint: disable=too-few-public-methods
 class Random():
+    def __init__(self, seed_value=None):
+        self._generator = random.Random(seed_value)
+
+    def seed(self, value):
+        self._generator.seed(value)
+
+    def get_state(self):
+        return self._generator.getstate() # pylint: disable=no-member
+
+    def set_state(self, state):
+        self._generator.setstate(state) # pylint: disable=no-member
+
     def get_number(self, min_value, max_value):
-        return random.randint(min_value, max_value)
+        return self._generator.randint(min_value, max_value) # pylint: disable=no-member
+
+def _stream_seed(seed_value, stream: RandomStream):
+    if seed_value is None:
+        return None
+    return f'{seed_value}:{stream.name}'
+
+class RandomStreams():
+    """One random number generator per `RandomStream`.
+
+    If `seed_value` is None, the streams are seeded from the current system
+    time or another source of randomness, as with `random.seed`.
+    """
+
+    def __init__(self, seed_value=None):
+        self._streams = {stream: Random(_stream_seed(seed_value, stream)) for stream in RandomStream}
+
+    def randint(self, min_value, max_value, stream: RandomStream = RandomStream.DEFAULT):
+        return self._streams[stream].get_number(min_value, max_value)
+
+    def seed(self, value=None):
+        """Seed every random stream, to make a run reproducible.
+
+        Each stream is seeded differently, but deterministically, from `value`.
+        """
+        for stream, generator in self._streams.items():
+            generator.seed(_stream_seed(value, stream))
+
+    def get_state(self):
+        """Return the state of every random stream, to resume drawing from it later."""
+        return {stream: generator.get_state() for stream, generator in self._streams.items()}
+
+    def set_state(self, state):
+        """Restore the random streams to a state returned by `get_state`."""
+        for stream, generator in self._streams.items():
+            generator.set_state(state[stream])
+
+_default_streams = RandomStreams()
+
+def get_default_streams() -> RandomStreams:
+    return _default_streams
+
+def randint(min_value, max_value, stream: RandomStream = RandomStream.DEFAULT):
+    return _default_streams.randint(min_value, max_value, stream)
+
+def seed(value=None):
+    _default_streams.seed(value)
 
-_random = Random()
+def get_state():
+    return _default_streams.get_state()
 
-def randint(min_value, max_value):
-    return _random.get_number(min_value, max_value)
+def set_state(state):
+    _default_streams.set_state(state)
@@ -2,13 +2,33 @@ from abc import abstractmethod
 from typing import Optional
 import pygame
 
+from engine import profiler
 from engine.game_object import GameObject
 from engine.modal import Modal
 from ui.color import Color
 
 
+# Above this fraction of the screen area, redrawing the dirty rects
+# costs about as much as redrawing the whole screen.
+_MAX_DIRTY_AREA_RATIO = 0.5
+
+def _merge_rects(rects: list[pygame.Rect]) -> list[pygame.Rect]:
+    """Merge overlapping rects, so that no area is redrawn twice."""
+    merged = []
+    for rect in rects:
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect = rect.union(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
 class Scene(GameObject):
     background_color = Color.BLACK
+    # If True, only the areas of the drawables whose bounds or visual state
+    # changed since the last frame are redrawn and pushed to the display.
+    dirty_rect_rendering = True
 
     def __init__(self, scene_id: str):
         super().__init__()
@@ -17,6 +37,9 @@ class Scene(GameObject):
         self._scene_objects = []
         self._modal = None
         self._scene_manager = None
+        self._drawn_views = None
+        self._drawn_surface = None
+        self._overlay_drawn = False
 
     @property
     def scene_manager(self):
@@ -53,6 +76,7 @@ class Scene(GameObject):
         """
         self.close_modal()
         self.setup()
+        self.invalidate()
         if self.scene_manager is not None:
             self.scene_manager.reset_current_context_time()
 
@@ -63,6 +87,15 @@ class Scene(GameObject):
         Called every frame with the current time and a list of events.
         """
 
+    def next_update_time(self, current_time):
+        """Return the earliest time after `current_time` at which an update may change the scene.
+
+        Used to skip idle frames when the scene is simulated headlessly: updates
+        before the returned time must not change the state of the scene. The default
+        implementation returns `current_time`, meaning that no frame can be skipped.
+        """
+        return current_time
+
     def show_modal(self, modal : Modal):
         """Show a modal on top of the scene. Only one modal can be active at a time."""
         if self._modal is not None:
@@ -93,10 +126,80 @@ class Scene(GameObject):
         modal.scene = None
         self._modal = None
 
-    def render(self):
-        self.screen.fill(self.background_color)
+    def invalidate(self):
+        """Redraw the whole screen on the next render, for instance when something
+        else was drawn on it in the meantime."""
+        self._drawn_views = None
+
+    def _get_dirty_rects(self, drawn_views):
+        dirty_rects = []
+        for view, (bounds, visual_state) in drawn_views.items():
+            previous = self._drawn_views.get(view)
+            if previous is None:
+                dirty_rects.append(bounds)
+            elif visual_state is None or previous != (bounds, visual_state):
+                dirty_rects.append(bounds)
+                if previous[0] != bounds:
+                    dirty_rects.append(previous[0])
+        for view, (bounds, _) in self._drawn_views.items():
+            if view not in drawn_views:
+                dirty_rects.append(bounds)
+        screen_rect = self.screen.get_rect()
+        return _merge_rects([
+            rect.clip(screen_rect) for rect in dirty_rects
+            if rect.colliderect(screen_rect)
+        ])
 
-        for scene_object in list(self._scene_objects):
-            scene_object.render(self.screen)
+    def render(self):
+        """Draw the scene objects to the screen, and update the display.
 
-        pygame.display.flip()
+        With `dirty_rect_rendering`, only the areas that changed since the
+        last frame are redrawn, which requires the views to report their
+        visual state and to draw within their bounds (see `Drawable`).
+        """
+        screen = self.screen
+        views = []
+        for scene_object in self._scene_objects:
+            scene_object.collect_views(views)
+        drawn_views = {view: (view.bounds, view.visual_state) for view in views}
+
+        overlay_visible = profiler.is_overlay_visible()
+        dirty_rects = None
+        if (
+            self.dirty_rect_rendering
+            and self._drawn_views is not None
+            and self._drawn_surface is screen
+            and not overlay_visible
+            and not self._overlay_drawn
+        ):
+            dirty_rects = self._get_dirty_rects(drawn_views)
+            dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+            if dirty_area > _MAX_DIRTY_AREA_RATIO * screen.get_width() * screen.get_height():
+                dirty_rects = None
+
+        if dirty_rects is None:
+            screen.fill(self.background_color)
+            for view in views:
+                view.draw(screen)
+        else:
+            view_bounds = [drawn_views[view][0] for view in views]
+            for rect in dirty_rects:
+                screen.set_clip(rect)
+                screen.fill(self.background_color, rect)
+                for index in rect.collidelistall(view_bounds):
+                    views[index].draw(screen)
+            screen.set_clip(None)
+
+        self._drawn_views = drawn_views
+        self._drawn_surface = screen
+
+        self._overlay_drawn = overlay_visible
+        if overlay_visible:
+            profiler.draw_overlay(screen)
+
+        # Headless simulations render to an offscreen surface.
+        if screen is pygame.display.get_surface():
+            if dirty_rects is None:
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
@@ -60,6 +60,17 @@ class SceneManager():
             active_context = self._context_stack[-1].context
             active_context.update(local_time, [])
 
+    def next_update_time(self) -> float:
+        """Return the earliest global time at which an update may change the active context.
+
+        Only the root scene can tell when it is idle; while a modal is active,
+        the current global time is returned, meaning that no frame can be skipped.
+        """
+        if not self._context_stack or self._context_stack[-1].context != self._current_scene:
+            return self._global_time
+        local_time = self._get_local_time()
+        return self._global_time + self._current_scene.next_update_time(local_time) - local_time
+
     def _get_local_time(self) -> int:
         entry = self._context_stack[-1]
         return self._global_time - entry.start_time - entry.paused_time
@@ -34,6 +34,13 @@ class SceneObject(GameObject):
         for child in self._children:
             child.update(current_time, events)
 
+    def collect_views(self, views: list):
+        """Append the views that render() draws to `views`, in drawing order."""
+        if self.visible:
+            views.append(self._view)
+            for child in self._children:
+                child.collect_views(views)
+
     def render(self, surface):
         if self.visible:
             self._view.draw(surface)
@@ -0,0 +1,93 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable
+
+import pygame
+
+from engine.drawable import Drawable
+
+@dataclass
+class _Entry:
+    drawable: Drawable
+    listener: Callable[[Drawable], None]
+    order: int
+    rect: pygame.Rect = None
+    cells: tuple = ()
+
+class SpatialHash:
+    """Index of drawables by position, to find the ones under the mouse pointer
+    without testing every one of them.
+
+    The plane is divided into square cells, and each item is registered in the
+    cells that the area of its drawable overlaps. Items are kept up to date
+    when their drawable moves.
+    """
+
+    def __init__(self, cell_size=64):
+        self._cell_size = cell_size
+        self._cells = defaultdict(dict)
+        self._entries = {}
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, item):
+        return item in self._entries
+
+    def add(self, item, drawable):
+        """Index `item` at the area covered by `drawable`, and follow its moves."""
+        if item in self._entries:
+            self.remove(item)
+        listener = partial(self._move, item)
+        drawable.add_move_listener(listener)
+        self._entries[item] = _Entry(drawable, listener, self._next_order)
+        self._next_order += 1
+        self._move(item, drawable)
+
+    def remove(self, item):
+        entry = self._entries.pop(item, None)
+        if entry is None:
+            return
+        entry.drawable.remove_move_listener(entry.listener)
+        self._remove_from_cells(item, entry.cells)
+
+    def items_at(self, x, y):
+        """Items whose drawable collides with the point, in the order they were added."""
+        cell = self._cells.get((int(x // self._cell_size), int(y // self._cell_size)))
+        if not cell:
+            return []
+        items = [item for item in cell if self._entries[item].rect.collidepoint(x, y)]
+        if len(items) > 1:
+            items.sort(key=lambda item: self._entries[item].order)
+        return items
+
+    def _cells_of(self, rect):
+        first_column = rect.left // self._cell_size
+        last_column = (rect.right - 1) // self._cell_size
+        first_row = rect.top // self._cell_size
+        last_row = (rect.bottom - 1) // self._cell_size
+        return tuple(
+            (column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        )
+
+    def _remove_from_cells(self, item, cells):
+        for cell in cells:
+            self._cells[cell].pop(item, None)
+            if not self._cells[cell]:
+                del self._cells[cell]
+
+    def _move(self, item, drawable):
+        entry = self._entries[item]
+        # Same area as Drawable.collides.
+        rect = pygame.Rect(drawable.x, drawable.y, drawable.width, drawable.height)
+        cells = self._cells_of(rect)
+        if cells != entry.cells:
+            self._remove_from_cells(item, entry.cells)
+            for cell in cells:
+                self._cells[cell][item] = None
+            entry.cells = cells
+        entry.rect = rect
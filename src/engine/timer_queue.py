@@ -0,0 +1,68 @@
+import heapq
+from math import inf
+
+_MIN_HEAP_SIZE_TO_COMPACT = 64
+
+class TimerQueue:
+    """Deadlines of keys, such as the next periodic update of game objects,
+    so that only the keys whose deadline has passed need to be woken.
+
+    Each key has at most one pending deadline. Timers are kept in a heap;
+    rescheduled and cancelled timers stay in it until they reach the top,
+    or until they outnumber the pending ones.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._timers = {}
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __contains__(self, key):
+        return key in self._timers
+
+    def deadline_of(self, key):
+        timer = self._timers.get(key)
+        return inf if timer is None else timer[0]
+
+    @property
+    def next_deadline(self):
+        """Earliest pending deadline, or inf if there is none."""
+        while self._heap and self._timers.get(self._heap[0][2]) is not self._heap[0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else inf
+
+    def schedule(self, key, deadline):
+        """Set the deadline of `key`, replacing the previous one. A deadline of inf
+        cancels the timer."""
+        if deadline == inf:
+            self.cancel(key)
+            return
+        timer = self._timers.get(key)
+        if timer is not None and timer[0] == deadline:
+            return
+        # The order breaks ties between equal deadlines, so keys are never compared.
+        timer = (deadline, self._next_order, key)
+        self._next_order += 1
+        self._timers[key] = timer
+        heapq.heappush(self._heap, timer)
+        if len(self._heap) > max(_MIN_HEAP_SIZE_TO_COMPACT, 2 * len(self._timers)):
+            self._heap = list(self._timers.values())
+            heapq.heapify(self._heap)
+
+    def cancel(self, key):
+        self._timers.pop(key, None)
+
+    def pop_due(self, current_time):
+        """Remove the timers whose deadline is at or before `current_time`,
+        and return their keys by deadline, then in the order they were scheduled."""
+        due = []
+        while self._heap and self._heap[0][0] <= current_time:
+            timer = heapq.heappop(self._heap)
+            key = timer[2]
+            if self._timers.get(key) is timer:
+                del self._timers[key]
+                due.append(key)
+        return due
@@ -0,0 +1,279 @@
+"""EventRecorder
+
+Records the game events of a stage and the actions returned by its
+automation script to a binary file, for post-mortems of long runs.
+
+The file starts with a header and optional JSON metadata about the run,
+followed by fixed-width little-endian records:
+
+    time   uint32  time of the frame, in milliseconds
+    code   uint16  value of the EventType of an event, or action code
+    a-d    int32   values of the event, in the order of its fields
+
+Values that an event does not have are 0, booleans are 0 or 1, and an
+infinite time (such as the time to termination of a running process) is -1.
+Actions are recorded as ACTION_IO_QUEUE, ACTION_PROCESS (pid, to_e_core)
+and ACTION_PAGE (pid, idx). An END record (score) closes a complete run.
+
+Events that the game monitor dropped because its buffer was full are not in
+the file. A DROPPED record (number of events) stands where they were lost,
+and the header of the file is then flagged as lossy.
+
+Records are written in chunks. `EventLogReader` maps the file in memory and
+reads records where they are, either one at a time or, if NumPy is installed,
+as a structured array.
+"""
+
+from math import inf
+import json
+import mmap
+import struct
+
+from game_monitor import EventType, GameMonitor, MonitorEvent
+
+ACTION_IO_QUEUE = 128
+ACTION_PROCESS = 129
+ACTION_PAGE = 130
+END = 131
+DROPPED = 132
+
+_ACTION_CODES = {
+    'io_queue': ACTION_IO_QUEUE,
+    'process': ACTION_PROCESS,
+    'page': ACTION_PAGE,
+}
+
+_MAGIC = b'YTOSEVTS'
+_VERSION = 4
+_HEADER = struct.Struct('<8sIIII')
+_RECORD = struct.Struct('<IHxxiiii')
+
+HEADER_SIZE = _HEADER.size
+RECORD_SIZE = _RECORD.size
+
+_DEFAULT_CHUNK_RECORDS = 4096
+_INFINITE = -1
+_ALIGNMENT = 8
+_LOSSY = 1
+
+_BOOLEAN_FIELDS = {'swap', 'use', 'waiting', 'cpu', 'waiting_for_io', 'waiting_for_page'}
+
+def _encode(value):
+    if value is None:
+        return 0
+    if value == inf:
+        return _INFINITE
+    return int(value)
+
+def _decode_event(code, values):
+    event = MonitorEvent(EventType(code), values)
+    for name in event.__slots__[1:]:
+        if not hasattr(event, name):
+            continue
+        value = getattr(event, name)
+        if name in _BOOLEAN_FIELDS:
+            setattr(event, name, bool(value))
+        elif value == _INFINITE:
+            setattr(event, name, inf)
+    return event
+
+def _decode_action(code, a, b):
+    if code == ACTION_IO_QUEUE:
+        return {'type': 'io_queue'}
+    if code == ACTION_PROCESS:
+        return {'type': 'process', 'pid': a, 'to_e_core': bool(b)}
+    return {'type': 'page', 'pid': a, 'idx': b}
+
+class EventRecorder:
+    """Writes events and actions to a file, in chunks of `chunk_records` records.
+
+    `metadata` is a JSON-serializable dict describing the run, such as
+    the seed and the stage it was played on.
+    """
+
+    def __init__(self, filename, chunk_records=_DEFAULT_CHUNK_RECORDS, *, metadata=None):
+        metadata_bytes = b''
+        if metadata is not None:
+            metadata_bytes = json.dumps(metadata).encode('utf_8')
+            metadata_bytes += b' ' * (-len(metadata_bytes) % _ALIGNMENT)
+        self._file = open(filename, 'wb') # pylint: disable=consider-using-with
+        self._metadata_size = len(metadata_bytes)
+        self._flags = 0
+        self._write_header()
+        self._file.write(metadata_bytes)
+        self._chunk = bytearray(chunk_records * RECORD_SIZE)
+        self._chunk_records = chunk_records
+        self._pending_count = 0
+        self._record_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _write_header(self):
+        self._file.write(
+            _HEADER.pack(_MAGIC, _VERSION, RECORD_SIZE, self._metadata_size, self._flags))
+
+    @property
+    def record_count(self):
+        return self._record_count
+
+    @property
+    def lossy(self):
+        """True if game events were dropped before they could be recorded."""
+        return bool(self._flags & _LOSSY)
+
+    def record(self, time, code, a=0, b=0, c=0, d=0):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        _RECORD.pack_into(self._chunk, self._pending_count * RECORD_SIZE, time, code, a, b, c, d)
+        self._pending_count += 1
+        self._record_count += 1
+        if self._pending_count == self._chunk_records:
+            self.flush()
+
+    def record_events(self, time, monitor: GameMonitor):
+        """Record the pending events of `monitor`, before they are cleared.
+
+        If the monitor dropped events, a DROPPED record precedes them.
+        """
+        dropped_event_count = monitor.dropped_event_count
+        if dropped_event_count > 0:
+            self.record(time, DROPPED, dropped_event_count)
+            self._flags |= _LOSSY
+        for code, a, b, c, d in monitor.get_raw_events():
+            self.record(time, code, _encode(a), _encode(b), _encode(c), _encode(d))
+
+    def record_action(self, time, action):
+        """Record an action returned by the automation script.
+        Actions of an unknown type are ignored, as they are by the stage."""
+        code = _ACTION_CODES.get(action['type'])
+        if code == ACTION_IO_QUEUE:
+            self.record(time, code)
+        elif code == ACTION_PROCESS:
+            self.record(time, code, action['pid'], int(action.get('to_e_core', False)))
+        elif code == ACTION_PAGE:
+            self.record(time, code, action['pid'], action['idx'])
+
+    def record_end(self, time, score):
+        """Record the end of the run, with its final score."""
+        self.record(time, END, score)
+
+    def flush(self):
+        self._file.write(memoryview(self._chunk)[:self._pending_count * RECORD_SIZE])
+        self._pending_count = 0
+        self._file.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        if self._flags:
+            self._file.seek(0)
+            self._write_header()
+        self._file.close()
+
+class EventLogReader:
+    """Reads a file written by EventRecorder without loading it in memory.
+
+    Records are (time, code, a, b, c, d) tuples.
+    """
+
+    def __init__(self, filename):
+        with open(filename, 'rb') as in_file:
+            self._mmap = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER_SIZE:
+            self._mmap.close()
+            raise ValueError(f'{filename} is not an event log')
+        magic, version, record_size, metadata_size, flags = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC or version != _VERSION or record_size != RECORD_SIZE:
+            self._mmap.close()
+            raise ValueError(f'{filename} is not an event log of version {_VERSION}')
+        self._flags = flags
+        self._metadata = {}
+        if metadata_size > 0:
+            self._metadata = json.loads(self._mmap[HEADER_SIZE:HEADER_SIZE + metadata_size])
+        self._offset = HEADER_SIZE + metadata_size
+        self._length = (len(self._mmap) - self._offset) // RECORD_SIZE
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def metadata(self):
+        return self._metadata
+
+    @property
+    def lossy(self):
+        """True if game events were dropped before they could be recorded.
+        The number of events lost is in the DROPPED records."""
+        return bool(self._flags & _LOSSY)
+
+    @property
+    def end(self):
+        """(time, score) of the END record, or None if the run was not completed."""
+        if self._length == 0:
+            return None
+        time, code, score, _, _, _ = self[-1]
+        return (time, score) if code == END else None
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('record index out of range')
+        return _RECORD.unpack_from(self._mmap, self._offset + index * RECORD_SIZE)
+
+    def __iter__(self):
+        end_offset = self._offset + self._length * RECORD_SIZE
+        for offset in range(self._offset, end_offset, RECORD_SIZE):
+            yield _RECORD.unpack_from(self._mmap, offset)
+
+    def events(self):
+        """Iterate over the recorded events as (time, MonitorEvent) tuples."""
+        for time, code, a, b, c, d in self:
+            if code < ACTION_IO_QUEUE:
+                yield time, _decode_event(code, (a, b, c, d))
+
+    def actions(self):
+        """Iterate over the recorded actions as (time, action) tuples, with actions
+        in the format returned by the automation script."""
+        for time, code, a, b, _, _ in self:
+            if ACTION_IO_QUEUE <= code <= ACTION_PAGE:
+                yield time, _decode_action(code, a, b)
+
+    def to_numpy(self):
+        """Return the records as a NumPy structured array with fields time, code
+        and a to d. The array is a view of the mapped file rather than a copy.
+        It stays valid after the reader is closed: the file is then unmapped once
+        the array, and any view of it, is no longer referenced.
+
+        Requires NumPy, which is only a development dependency: the game itself
+        does not need it.
+        """
+        import numpy # pylint: disable=import-outside-toplevel,import-error
+        dtype = numpy.dtype({
+            'names': ['time', 'code', 'a', 'b', 'c', 'd'],
+            'formats': ['<u4', '<u2', '<i4', '<i4', '<i4', '<i4'],
+            'offsets': [0, 4, 8, 12, 16, 20],
+            'itemsize': RECORD_SIZE,
+        })
+        return numpy.frombuffer(self._mmap, dtype=dtype, count=self._length, offset=self._offset)
+
+    def close(self):
+        if self._mmap is None:
+            return
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Arrays returned by to_numpy still use the mapping, which is closed
+            # when the last of them is garbage collected.
+            pass
+        self._mmap = None
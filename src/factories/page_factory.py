@@ -4,9 +4,11 @@ from scene_objects.views.page_view import PageView
 from scene_objects.views.priority_page_view import PriorityPageView
 
 class PageFactory: # pylint: disable=too-few-public-methods
-    def __init__(self, stage: 'Stage', stage_config: 'StageConfig'):
+    def __init__(self, stage: 'Stage', stage_config: 'StageConfig', page_manager: 'PageManager'):
         self._stage = stage
         self._stage_config = stage_config
+        self._page_manager = page_manager
+        self._monitor = stage.game_monitor
         self._page_config = PageConfig(
             swap_delay_ms=stage_config.swap_delay_ms,
             parallel_swaps=stage_config.parallel_swaps
@@ -16,7 +18,8 @@ class PageFactory: # pylint: disable=too-few-public-methods
         return Page(
             pid=pid,
             idx=idx,
-            page_manager=self._stage.page_manager,
+            page_manager=self._page_manager,
             config=self._page_config,
-            view_class=PriorityPageView if is_priority else PageView
+            view_class=PriorityPageView if is_priority else PageView,
+            monitor=self._monitor
         )
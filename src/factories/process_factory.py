@@ -1,12 +1,14 @@
 from config.process_config import ProcessConfig
 from scene_objects.process import Process, ProcessType
 from scene_objects.views.priority_process_view import PriorityProcessView
-from engine.random import randint
+from engine.random import RandomStream
 
 class ProcessFactory:
     def __init__(self, stage: 'Stage', stage_config: 'StageConfig'):
         self._stage = stage
         self._stage_config = stage_config
+        self._monitor = stage.game_monitor
+        self._random_streams = stage.random_streams
 
         self._standard_process_config = ProcessConfig(
             io_probability=self._stage_config.io_probability,
@@ -28,7 +30,9 @@ class ProcessFactory:
             self._stage,
             self._standard_process_config,
             process_type=ProcessType.STANDARD,
-            current_time=current_time
+            current_time=current_time,
+            monitor=self._monitor,
+            random_streams=self._random_streams
         )
 
     def create_priority_process(self, pid: int, current_time: int = 0):
@@ -38,10 +42,15 @@ class ProcessFactory:
             self._priority_process_config,
             process_type=ProcessType.PRIORITY,
             view_class=PriorityProcessView,
-            current_time=current_time
+            current_time=current_time,
+            monitor=self._monitor,
+            random_streams=self._random_streams
         )
 
     def create_random_process(self, pid: int, current_time: int = 0):
-        if randint(1, 100) <= int(self._stage_config.priority_process_probability * 100):
+        if (
+            self._random_streams.randint(1, 100, RandomStream.PROCESS_TYPE)
+            <= int(self._stage_config.priority_process_probability * 100)
+        ):
             return self.create_priority_process(pid, current_time=current_time)
         return self.create_standard_process(pid, current_time=current_time)
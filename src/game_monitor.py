@@ -2,10 +2,22 @@
 
 The game monitor is used to gather events from game objects
 and dispatch them to the automation script.
+
+Each stage has its own `GameMonitor`, passed to its game objects. The
+module-level functions act on a default monitor, used by game objects
+created without one.
+
+Events are only recorded while a consumer is attached (see `set_enabled`),
+otherwise the notify methods return right away. Recorded events are kept
+in a fixed-capacity ring buffer of compact records, the value of an event
+type and up to four values stored in columns that grow up to the capacity
+and are then reused, so that recording an event does not allocate once the
+columns have grown. When the buffer is full, the oldest events are
+overwritten and counted as dropped. `get_events` turns the pending records
+into event objects for the consumer.
 """
 
 from enum import Enum
-from types import SimpleNamespace
 
 EventType = Enum('_et', [
     'IO_QUEUE',
@@ -27,108 +39,287 @@ EventType = Enum('_et', [
     'PROC_END'
 ])
 
+DEFAULT_CAPACITY = 65536
+
+# Names of the values recorded for each type of event, in order.
+_FIELDS = {
+    EventType.IO_QUEUE: ('io_count',),
+    EventType.PAGE_NEW: ('pid', 'idx', 'swap', 'use'),
+    EventType.PAGE_USE: ('pid', 'idx', 'use'),
+    EventType.PAGE_SWAP_QUEUE: ('pid', 'idx', 'waiting'),
+    EventType.PAGE_SWAP_START: ('pid', 'idx'),
+    EventType.PAGE_SWAP: ('pid', 'idx', 'swap'),
+    EventType.PAGE_FREE: ('pid', 'idx'),
+    EventType.PROC_NEW: ('pid',),
+    EventType.PROC_CPU: ('pid', 'cpu'),
+    EventType.PROC_STARV: ('pid', 'starvation_level', 'time_to_termination', 'deadline'),
+    EventType.PROC_WAIT_IO: ('pid', 'waiting_for_io'),
+    EventType.PROC_WAIT_PAGE: ('pid', 'waiting_for_page'),
+    EventType.PROC_TERM: ('pid',),
+    EventType.PROC_KILL: ('pid',),
+    EventType.PROC_END: ('pid',),
+}
+
+# Event types by value, as stored in the ring buffer.
+_EVENT_TYPES = (None, *EventType)
+
+_MAX_FIELDS = 4
+
+class MonitorEvent: # pylint: disable=too-few-public-methods
+    """Event passed to the automation script.
 
-_events = []
+    `etype` is the name of the event type and `code` its value, and the
+    values of the event are attributes named after the fields of its type.
+    """
 
-def _add_event(typ, data):
-    _events.append(
-        SimpleNamespace(etype=typ.name, **data)
+    __slots__ = (
+        'etype', 'code', 'pid', 'idx', 'io_count', 'swap', 'use', 'waiting', 'cpu',
+        'starvation_level', 'time_to_termination', 'deadline',
+        'waiting_for_io', 'waiting_for_page',
     )
 
+    def __init__(self, event_type: EventType, values):
+        self.etype = event_type.name
+        self.code = event_type.value
+        for name, value in zip(_FIELDS[event_type], values):
+            setattr(self, name, value)
+
+    def __repr__(self):
+        values = ', '.join(
+            f'{name}={getattr(self, name)!r}'
+            for name in self.__slots__ if hasattr(self, name)
+        )
+        return f'MonitorEvent({values})'
+
+class EventRingBuffer:
+    """Fixed-capacity buffer of event records, oldest first.
+
+    Event types are stored as their integer value.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._capacity = capacity
+        self._codes = []
+        self._columns = tuple([] for _ in range(_MAX_FIELDS))
+        self._start = 0
+        self._length = 0
+        self._dropped_count = 0
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def dropped_count(self):
+        """Number of events overwritten before being read since the last clear."""
+        return self._dropped_count
+
+    def append(self, event_type: EventType, a=None, b=None, c=None, d=None):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        if self._length == self._capacity:
+            index = self._start
+            self._start = (self._start + 1) % self._capacity
+            self._dropped_count += 1
+        else:
+            index = (self._start + self._length) % self._capacity
+            self._length += 1
+        columns = self._columns
+        if index == len(self._codes):
+            self._codes.append(event_type.value)
+            columns[0].append(a)
+            columns[1].append(b)
+            columns[2].append(c)
+            columns[3].append(d)
+            return
+        self._codes[index] = event_type.value
+        columns[0][index] = a
+        columns[1][index] = b
+        columns[2][index] = c
+        columns[3][index] = d
+
+    def __iter__(self):
+        """Iterate over the records as (event code, a, b, c, d) tuples."""
+        a, b, c, d = self._columns
+        for i in range(self._length):
+            index = (self._start + i) % self._capacity
+            yield self._codes[index], a[index], b[index], c[index], d[index]
+
+    def records(self) -> list[MonitorEvent]:
+        return [MonitorEvent(_EVENT_TYPES[record[0]], record[1:]) for record in self]
+
+    def clear(self):
+        self._start = 0
+        self._length = 0
+        self._dropped_count = 0
+
+class GameMonitor:
+    """Events of the game objects of a stage, for its automation script.
+
+    Each stage owns a monitor and passes it to its game objects, so that
+    several stages can run side by side without mixing their events.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self._enabled = False
+        self._events = EventRingBuffer(capacity)
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    def set_enabled(self, enabled: bool):
+        """Start or stop recording events, when a consumer attaches or detaches."""
+        self._enabled = enabled
+
+    def notify_io_event_count(self, count):
+        if self._enabled:
+            self._events.append(EventType.IO_QUEUE, count)
+
+    def notify_page_swap_queue(self, pid, idx, waiting):
+        if self._enabled:
+            self._events.append(EventType.PAGE_SWAP_QUEUE, pid, idx, waiting)
+
+    def notify_page_swap_start(self, pid, idx):
+        if self._enabled:
+            self._events.append(EventType.PAGE_SWAP_START, pid, idx)
+
+    def notify_page_swap(self, pid, idx, swap):
+        if self._enabled:
+            self._events.append(EventType.PAGE_SWAP, pid, idx, swap)
+
+    def notify_page_new(self, pid, idx, swap, use):
+        if self._enabled:
+            self._events.append(EventType.PAGE_NEW, pid, idx, swap, use)
+
+    def notify_page_use(self, pid, idx, use):
+        if self._enabled:
+            self._events.append(EventType.PAGE_USE, pid, idx, use)
+
+    def notify_page_free(self, pid, idx):
+        if self._enabled:
+            self._events.append(EventType.PAGE_FREE, pid, idx)
+
+    def notify_process_wait_page(self, pid, value):
+        if self._enabled:
+            self._events.append(EventType.PROC_WAIT_PAGE, pid, value)
+
+    def notify_process_wait_io(self, pid, value):
+        if self._enabled:
+            self._events.append(EventType.PROC_WAIT_IO, pid, value)
+
+    def notify_process_terminated(self, pid):
+        if self._enabled:
+            self._events.append(EventType.PROC_TERM, pid)
+
+    def notify_process_killed(self, pid):
+        if self._enabled:
+            self._events.append(EventType.PROC_KILL, pid)
+
+    def notify_process_starvation(self, pid, level, time_to_termination, deadline=None):
+        if self._enabled:
+            self._events.append(EventType.PROC_STARV, pid, level, time_to_termination, deadline)
+
+    def notify_process_new(self, pid):
+        if self._enabled:
+            self._events.append(EventType.PROC_NEW, pid)
+
+    def notify_process_cpu(self, pid, cpu):
+        if self._enabled:
+            self._events.append(EventType.PROC_CPU, pid, cpu)
+
+    def notify_process_end(self, pid):
+        if self._enabled:
+            self._events.append(EventType.PROC_END, pid)
+
+    def get_events(self) -> list[MonitorEvent]:
+        return self._events.records()
+
+    def get_raw_events(self):
+        """Iterate over the pending events as (event code, a, b, c, d) tuples,
+        without building event objects. The event code is the value of the
+        EventType of the event. Unused values are None."""
+        return iter(self._events)
+
+    def has_events(self):
+        return len(self._events) > 0
+
+    @property
+    def dropped_event_count(self):
+        """Number of events lost to overflow since the events were last cleared."""
+        return self._events.dropped_count
+
+    def clear_events(self):
+        self._events.clear()
+
+# The functions below act on a default monitor, for game objects that are
+# created without one of their own.
+_default_monitor = GameMonitor()
+
+def get_default_monitor() -> GameMonitor:
+    return _default_monitor
+
+def set_enabled(enabled: bool):
+    _default_monitor.set_enabled(enabled)
+
+def is_enabled():
+    return _default_monitor.enabled
+
 def notify_io_event_count(count):
-    _add_event(EventType.IO_QUEUE, {
-        'io_count': count
-    })
+    _default_monitor.notify_io_event_count(count)
 
 def notify_page_swap_queue(pid, idx, waiting):
-    _add_event(EventType.PAGE_SWAP_QUEUE, {
-        'pid': pid,
-        'idx': idx,
-        'waiting': waiting
-    })
+    _default_monitor.notify_page_swap_queue(pid, idx, waiting)
 
 def notify_page_swap_start(pid, idx):
-    _add_event(EventType.PAGE_SWAP_START, {
-        'pid': pid,
-        'idx': idx
-    })
+    _default_monitor.notify_page_swap_start(pid, idx)
 
 def notify_page_swap(pid, idx, swap):
-    _add_event(EventType.PAGE_SWAP, {
-        'pid': pid,
-        'idx': idx,
-        'swap': swap
-    })
+    _default_monitor.notify_page_swap(pid, idx, swap)
 
 def notify_page_new(pid, idx, swap, use):
-    _add_event(EventType.PAGE_NEW, {
-        'pid': pid,
-        'idx': idx,
-        'swap': swap,
-        'use': use
-    })
+    _default_monitor.notify_page_new(pid, idx, swap, use)
 
 def notify_page_use(pid, idx, use):
-    _add_event(EventType.PAGE_USE, {
-        'pid': pid,
-        'idx': idx,
-        'use': use
-    })
+    _default_monitor.notify_page_use(pid, idx, use)
 
 def notify_page_free(pid, idx):
-    _add_event(EventType.PAGE_FREE, {
-        'pid': pid,
-        'idx': idx
-    })
+    _default_monitor.notify_page_free(pid, idx)
 
 def notify_process_wait_page(pid, value):
-    _add_event(EventType.PROC_WAIT_PAGE, {
-        'pid': pid,
-        'waiting_for_page': value
-    })
+    _default_monitor.notify_process_wait_page(pid, value)
 
 def notify_process_wait_io(pid, value):
-    _add_event(EventType.PROC_WAIT_IO, {
-        'pid': pid,
-        'waiting_for_io': value
-    })
+    _default_monitor.notify_process_wait_io(pid, value)
 
 def notify_process_terminated(pid):
-    _add_event(EventType.PROC_TERM, {
-        'pid': pid
-    })
+    _default_monitor.notify_process_terminated(pid)
 
 def notify_process_killed(pid):
-    _add_event(EventType.PROC_KILL, {
-        'pid': pid
-    })
+    _default_monitor.notify_process_killed(pid)
 
-def notify_process_starvation(pid, level, time_to_termination):
-    _add_event(EventType.PROC_STARV, {
-        'pid' : pid,
-        'starvation_level': level,
-        'time_to_termination': time_to_termination
-    })
+def notify_process_starvation(pid, level, time_to_termination, deadline=None):
+    _default_monitor.notify_process_starvation(pid, level, time_to_termination, deadline)
 
 def notify_process_new(pid):
-    _add_event(EventType.PROC_NEW, {
-        'pid': pid
-    })
+    _default_monitor.notify_process_new(pid)
 
 def notify_process_cpu(pid, cpu):
-    _add_event(EventType.PROC_CPU, {
-        'pid': pid,
-        'cpu': cpu
-    })
+    _default_monitor.notify_process_cpu(pid, cpu)
 
 def notify_process_end(pid):
-    _add_event(EventType.PROC_END, {
-        'pid': pid
-    })
+    _default_monitor.notify_process_end(pid)
+
+def get_events() -> list[MonitorEvent]:
+    return _default_monitor.get_events()
 
+def has_events():
+    return _default_monitor.has_events()
 
-def get_events():
-    return _events
+def get_dropped_event_count():
+    return _default_monitor.dropped_event_count
 
 def clear_events():
-    _events.clear()
+    _default_monitor.clear_events()
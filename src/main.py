@@ -1,6 +1,8 @@
 import asyncio
 from os import path
+import sys
 
+from engine import profiler
 from engine.game_manager import GameManager
 from engine.window_config import WindowConfig
 from game_info import TITLE
@@ -9,6 +11,9 @@ from scenes.main_menu import MainMenu
 from window_size import WINDOW_SIZE
 
 async def main():
+    if '--profile' in sys.argv[1:]:
+        profiler.enable(dump_at_exit=True)
+
     game_manager = GameManager()
     game_manager.window_config = WindowConfig(WINDOW_SIZE, TITLE, path.join('assets', 'icon.png'))
 
@@ -0,0 +1,186 @@
+"""
+Entry point to replay a run recorded with `pipenv run auto --headless --record`.
+
+The stage is set up from the seed and the stage stored in the recording,
+and simulated headlessly as fast as possible. Instead of calling the script,
+the actions that it returned are applied at the frames at which it returned
+them. The replayed run is recorded again and checked against the recording:
+both must have the same events, actions and final score.
+
+Frames can be rendered to image files with `--render-frames`, to look at
+the game at given times of the run. To watch the whole run, and move
+through it, use `pipenv run replay-viewer` (see `replay_viewer`).
+"""
+
+from bisect import bisect_right
+from os import path
+from tempfile import TemporaryDirectory
+import argparse
+import copy
+import sys
+import time
+
+import pygame
+
+from cli_utils import from_project_root, get_stage_or_difficulty, read_recording
+from constants import ONE_SECOND
+from event_recorder import EventLogReader, EventRecorder
+from auto import create_game_manager, create_stage
+
+class ReplayScheduler: # pylint: disable=too-few-public-methods
+    """Scheduler that returns the actions of a recorded run at the times they were
+    returned, instead of deciding them.
+
+    Its `wakeup_interval_ms` always leads to the next recorded action, so that
+    idle frames in between can be skipped.
+    """
+
+    def __init__(self, stage: 'Stage', actions):
+        self._stage = stage
+        self._actions_by_time = {}
+        for action_time, action in actions:
+            self._actions_by_time.setdefault(action_time, []).append(action)
+        self._action_times = sorted(self._actions_by_time)
+        self.wakeup_interval_ms = self._interval_to_next_action(0)
+
+    def __deepcopy__(self, memo):
+        # Copies of the stage, such as the keyframes of the replay viewer,
+        # share the recorded actions, which are never modified.
+        scheduler = copy.copy(self)
+        memo[id(self)] = scheduler
+        scheduler._stage = copy.deepcopy(self._stage, memo) # pylint: disable=protected-access
+        return scheduler
+
+    def _interval_to_next_action(self, current_time):
+        index = bisect_right(self._action_times, current_time)
+        if index == len(self._action_times):
+            return None
+        return self._action_times[index] - current_time
+
+    def __call__(self, _events):
+        current_time = self._stage.last_update_time
+        self.wakeup_interval_ms = self._interval_to_next_action(current_time)
+        return self._actions_by_time.get(current_time, [])
+
+def create_replay_stage(metadata, actions):
+    """Create the stage of a recorded run, with the random streams seeded as
+    they were, and a ReplayScheduler returning the recorded actions."""
+    stage_scene = create_stage(
+        None, get_stage_or_difficulty(metadata.get('difficulty'), metadata.get('sandbox')))
+    stage_scene.seed = metadata['seed']
+    stage_scene.scheduler = ReplayScheduler(stage_scene, actions)
+    return stage_scene
+
+def _first_difference(recording, replay):
+    for index, (recorded, replayed) in enumerate(zip(recording, replay)):
+        if recorded != replayed:
+            return index, recorded, replayed
+    if len(recording) != len(replay):
+        index = min(len(recording), len(replay))
+        recorded = recording[index] if index < len(recording) else None
+        replayed = replay[index] if index < len(replay) else None
+        return index, recorded, replayed
+    return None
+
+def _create_frame_renderer(stage_scene, frame_times, step_ms, render_dir):
+    """Return a callback that saves the screen at the frames that `frame_times`
+    fall in, or None if there is no frame to render."""
+    if not frame_times:
+        return None
+    frame_times = {frame_time - frame_time % step_ms for frame_time in frame_times}
+    def render_frame(current_time):
+        if current_time in frame_times:
+            stage_scene.render()
+            pygame.image.save(
+                stage_scene.screen, path.join(render_dir, f'frame-{current_time}.png'))
+    return render_frame
+
+def replay_run(filename, replay_filename, *, render_frame_times=(), render_dir='.'):
+    """Replay the run recorded in `filename`, recording the replay to `replay_filename`.
+
+    Returns a dict summarizing the replay and how it compares to the recording.
+    """
+    # pylint: disable=too-many-locals
+    metadata, (end_time, recorded_score), actions = read_recording(filename)
+    step_ms = metadata['step_ms']
+
+    stage_scene = create_replay_stage(metadata, actions)
+    game_manager = create_game_manager(stage_scene)
+
+    render_frame = _create_frame_renderer(stage_scene, render_frame_times, step_ms, render_dir)
+
+    wall_time_start = time.perf_counter()
+    with EventRecorder(replay_filename, metadata=metadata) as recorder:
+        stage_scene.event_recorder = recorder
+        simulated_time_ms = game_manager.simulate(
+            end_time,
+            step_ms=step_ms,
+            stop_condition=lambda: stage_scene.stage_completed,
+            # Frames to render must not be skipped.
+            skip_idle_frames=render_frame is None,
+            on_frame=render_frame
+        )
+        recorder.record_end(simulated_time_ms, stage_scene.score_manager.score)
+    wall_time = time.perf_counter() - wall_time_start
+
+    with EventLogReader(filename) as recording, EventLogReader(replay_filename) as replay:
+        return {
+            'stage': stage_scene.name,
+            'recorded_score': recorded_score,
+            'score': stage_scene.score_manager.score,
+            'simulated_time_ms': simulated_time_ms,
+            'record_count': len(recording),
+            'first_difference': _first_difference(recording, replay),
+            'wall_time_s': wall_time,
+        }
+
+def _print_summary(result):
+    simulated_seconds = result['simulated_time_ms'] / ONE_SECOND
+    print(result['stage'])
+    print(f"Score: {result['score']} (recorded: {result['recorded_score']})")
+    print(f"Replayed {simulated_seconds:.1f} s in {result['wall_time_s']:.2f} s")
+    if result['first_difference'] is None:
+        print(f"The replay matches the recording ({result['record_count']} records)")
+    else:
+        index, recorded, replayed = result['first_difference']
+        print(f"The replay differs from the recording at record {index}:")
+        print(f"  recorded: {recorded}")
+        print(f"  replayed: {replayed}")
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        prog="pipenv run replay",
+        description="Replay a run recorded with auto --headless --record, "
+            "and check that it matches the recording"
+    )
+    parser.add_argument('filename',
+        help="file the run was recorded to")
+    parser.add_argument('--output', metavar='FILE',
+        help="file to record the replay to (default: a temporary file)")
+    parser.add_argument('--render-frames', nargs='+', type=int, metavar='TIME_MS', default=[],
+        help="times of the frames to render, in milliseconds of game time")
+    parser.add_argument('--render-dir', metavar='DIR', default='.',
+        help="directory to save the rendered frames to (default: project root)")
+    return parser.parse_args()
+
+def main():
+    args = _parse_args()
+    filename = from_project_root(args.filename)
+    render_dir = from_project_root(args.render_dir)
+    try:
+        if args.output is not None:
+            result = replay_run(filename, from_project_root(args.output),
+                                render_frame_times=args.render_frames, render_dir=render_dir)
+        else:
+            with TemporaryDirectory() as temp_dir:
+                result = replay_run(filename, path.join(temp_dir, 'replay.events'),
+                                    render_frame_times=args.render_frames, render_dir=render_dir)
+    except ValueError as exc:
+        print(f'Error: {exc}', file=sys.stderr)
+        sys.exit(1)
+    _print_summary(result)
+    if result['first_difference'] is not None or result['score'] != result['recorded_score']:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
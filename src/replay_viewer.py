@@ -0,0 +1,262 @@
+"""
+Seekable viewer of the runs recorded with `pipenv run auto --headless --record`.
+
+The run is replayed once, headlessly, when the viewer starts, and a keyframe
+is kept every few seconds of game time: a copy of the replayed stage, with
+its processes, pages, slots, I/O queue, score, uptime and random streams.
+Moving to any time of the run then only simulates
+forward from the last keyframe before it.
+
+Usage: `pipenv run replay-viewer <file> [--keyframe-interval <seconds>]`
+
+Hotkeys:
+    space         pause or resume
+    left, right   move backward or forward by 5 seconds (60 with shift)
+    , and .       step one frame backward or forward, pausing the replay
+    home, end     go to the start or to the end of the run
+"""
+
+from bisect import bisect_right
+from os import path
+import argparse
+import asyncio
+import copy
+import sys
+
+import pygame
+
+from cli_utils import from_project_root, read_recording
+from constants import ONE_SECOND
+from engine.game_event_type import GameEventType
+from engine.game_manager import GameManager
+from engine.scene import Scene
+from engine.scene_manager import SceneManager
+from engine.window_config import WindowConfig
+from game_info import TITLE
+from replay import create_replay_stage
+from ui.color import Color
+from window_size import WINDOW_SIZE
+
+DEFAULT_KEYFRAME_INTERVAL_MS = 10 * ONE_SECOND
+
+_SEEK_MS = 5 * ONE_SECOND
+_LONG_SEEK_MS = 60 * ONE_SECOND
+_OVERLAY_PADDING = 5
+
+class ReplayTimeline:
+    """Replay of a recorded run, that can be moved to any of its frames.
+
+    The replayed stage is run by a scene manager of its own. It draws to an
+    offscreen surface, as in `GameManager.simulate`, until `screen` is set.
+    """
+
+    def __init__(self, filename, *, keyframe_interval_ms=DEFAULT_KEYFRAME_INTERVAL_MS):
+        metadata, (end_time, _), actions = read_recording(filename)
+        self._step_ms = metadata['step_ms']
+        self._end_time = end_time
+        self._screen = pygame.Surface(WINDOW_SIZE)
+        self._keyframe_times = []
+        self._keyframes = []
+
+        pygame.font.init()
+        self._scene_manager = SceneManager()
+        self._scene_manager.screen = self._screen
+        self._scene_manager.start_scene(create_replay_stage(metadata, actions), 0)
+        self._current_time = None
+
+        self._update(0)
+        self._save_keyframe()
+        while self._current_time < self._end_time:
+            self.step()
+            if self._current_time >= self._keyframe_times[-1] + keyframe_interval_ms:
+                self._save_keyframe()
+        self.seek(0)
+
+    @property
+    def stage(self) -> 'Stage':
+        return self._scene_manager.current_scene
+
+    @property
+    def screen(self):
+        return self._screen
+
+    @screen.setter
+    def screen(self, value: pygame.Surface):
+        self._screen = value
+        self._scene_manager.screen = value
+
+    @property
+    def current_time(self):
+        return self._current_time
+
+    @property
+    def end_time(self):
+        return self._end_time
+
+    @property
+    def step_ms(self):
+        return self._step_ms
+
+    @property
+    def keyframe_count(self):
+        return len(self._keyframes)
+
+    def _update(self, current_time):
+        self._scene_manager.update(current_time, [])
+        self._current_time = current_time
+
+    def _copy_scene_manager(self, scene_manager):
+        # The screen is not copied: the copies draw to the current screen once restored.
+        screen = scene_manager.screen
+        return copy.deepcopy(scene_manager, {id(screen): screen})
+
+    def _save_keyframe(self):
+        self._keyframe_times.append(self._current_time)
+        self._keyframes.append(self._copy_scene_manager(self._scene_manager))
+
+    def step(self):
+        """Simulate the next frame, if the run is not over."""
+        if self._current_time < self._end_time:
+            self._update(self._current_time + self._step_ms)
+
+    def seek(self, target_time):
+        """Move to the last frame at or before `target_time`, simulating forward
+        from the closest keyframe or from the current frame, whichever is closer."""
+        target_time = max(0, min(target_time, self._end_time))
+        target_time -= target_time % self._step_ms
+        index = bisect_right(self._keyframe_times, target_time) - 1
+        keyframe_time = self._keyframe_times[index]
+        if not keyframe_time <= self._current_time <= target_time:
+            self._scene_manager = self._copy_scene_manager(self._keyframes[index])
+            self._scene_manager.screen = self._screen
+            self._current_time = keyframe_time
+        while self._current_time < target_time:
+            self.step()
+
+class ReplayViewer(Scene):
+    """Plays a ReplayTimeline in real time, with hotkeys to pause, step and seek."""
+
+    def __init__(self, timeline: ReplayTimeline):
+        super().__init__('replay_viewer')
+        self._timeline = timeline
+        self._paused = False
+        self._playback_start = None
+        self._overlay_rect = None
+
+    @property
+    def timeline(self):
+        return self._timeline
+
+    def setup(self):
+        self._timeline.screen = self.screen
+        self._timeline.stage.invalidate()
+        self._paused = False
+        self._playback_start = None
+        self._overlay_rect = None
+
+    def _handle_key(self, key, shift, current_time):
+        timeline = self._timeline
+        seek_ms = _LONG_SEEK_MS if shift else _SEEK_MS
+        if key == 'space':
+            self._paused = not self._paused
+        elif key == 'left':
+            timeline.seek(timeline.current_time - seek_ms)
+        elif key == 'right':
+            timeline.seek(timeline.current_time + seek_ms)
+        elif key == ',':
+            self._paused = True
+            timeline.seek(timeline.current_time - timeline.step_ms)
+        elif key == '.':
+            self._paused = True
+            timeline.step()
+        elif key == 'home':
+            timeline.seek(0)
+        elif key == 'end':
+            timeline.seek(timeline.end_time)
+        else:
+            return
+        # Playback resumes in real time from the new position.
+        self._playback_start = (current_time, timeline.current_time)
+        timeline.stage.invalidate()
+
+    def update(self, current_time, events):
+        for event in events:
+            if event.type == GameEventType.KEY_UP:
+                self._handle_key(
+                    event.get_property('key'), event.get_property('shift'), current_time)
+        if self._playback_start is None:
+            self._playback_start = (current_time, self._timeline.current_time)
+        if self._paused:
+            return
+        start_time, start_replay_time = self._playback_start
+        target_time = start_replay_time + current_time - start_time
+        while self._timeline.current_time + self._timeline.step_ms <= target_time:
+            if self._timeline.current_time >= self._timeline.end_time:
+                self._paused = True
+                break
+            self._timeline.step()
+
+    def _get_overlay_text(self):
+        timeline = self._timeline
+        text = (
+            f'{timeline.current_time / ONE_SECOND:.3f} s'
+            f' / {timeline.end_time / ONE_SECOND:.3f} s'
+        )
+        if self._paused:
+            text += ' (paused)'
+        return text
+
+    def render(self):
+        from ui.fonts import FONT_SECONDARY_XSMALL # pylint: disable=import-outside-toplevel
+        screen = self.screen
+        text_surface = FONT_SECONDARY_XSMALL.render(self._get_overlay_text(), True, Color.WHITE)
+        overlay_rect = text_surface.get_rect().inflate(2 * _OVERLAY_PADDING, 2 * _OVERLAY_PADDING)
+        overlay_rect.bottomleft = screen.get_rect().bottomleft
+        if self._overlay_rect is not None and not overlay_rect.contains(self._overlay_rect):
+            # The stage only redraws what changed, which would leave parts of
+            # the previous overlay on the screen.
+            self._timeline.stage.invalidate()
+        self._overlay_rect = overlay_rect
+
+        self._timeline.stage.render()
+        screen.fill(Color.BLACK, overlay_rect)
+        screen.blit(text_surface, text_surface.get_rect(center=overlay_rect.center))
+        if screen is pygame.display.get_surface():
+            pygame.display.update(overlay_rect)
+
+async def view_replay(filename, *, keyframe_interval_ms=DEFAULT_KEYFRAME_INTERVAL_MS):
+    """Open a window to watch the run recorded in `filename`."""
+    timeline = ReplayTimeline(filename, keyframe_interval_ms=keyframe_interval_ms)
+    game_manager = GameManager()
+    game_manager.window_config = WindowConfig(WINDOW_SIZE, TITLE, path.join('assets', 'icon.png'))
+    viewer = ReplayViewer(timeline)
+    game_manager.register_scene(viewer)
+    game_manager.startup_scene = viewer
+    await game_manager.play()
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        prog="pipenv run replay-viewer",
+        description="Watch a run recorded with auto --headless --record"
+    )
+    parser.add_argument('filename',
+        help="file the run was recorded to")
+    parser.add_argument('--keyframe-interval', type=float, metavar='SECONDS',
+        default=DEFAULT_KEYFRAME_INTERVAL_MS / ONE_SECOND,
+        help="game time between two keyframes, which bounds the time it takes to seek "
+            "(default: %(default)s)")
+    return parser.parse_args()
+
+async def main():
+    args = _parse_args()
+    try:
+        await view_replay(
+            from_project_root(args.filename),
+            keyframe_interval_ms=int(args.keyframe_interval * ONE_SECOND)
+        )
+    except ValueError as exc:
+        print(f'Error: {exc}', file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -44,7 +44,9 @@ class Cpu(SceneObject):
 
     @process.setter
     def process(self, process):
+        previous_process = self._process
         self._process = process
+        self._cpu_manager.notify_process_change(self, previous_process)
 
     def update(self, current_time, events):
         pass
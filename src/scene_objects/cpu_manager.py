@@ -1,4 +1,5 @@
 from config.cpu_config import CpuConfig, CoreType
+from constants import LAST_ALIVE_STARVATION_LEVEL
 from scene_objects.cpu import Cpu
 from scene_objects.process import Process, ProcessState
 from scene_objects.views.cpu_manager_view import CpuManagerView
@@ -12,10 +13,23 @@ class CpuManager(SceneObject):
         self._physical_cores: [[Cpu]] = []
         self._standard_or_p_cores: [[Cpu]] = []
         self._e_cores: [[Cpu]] = []
+        self._cpu_list: [Cpu] = []
 
-    @property
-    def _cpu_list(self):
-        return [cpu for core in self._physical_cores for cpu in core]
+        # Number of logical cores running a process, for each physical core.
+        self._num_busy_threads_by_core: [int] = []
+        # CPUs of each core class in the order select_free_cpu picks them,
+        # with a bitmap of the free ones.
+        self._selection_order: dict[bool, [Cpu]] = {False: [], True: []}
+        self._free_cpus_bitmap: dict[bool, int] = {False: 0, True: 0}
+        self._selection_index_by_cpu: dict[Cpu, int] = {}
+        self._cpus_by_process: dict[Process, Cpu] = {}
+
+        # Stats of the processes that are running on a CPU and have not ended,
+        # with the (starvation level, is blocked) pair counted for each CPU.
+        self._active_process_count = 0
+        self._active_process_count_by_starvation_level = [0] * (LAST_ALIVE_STARVATION_LEVEL + 1)
+        self._blocked_active_process_count = 0
+        self._counted_stats_by_cpu: dict[Cpu, tuple[int, bool]] = {}
 
     def setup(self):
         logical_id = 0
@@ -43,6 +57,21 @@ class CpuManager(SceneObject):
             core for core in self._physical_cores
                 if core[0].core_type == CoreType.EFFICIENT
         ]
+        self._cpu_list = [cpu for core in self._physical_cores for cpu in core]
+        self._num_busy_threads_by_core = [0] * len(self._physical_cores)
+
+        max_num_threads = max(self._cpu_config.num_threads_for_core)
+        for use_e_core, physical_cores in ((False, self._standard_or_p_cores),
+                                           (True, self._e_cores)):
+            self._selection_order[use_e_core] = [
+                physical_core[thread_index]
+                for thread_index in range(max_num_threads)
+                for physical_core in physical_cores
+                if thread_index < len(physical_core)
+            ]
+            for i, cpu in enumerate(self._selection_order[use_e_core]):
+                self._selection_index_by_cpu[cpu] = i
+            self._free_cpus_bitmap[use_e_core] = (1 << len(self._selection_order[use_e_core])) - 1
 
         x = 50
         y = 50
@@ -61,30 +90,56 @@ class CpuManager(SceneObject):
         return self._cpu_list[logical_id - 1]
 
     def select_free_cpu(self, *, use_e_core: bool = False) -> Cpu | None:
-        max_num_threads = max(
-            self._cpu_config.num_threads_for_core
-        )
-        physical_cores = self._e_cores if use_e_core else self._standard_or_p_cores
-        for thread_index in range(max_num_threads):
-            for physical_core in physical_cores:
-                if thread_index < len(physical_core):
-                    cpu = physical_core[thread_index]
-                    if not cpu.has_process:
-                        return cpu
-        return None
+        """First free CPU of the requested class, filling the first thread
+        of every physical core before the next ones."""
+        free_cpus_bitmap = self._free_cpus_bitmap[use_e_core]
+        if free_cpus_bitmap == 0:
+            return None
+        lowest_bit = free_cpus_bitmap & -free_cpus_bitmap
+        return self._selection_order[use_e_core][lowest_bit.bit_length() - 1]
 
     def check_cpu_for_penalty(self, cpu: Cpu) -> bool:
-        return len([
-            core for core in
-            self._physical_cores[cpu.physical_id - 1]
-            if core.has_process
-        ]) > 1
+        return self._num_busy_threads_by_core[cpu.physical_id - 1] > 1
 
     def find_cpu_with_process(self, process: Process) -> Cpu | None:
-        for cpu in self._cpu_list:
-            if cpu.process and cpu.process == process:
-                return cpu
-        return None
+        return self._cpus_by_process.get(process)
+
+    def notify_process_change(self, cpu: Cpu, previous_process: Process | None):
+        """Called by a CPU when its process changes."""
+        if previous_process is not None:
+            self._num_busy_threads_by_core[cpu.physical_id - 1] -= 1
+            if self._cpus_by_process.get(previous_process) is cpu:
+                del self._cpus_by_process[previous_process]
+        use_e_core = cpu.core_type == CoreType.EFFICIENT
+        selection_bit = 1 << self._selection_index_by_cpu[cpu]
+        if cpu.has_process:
+            self._num_busy_threads_by_core[cpu.physical_id - 1] += 1
+            self._cpus_by_process.setdefault(cpu.process, cpu)
+            self._free_cpus_bitmap[use_e_core] &= ~selection_bit
+        else:
+            self._free_cpus_bitmap[use_e_core] |= selection_bit
+        self._update_stats(cpu)
+
+    def notify_process_state_change(self, process: Process):
+        """Called by a process when its state or starvation level changes."""
+        cpu = self._cpus_by_process.get(process)
+        if cpu is not None:
+            self._update_stats(cpu)
+
+    def _update_stats(self, cpu: Cpu):
+        counted_stats = self._counted_stats_by_cpu.pop(cpu, None)
+        if counted_stats is not None:
+            starvation_level, is_blocked = counted_stats
+            self._active_process_count -= 1
+            self._active_process_count_by_starvation_level[starvation_level] -= 1
+            self._blocked_active_process_count -= is_blocked
+
+        process = cpu.process
+        if process is not None and process.state != ProcessState.ENDED:
+            self._active_process_count += 1
+            self._active_process_count_by_starvation_level[process.starvation_level] += 1
+            self._blocked_active_process_count += process.is_blocked
+            self._counted_stats_by_cpu[cpu] = (process.starvation_level, process.is_blocked)
 
     def remove_process_from_cpu(self, process: Process):
         cpu = self.find_cpu_with_process(process)
@@ -92,20 +147,12 @@ class CpuManager(SceneObject):
             cpu.process = None
 
     def get_current_stats(self):
-        active_process_count_by_starvation_level = [0, 0, 0, 0, 0, 0]
-        for cpu in self._cpu_list:
-            if cpu.process is not None and cpu.process.state != ProcessState.ENDED:
-                active_process_count_by_starvation_level[cpu.process.starvation_level] += 1
         return {
-            'active_process_count': len([
-                cpu for cpu in self._cpu_list
-                    if cpu.process is not None and cpu.process.state != ProcessState.ENDED
-            ]),
-            'active_process_count_by_starvation_level': active_process_count_by_starvation_level,
-            'blocked_active_process_count': len([
-                cpu for cpu in self._cpu_list
-                    if cpu.process is not None and cpu.process.is_blocked
-            ]),
+            'active_process_count': self._active_process_count,
+            'active_process_count_by_starvation_level': list(
+                self._active_process_count_by_starvation_level
+            ),
+            'blocked_active_process_count': self._blocked_active_process_count,
         }
 
     @property
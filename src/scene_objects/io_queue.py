@@ -1,9 +1,12 @@
 from collections import deque
+from math import inf
+from typing import Optional
 
-import game_monitor
+from game_monitor import GameMonitor, get_default_monitor
 from engine.scene_object import SceneObject
 from engine.game_event_type import GameEventType
-from engine.random import randint
+from engine.random import RandomStream, RandomStreams, get_default_streams
+from engine.timer_queue import TimerQueue
 from scene_objects.views.io_queue_view import IoQueueView
 
 _BLINKING_INTERVAL_MS = 333
@@ -29,9 +32,16 @@ class _IoEventWaiter:
 
 class IoQueue(SceneObject):
 
-    def __init__(self, min_waiting_time_ms, max_waiting_time_ms):
+    def __init__(self, min_waiting_time_ms, max_waiting_time_ms,
+                 timer_queue: Optional[TimerQueue] = None, monitor: GameMonitor = None,
+                 random_streams: RandomStreams = None):
         self._min_waiting_time_ms = min_waiting_time_ms
         self._max_waiting_time_ms = max_waiting_time_ms
+        self._timer_queue = timer_queue
+        self._monitor = monitor if monitor is not None else get_default_monitor()
+        self._random_streams = (
+            random_streams if random_streams is not None else get_default_streams()
+        )
 
         self._subscriber_queue = deque([])
         self._event_count = 0
@@ -39,14 +49,13 @@ class IoQueue(SceneObject):
         self._current_time = 0
         self._last_event_check_time = 0
 
-        self._display_blink_color = False
-
         super().__init__(IoQueueView(self))
 
     def wait_for_event(self, current_time, on_arrival_callback, on_delivery_callback):
         self._subscriber_queue.append(
             _IoEventWaiter(current_time, on_arrival_callback, on_delivery_callback)
         )
+        self._schedule_next_update()
 
     @property
     def event_count(self):
@@ -58,7 +67,17 @@ class IoQueue(SceneObject):
 
     @property
     def display_blink_color(self):
-        return self._display_blink_color
+        return self._event_count > 0 and int(self._current_time / _BLINKING_INTERVAL_MS) % 2 == 1
+
+    def next_update_time(self, current_time): # pylint: disable=unused-argument
+        """Earliest time at which an I/O event may arrive. Blinking is not taken into account."""
+        if self._event_count >= len(self._subscriber_queue):
+            return inf
+        waiter = self._subscriber_queue[self._event_count]
+        return min(
+            waiter.waiting_since + self._max_waiting_time_ms,
+            self._last_event_check_time + self._min_waiting_time_ms
+        )
 
     def handle_player_action(self):
         if self.event_count == 0:
@@ -68,7 +87,12 @@ class IoQueue(SceneObject):
             self._event_count -= 1
             waiter = self._subscriber_queue.popleft()
             waiter.on_delivery_callback()
-        game_monitor.notify_io_event_count(self.event_count)
+        self._monitor.notify_io_event_count(self.event_count)
+        self._schedule_next_update()
+
+    def _schedule_next_update(self):
+        if self._timer_queue is not None:
+            self._timer_queue.schedule(self, self.next_update_time(self._current_time))
 
     def _check_if_clicked_on(self, event):
         if event.type == GameEventType.MOUSE_LEFT_CLICK:
@@ -84,7 +108,7 @@ class IoQueue(SceneObject):
             self._last_event_check_time = current_time
             waiter.on_arrival_callback()
             self._event_count += 1
-            game_monitor.notify_io_event_count(self._event_count)
+            self._monitor.notify_io_event_count(self._event_count)
 
     def _handle_probabilistic_events(self, current_time):
         if current_time < self._last_event_check_time + self._min_waiting_time_ms:
@@ -98,19 +122,16 @@ class IoQueue(SceneObject):
 
         self._last_event_check_time = current_time
 
-        if randint(1, _EVENT_PROBABILITY_DENOMINATOR) != 1:
+        if self._random_streams.randint(1, _EVENT_PROBABILITY_DENOMINATOR, RandomStream.IO) != 1:
             return
 
-        new_event_count = randint(self._event_count + 1, len(self._subscriber_queue))
+        new_event_count = self._random_streams.randint(
+            self._event_count + 1, len(self._subscriber_queue), RandomStream.IO
+        )
         for i in range(self._event_count, new_event_count):
             self._subscriber_queue[i].on_arrival_callback()
         self._event_count = new_event_count
-        game_monitor.notify_io_event_count(self._event_count)
-
-    def _update_blink_color(self, current_time):
-        self._display_blink_color = (
-            int(current_time / _BLINKING_INTERVAL_MS) % 2 == 1 if self._event_count > 0 else False
-        )
+        self._monitor.notify_io_event_count(self._event_count)
 
     def update(self, current_time, player_actions): # pylint: disable=arguments-renamed
         self._current_time = current_time
@@ -127,4 +148,4 @@ class IoQueue(SceneObject):
 
         self._handle_max_time_elapsed(current_time)
         self._handle_probabilistic_events(current_time)
-        self._update_blink_color(current_time)
+        self._schedule_next_update()
@@ -1,10 +1,11 @@
 from enum import Enum
+from math import inf
 from typing import Optional, Type
 
 from engine.drawable import Drawable
 from engine.game_event_type import GameEventType
 from engine.scene_object import SceneObject
-import game_monitor
+from game_monitor import GameMonitor, get_default_monitor
 from scene_objects.page_slot import PageSlot
 from scene_objects.views.page_view import PageView
 
@@ -18,10 +19,11 @@ PageMouseDragAction = Enum('PageMouseDragAction', [
 class Page(SceneObject):
 
     def __init__(self, pid: int, idx: int, page_manager: 'PageManager', config: 'PageConfig',
-                 *, view_class: Type[Drawable] = PageView):
+                 *, view_class: Type[Drawable] = PageView, monitor: GameMonitor = None):
         self._pid = pid
         self._idx = idx
         self._page_manager = page_manager
+        self._monitor = monitor if monitor is not None else get_default_monitor()
         self._config = config
 
         self._in_use = False
@@ -93,7 +95,7 @@ class Page(SceneObject):
         self._swapping_from = swapping_from
         self._waiting_to_swap = True
         self._swap_percentage_completed = 0
-        game_monitor.notify_page_swap_queue(self.pid, self.idx, True)
+        self._monitor.notify_page_swap_queue(self.pid, self.idx, True)
 
     def start_swap(self, current_time: int, swapping_to : PageSlot):
         """The method called by the page manager to actually start the swap."""
@@ -101,7 +103,8 @@ class Page(SceneObject):
         self._started_swap_at = current_time
         self._swapping_to = swapping_to
         swapping_to.page = self
-        game_monitor.notify_page_swap_start(self.pid, self.idx)
+        self._page_manager.notify_swap_start(self)
+        self._monitor.notify_page_swap_start(self.pid, self.idx)
 
     def request_swap_cancellation(self, cancel_whole_row : bool = False):
         """The method called when the player clicks on the page to cancel swapping."""
@@ -112,13 +115,14 @@ class Page(SceneObject):
         """The method called by the page manager to cancel the swap."""
         if self.swap_in_progress:
             self._swapping_to.page = None
+            self._page_manager.notify_swap_end(self)
         if self.swap_requested:
             self._waiting_to_swap = False
             self._swapping_from = None
             self._swapping_to = None
             self._started_swap_at = None
             self._swap_percentage_completed = 0
-            game_monitor.notify_page_swap_queue(self.pid, self.idx, False)
+            self._monitor.notify_page_swap_queue(self.pid, self.idx, False)
 
     def _update_swap(self, current_time):
         """This method is called at each update. If a swap is in progress, it performs
@@ -133,6 +137,7 @@ class Page(SceneObject):
                     / self._config.swap_delay_ms
                 )
             if self._swap_percentage_completed == 1:
+                self._page_manager.notify_swap_end(self)
                 self.view.set_xy(self._swapping_to.view.x, self._swapping_to.view.y)
                 self._swapping_from.page = None
                 self._swapping_from = None
@@ -140,7 +145,14 @@ class Page(SceneObject):
                 self._started_swap_at = None
                 self._on_disk = not self._on_disk
                 self._swap_percentage_completed = 0
-                game_monitor.notify_page_swap(self.pid, self.idx, self.on_disk)
+                self._monitor.notify_page_swap(self.pid, self.idx, self.on_disk)
+
+    def next_update_time(self, current_time): # pylint: disable=unused-argument
+        """Earliest time at which the swap in progress may complete, if any.
+        Blinking is not taken into account."""
+        if self.swap_in_progress:
+            return self._started_swap_at + self._config.swap_delay_ms
+        return inf
 
     def _on_click(self, mouse_drag : bool, shift_down : bool):
         if mouse_drag:
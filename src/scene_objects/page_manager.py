@@ -1,11 +1,14 @@
-from queue import Queue
+from math import inf
 from typing import Optional
 
 from constants import MAX_RAM_ROWS, PAGES_PER_ROW
+from engine.game_event_type import GameEventType
 from engine.scene_object import SceneObject
+from engine.spatial_hash import SpatialHash
 from scene_objects.views.page_manager_view import PageManagerView
 from scene_objects.page import Page, PageMouseDragAction
-from scene_objects.page_slot import PageSlot
+from scene_objects.page_slot import PageSlot, PageSlotPool
+from scene_objects.swap_queue import SwapQueue
 from factories.page_factory import PageFactory
 
 class PageManager(SceneObject):
@@ -15,19 +18,30 @@ class PageManager(SceneObject):
     def __init__(self, stage: 'Stage', stage_config: 'StageConfig'):
         self._stage = stage
         self._stage_config = stage_config
-        self._page_factory = PageFactory(stage, stage_config)
+        self._page_factory = PageFactory(stage, stage_config, self)
 
-        self._ram_slots = []
-        self._disk_slots = []
+        self._ram_slots = PageSlotPool()
+        self._disk_slots = PageSlotPool()
         self._pages = {}
-        self._swap_in_queue = Queue()
-        self._swap_out_queue = Queue()
+        self._swap_in_queue = SwapQueue()
+        self._swap_out_queue = SwapQueue()
+        self._slot_rows = {}
+
+        # Pages whose swap is in progress, in the order the swaps started.
+        self._pages_swapping = {}
+        self._num_swap_ins_in_progress = 0
+        self._num_swap_outs_in_progress = 0
 
         self._pages_in_ram_label_xy = (0, 0)
         self._pages_on_disk_label_xy = None
 
         self._current_mouse_drag_action: Optional[PageMouseDragAction] = None
 
+        self._hit_test_index = SpatialHash()
+        # Pages that received the last mouse motion event, and may be marked as
+        # dragged on until the next one.
+        self._pages_under_mouse = []
+
         super().__init__(PageManagerView(self))
 
     @property
@@ -45,6 +59,14 @@ class PageManager(SceneObject):
     def get_num_cols(cls):
         return cls._NUM_COLS
 
+    @property
+    def swap_in_queue_depth(self):
+        return self._swap_in_queue.depth
+
+    @property
+    def swap_out_queue_depth(self):
+        return self._swap_out_queue.depth
+
     def get_page(self, pid, idx):
         return self._pages[(pid, idx)]
 
@@ -66,6 +88,7 @@ class PageManager(SceneObject):
         num_cols = PageManager._NUM_COLS
 
         for row in range(num_ram_rows):
+            row_slots = []
             for column in range(num_cols):
                 ram_slot = PageSlot()
                 x = self._stage.process_manager.view.width + \
@@ -73,6 +96,8 @@ class PageManager(SceneObject):
                 y = 155 + row * ram_slot.view.height + row * 5
                 ram_slot.view.set_xy(x, y)
                 self._ram_slots.append(ram_slot)
+                row_slots.append(ram_slot)
+                self._slot_rows[ram_slot] = row_slots
         self.children.extend(self._ram_slots)
 
         if num_swap_rows > 0:
@@ -81,6 +106,7 @@ class PageManager(SceneObject):
                 164 + num_ram_rows * PageSlot().view.height + num_ram_rows * 5)
 
             for row in range(num_swap_rows):
+                row_slots = []
                 for column in range(num_cols):
                     disk_slot = PageSlot()
                     x = self._stage.process_manager.view.width + \
@@ -89,27 +115,25 @@ class PageManager(SceneObject):
                         35 + row * ram_slot.view.height + row * 5
                     disk_slot.view.set_xy(x, y)
                     self._disk_slots.append(disk_slot)
+                    row_slots.append(disk_slot)
+                    self._slot_rows[disk_slot] = row_slots
             self.children.extend(self._disk_slots)
 
     def create_page(self, pid, idx, is_priority: bool = False):
         page = self._page_factory.create_page(pid, idx, is_priority)
-        page_created = False
-        for ram_slot in self._ram_slots:
-            if not ram_slot.has_page:
-                ram_slot.page = page
-                page.view.set_xy(ram_slot.view.x, ram_slot.view.y)
-                page_created = True
-                break
-        if not page_created:
-            for disk_slot in self._disk_slots:
-                if not disk_slot.has_page:
-                    disk_slot.page = page
-                    page.on_disk = True
-                    page.view.set_xy(disk_slot.view.x, disk_slot.view.y)
-                    page_created = True
-                    break
+        ram_slot = self._ram_slots.first_free_slot()
+        if ram_slot is not None:
+            ram_slot.page = page
+            page.view.set_xy(ram_slot.view.x, ram_slot.view.y)
+        else:
+            disk_slot = self._disk_slots.first_free_slot()
+            if disk_slot is not None:
+                disk_slot.page = page
+                page.on_disk = True
+                page.view.set_xy(disk_slot.view.x, disk_slot.view.y)
         self.children.append(page)
         self._pages[(pid, idx)] = page
+        self._hit_test_index.add(page, page.view)
         return page
 
     def swap_page(self, page : Page, swap_whole_row : bool = False):
@@ -117,76 +141,77 @@ class PageManager(SceneObject):
             return
 
         source_slots = self._disk_slots if page.on_disk else self._ram_slots
-        swap_queue = self._swap_in_queue if page.on_disk else self._swap_out_queue
-
-        swapping_from = next(
-            source_slot for source_slot in source_slots if source_slot.page == page)
-        page.init_swap(swapping_from)
-        swap_queue.put(page)
+        swap_queue = self._swap_queue_of(page)
 
+        swapping_from = source_slots.slot_of(page)
+        slots = [swapping_from]
         if swap_whole_row:
-            slots_on_same_row = [
-                slot
-                for slot in source_slots
-                if (
-                    slot.view.y == swapping_from.view.y
-                    and slot != swapping_from
-                )
-            ]
-            for slot in slots_on_same_row:
-                if slot.has_page:
-                    self.swap_page(slot.page, False)
+            slots.extend(
+                slot for slot in self._slot_rows[swapping_from]
+                if slot != swapping_from and slot.has_page and not slot.page.swap_requested
+            )
+        for slot in slots:
+            slot.page.init_swap(slot)
+        swap_queue.enqueue_all(slot.page for slot in slots)
 
     def cancel_page_swap(self, page : Page, cancel_whole_row : bool = False):
         if not page.swap_requested:
             return
 
         if cancel_whole_row:
-            slots_on_same_row = [
-                slot
-                for slot in (self._ram_slots + self._disk_slots)
-                if (slot.view.y == page.view.y and slot != page)
-            ]
-            for slot in slots_on_same_row:
-                if slot.has_page:
-                    self.cancel_page_swap(slot.page)
+            source_slots = self._disk_slots if page.on_disk else self._ram_slots
+            page_slot = source_slots.slot_of(page)
+            if page_slot is not None:
+                for slot in self._slot_rows[page_slot]:
+                    if slot.has_page:
+                        self.cancel_page_swap(slot.page)
         else:
+            self._swap_queue_of(page).cancel(page)
             page.cancel_swap()
 
     def delete_page(self, page):
+        self._swap_queue_of(page).cancel(page)
         page.cancel_swap()
-        for ram_slot in self._ram_slots:
-            if ram_slot.page == page:
-                ram_slot.page = None
-                break
-        for disk_slot in self._disk_slots:
-            if disk_slot.page == page:
-                disk_slot.page = None
-                break
+        for slots in (self._ram_slots, self._disk_slots):
+            slot = slots.slot_of(page)
+            if slot is not None:
+                slot.page = None
         self.children.remove(page)
         del self._pages[(page.pid, page.idx)]
+        self._hit_test_index.remove(page)
+        if page in self._pages_under_mouse:
+            self._pages_under_mouse.remove(page)
+
+    def _swap_queue_of(self, page: Page):
+        return self._swap_in_queue if page.on_disk else self._swap_out_queue
+
+    def notify_swap_start(self, page: Page):
+        """Called by a page when its swap starts."""
+        self._pages_swapping[page] = None
+        if page.on_disk:
+            self._num_swap_ins_in_progress += 1
+        else:
+            self._num_swap_outs_in_progress += 1
+
+    def notify_swap_end(self, page: Page):
+        """Called by a page when its swap in progress completes or is cancelled,
+        before the page changes side."""
+        del self._pages_swapping[page]
+        if page.on_disk:
+            self._num_swap_ins_in_progress -= 1
+        else:
+            self._num_swap_outs_in_progress -= 1
 
     def _handle_swap_queues(self, current_time):
-        num_swap_ins_in_progress = len([
-            page for page in self._pages.values()
-                if page.swap_in_progress
-                    and page.on_disk
-        ])
-        num_swap_outs_in_progress = len([
-            page for page in self._pages.values()
-                if page.swap_in_progress
-                    and page.in_ram
-        ])
+        num_swap_ins_in_progress = self._num_swap_ins_in_progress
+        num_swap_outs_in_progress = self._num_swap_outs_in_progress
 
         if num_swap_ins_in_progress < self._stage_config.parallel_swaps:
             newly_in_progress = 0
             while newly_in_progress < self._stage_config.parallel_swaps - num_swap_ins_in_progress:
-                empty_ram_slot = next((slot for slot in self._ram_slots if not slot.has_page), None)
-                if empty_ram_slot and not self._swap_in_queue.empty():
-                    page = self._swap_in_queue.get()
-                    if not page.swap_requested: # check if swap was cancelled
-                        continue
-                    page.start_swap(current_time, empty_ram_slot)
+                empty_ram_slot = self._ram_slots.first_free_slot()
+                if empty_ram_slot and self._swap_in_queue:
+                    self._swap_in_queue.dequeue().start_swap(current_time, empty_ram_slot)
                     newly_in_progress += 1
                 else:
                     break
@@ -195,18 +220,67 @@ class PageManager(SceneObject):
         if num_swap_ins_in_progress == 0:
             newly_in_progress = 0
             while newly_in_progress < self._stage_config.parallel_swaps - num_swap_outs_in_progress:
-                empty_disk_slot = next(
-                    (slot for slot in self._disk_slots if not slot.has_page),
-                    None)
-                if empty_disk_slot and not self._swap_out_queue.empty():
-                    page = self._swap_out_queue.get()
-                    if not page.swap_requested: # check if swap was cancelled
-                        continue
-                    page.start_swap(current_time, empty_disk_slot)
+                empty_disk_slot = self._disk_slots.first_free_slot()
+                if empty_disk_slot and self._swap_out_queue:
+                    self._swap_out_queue.dequeue().start_swap(current_time, empty_disk_slot)
                     newly_in_progress += 1
                 else:
                     break
 
+    def _can_start_swap(self, swap_queue, slots, num_swaps_in_progress):
+        return (
+            num_swaps_in_progress < self._stage_config.parallel_swaps
+            and len(swap_queue) > 0
+            and slots.has_free_slot
+        )
+
+    def next_update_time(self, current_time):
+        """Earliest time at which an update may change the pages or the swap queues.
+        Blinking is not taken into account."""
+        num_swap_ins_in_progress = self._num_swap_ins_in_progress
+        num_swap_outs_in_progress = self._num_swap_outs_in_progress
+        if (
+            self._can_start_swap(
+                self._swap_in_queue, self._ram_slots, num_swap_ins_in_progress)
+            or (
+                num_swap_ins_in_progress == 0
+                and self._can_start_swap(
+                    self._swap_out_queue, self._disk_slots, num_swap_outs_in_progress)
+            )
+        ):
+            return current_time
+        return min(
+            (page.next_update_time(current_time) for page in self._pages_swapping),
+            default=inf
+        )
+
+    def _dispatch_mouse_events(self, events):
+        """Return the mouse events that each page needs to handle, instead of
+        having every page test every event.
+
+        Besides the pages under the mouse pointer, the pages that were under it at
+        the previous mouse motion event also receive the event, so that they are
+        no longer marked as dragged on.
+        """
+        page_events = {}
+        for event in events:
+            if event.type not in (GameEventType.MOUSE_MOTION, GameEventType.MOUSE_LEFT_CLICK):
+                continue
+            pages = self._hit_test_index.items_at(*event.get_property('position'))
+            recipients = dict.fromkeys(self._pages_under_mouse + pages)
+            for page in recipients:
+                page_events.setdefault(page, []).append(event)
+            if event.type == GameEventType.MOUSE_MOTION:
+                self._pages_under_mouse = pages
+            else:
+                self._pages_under_mouse = []
+                if not recipients:
+                    # Otherwise reset by the pages receiving the click.
+                    self._current_mouse_drag_action = None
+        return page_events
+
     def update(self, current_time, events):
         self._handle_swap_queues(current_time)
-        super().update(current_time, events)
+        page_events = self._dispatch_mouse_events(events)
+        for child in self.children:
+            child.update(current_time, page_events.get(child, []))
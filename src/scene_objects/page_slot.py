@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+from typing import Optional
+
 from engine.scene_object import SceneObject
 from scene_objects.views.page_slot_view import PageSlotView
 
@@ -5,9 +8,20 @@ from scene_objects.views.page_slot_view import PageSlotView
 class PageSlot(SceneObject):
     def __init__(self):
         self._page = None
+        self._pool = None
+        self._index = None
 
         super().__init__(PageSlotView())
 
+    @property
+    def index(self):
+        """Position of the slot in its pool, if any."""
+        return self._index
+
+    def attach_to_pool(self, pool: 'PageSlotPool', index: int):
+        self._pool = pool
+        self._index = index
+
     @property
     def has_page(self):
         return self._page is not None
@@ -18,7 +32,58 @@ class PageSlot(SceneObject):
 
     @page.setter
     def page(self, page):
+        previous_page = self._page
         self._page = page
+        if self._pool is not None:
+            self._pool.notify_page_change(self, previous_page)
 
     def update(self, current_time, events):
         pass
+
+
+class PageSlotPool(Sequence):
+    """The page slots of the RAM or of the disk, in order.
+
+    Free slots are tracked in a bitmap, and the slot of each page in a dict,
+    so that finding the first free slot or the slot of a page does not require
+    to scan all the slots.
+    """
+
+    def __init__(self):
+        self._slots = []
+        self._free_slots_bitmap = 0
+        self._slots_by_page = {}
+
+    def __getitem__(self, index):
+        return self._slots[index]
+
+    def __len__(self):
+        return len(self._slots)
+
+    def append(self, slot: PageSlot):
+        slot.attach_to_pool(self, len(self._slots))
+        self._slots.append(slot)
+        self.notify_page_change(slot, None)
+
+    @property
+    def has_free_slot(self):
+        return self._free_slots_bitmap != 0
+
+    def first_free_slot(self) -> Optional[PageSlot]:
+        if self._free_slots_bitmap == 0:
+            return None
+        lowest_bit = self._free_slots_bitmap & -self._free_slots_bitmap
+        return self._slots[lowest_bit.bit_length() - 1]
+
+    def slot_of(self, page) -> Optional[PageSlot]:
+        return self._slots_by_page.get(page)
+
+    def notify_page_change(self, slot: PageSlot, previous_page):
+        """Called by the slots of the pool when their page changes."""
+        if previous_page is not None and self._slots_by_page.get(previous_page) is slot:
+            del self._slots_by_page[previous_page]
+        if slot.has_page:
+            self._slots_by_page[slot.page] = slot
+            self._free_slots_bitmap &= ~(1 << slot.index)
+        else:
+            self._free_slots_bitmap |= 1 << slot.index
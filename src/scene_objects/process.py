@@ -1,16 +1,16 @@
 from enum import Enum, auto
 from typing import Type
-from math import sqrt
+from math import inf, sqrt
 
 from config.process_config import ProcessConfig
 from constants import (
     ONE_SECOND, LAST_ALIVE_STARVATION_LEVEL, DEAD_STARVATION_LEVEL
 )
-import game_monitor
+from game_monitor import GameMonitor, get_default_monitor
 from engine.drawable import Drawable
 from engine.scene_object import SceneObject
 from engine.game_event_type import GameEventType
-from engine.random import randint
+from engine.random import RandomStream, RandomStreams, get_default_streams
 from scene_objects.views.process_view import ProcessView
 
 _NEW_PAGE_PROBABILITY_DENOMINATOR = 20
@@ -84,26 +84,30 @@ class Process(SceneObject):
 
     def __init__(self, pid: int, stage: 'Stage', config: ProcessConfig,
                  *, process_type: ProcessType = ProcessType.STANDARD,
-                 view_class: Type[Drawable] = ProcessView, current_time: int = 0):
+                 view_class: Type[Drawable] = ProcessView, current_time: int = 0,
+                 monitor: GameMonitor = None, random_streams: RandomStreams = None):
         self._state = ProcessState.IDLE
 
         self._pid = pid
         self._type = process_type
         self._process_manager = stage.process_manager
+        self._animation_manager = stage.process_manager.animation_manager
         self._cpu_manager = stage.process_manager.cpu_manager
         self._page_manager = stage.page_manager
+        self._monitor = monitor if monitor is not None else get_default_monitor()
+        self._random_streams = (
+            random_streams if random_streams is not None else get_default_streams()
+        )
         self._config = config
 
         self._cpu = None
         self._is_on_io_cooldown = False
         self._starvation_level = 1
 
-        self._last_update_time = current_time
-        self._last_periodic_update_time = self._last_update_time
-        self._last_state_change_time = self._last_update_time
-        self._last_starvation_level_change_time = self._last_update_time
-
-        self._display_blink_color = False
+        self._last_own_update_time = current_time
+        self._last_periodic_update_time = current_time
+        self._last_state_change_time = current_time
+        self._last_starvation_level_change_time = current_time
 
         self._pages = []
 
@@ -115,6 +119,10 @@ class Process(SceneObject):
 
         super().__init__(view_class(self))
 
+        self._animation_manager.register(
+            self._view, self._ANIMATION_SPEED, on_complete=self._on_move_complete
+        )
+
     @property
     def state(self):
         return self._state
@@ -168,13 +176,26 @@ class Process(SceneObject):
 
     @property
     def display_blink_color(self):
-        return self._display_blink_color
+        return (
+            self._state == ProcessState.BLOCKED_ON_CPU_PAGE_FAULT
+            and int(self._last_update_time / _BLINKING_INTERVAL_MS) % 2 == 1
+        )
+
+    @property
+    def _last_update_time(self):
+        # The process manager only wakes the processes that have something to do,
+        # and records when it last did so, which stands for the others.
+        return max(self._last_own_update_time, self._process_manager.last_process_update_time)
 
     @property
     def current_state_duration(self):
         """Time in milliseconds since process state changed between running, idle or blocked."""
         return max(self._last_update_time - self._last_state_change_time, 0)
 
+    @property
+    def last_starvation_level_change_time(self):
+        return self._last_starvation_level_change_time
+
     @property
     def current_starvation_level_duration(self):
         """Time in milliseconds since starvation level changed."""
@@ -213,6 +234,28 @@ class Process(SceneObject):
         )
         return time_to_termination
 
+    @property
+    def starvation_deadline(self):
+        """Time at which the process will be terminated due to starvation if it stays
+        off the CPU. Unlike `time_to_termination`, it does not change as time passes
+        or while the process is running, only when its starvation level changes or
+        when its I/O event becomes available. Returns float('inf') if the process
+        has terminated gracefully.
+        """
+        if self.starvation_level >= DEAD_STARVATION_LEVEL:
+            return self._last_starvation_level_change_time
+        if self._state == ProcessState.ENDED:
+            return inf
+        return (
+            self._last_starvation_level_change_time
+            + (DEAD_STARVATION_LEVEL - self.starvation_level) * self.time_between_starvation_levels
+        )
+
+    def notify_starvation(self):
+        """Send the starvation level and deadline of the process to the game monitor."""
+        self._monitor.notify_process_starvation(
+            self._pid, self._starvation_level, self.time_to_termination, self.starvation_deadline)
+
     @property
     def sort_key(self):
         """Sort key to be used by the `sort_idle_processes` method in the `ProcessManager` class.
@@ -232,8 +275,7 @@ class Process(SceneObject):
 
     @property
     def is_in_motion(self):
-        return ((self._view.target_x is not None or self._view.target_y is not None)
-            and (self._view.target_x != self._view.x or self._view.target_y != self._view.y))
+        return self._animation_manager.is_moving(self._view)
 
     def apply_state_transition(self, event: StateEvent):
         if (self._state in self._state_transitions
@@ -242,6 +284,15 @@ class Process(SceneObject):
             if new_state != self._state:
                 self._state = new_state
                 self._last_state_change_time = self._last_update_time
+                self._notify_state_change()
+
+    def _set_starvation_level(self, starvation_level):
+        self._starvation_level = starvation_level
+        self._notify_state_change()
+
+    def _notify_state_change(self):
+        self._process_manager.notify_process_state_change(self)
+        self._cpu_manager.notify_process_state_change(self)
 
     def use_cpu(self, use_e_core=False):
         if not self.has_cpu:
@@ -252,7 +303,7 @@ class Process(SceneObject):
                 self.apply_state_transition(StateEvent.ASSIGN_TO_CPU)
 
                 self.view.set_target_xy(cpu.view.x, cpu.view.y)
-                game_monitor.notify_process_cpu(self._pid, self.has_cpu)
+                self._monitor.notify_process_cpu(self._pid, self.has_cpu)
 
                 for slot in self._process_manager.process_slots:
                     if slot.process == self:
@@ -261,9 +312,10 @@ class Process(SceneObject):
                 if len(self._pages) == 0:
                     num_pages = round(
                         sqrt(
-                            randint(
+                            self._random_streams.randint(
                                 1,
-                                int((self._config.max_pages + 0.5) ** 2)
+                                int((self._config.max_pages + 0.5) ** 2),
+                                RandomStream.PAGES
                             )
                         )
                     )
@@ -271,10 +323,10 @@ class Process(SceneObject):
                         page = self._page_manager.create_page(
                             self._pid, i, self.type == ProcessType.PRIORITY)
                         self._pages.append(page)
-                        game_monitor.notify_page_new(page.pid, page.idx, page.on_disk, page.in_use)
+                        self._monitor.notify_page_new(page.pid, page.idx, page.on_disk, page.in_use)
                 for page in self._pages:
                     page.in_use = True
-                    game_monitor.notify_page_use(page.pid, page.idx, page.in_use)
+                    self._monitor.notify_page_use(page.pid, page.idx, page.in_use)
 
     def yield_cpu(self):
         if self.has_cpu:
@@ -285,19 +337,19 @@ class Process(SceneObject):
             if not self.is_waiting_for_io:
                 self._is_on_io_cooldown = False
             if self._state != ProcessState.ENDED:
-                game_monitor.notify_process_cpu(self._pid, self.has_cpu)
+                self._monitor.notify_process_cpu(self._pid, self.has_cpu)
             for page in self._pages:
                 page.in_use = False
-                game_monitor.notify_page_use(page.pid, page.idx, page.in_use)
+                self._monitor.notify_page_use(page.pid, page.idx, page.in_use)
 
             if self._state == ProcessState.ENDED:
                 if self.has_ended_gracefully:
                     self.view.target_y = -self.view.height
                 for page in self._pages:
-                    game_monitor.notify_page_free(page.pid, page.idx)
+                    self._monitor.notify_page_free(page.pid, page.idx)
                     self._page_manager.delete_page(page)
                 self._process_manager.del_process(self)
-                game_monitor.notify_process_end(self.pid)
+                self._monitor.notify_process_end(self.pid)
             else:
                 for slot in self._process_manager.process_slots:
                     if slot.process is None:
@@ -305,31 +357,35 @@ class Process(SceneObject):
                         self.view.set_target_xy(slot.view.x, slot.view.y)
                         break
 
+    def _on_move_complete(self, view): # pylint: disable=unused-argument
+        self._process_manager.notify_process_move_complete(self)
+
     def _on_io_event_available(self):
         if self._state != ProcessState.ENDED:
             self._last_starvation_level_change_time = self._last_update_time
             self.apply_state_transition(StateEvent.IO_AVAILABLE)
+            self.notify_starvation()
 
     def _on_io_event_delivered(self):
         if self._state != ProcessState.ENDED:
             self.apply_state_transition(StateEvent.IO_DELIVERED)
-            game_monitor.notify_process_wait_io(self.pid, self.is_waiting_for_io)
+            self._monitor.notify_process_wait_io(self.pid, self.is_waiting_for_io)
 
     def _terminate_gracefully(self):
         if self._process_manager.terminate_process(self, False):
             self.apply_state_transition(StateEvent.TERMINATE_GRACEFULLY)
-            self._starvation_level = 0
-            game_monitor.notify_process_terminated(self._pid)
+            self._set_starvation_level(0)
+            self._monitor.notify_process_terminated(self._pid)
 
     def _terminate_from_starvation(self):
         if self._process_manager.terminate_process(self, True):
             self.apply_state_transition(StateEvent.TERMINATE_FROM_STARVATION)
-            self._starvation_level = DEAD_STARVATION_LEVEL
+            self._set_starvation_level(DEAD_STARVATION_LEVEL)
             for page in self._pages:
-                game_monitor.notify_page_free(page.pid, page.idx)
+                self._monitor.notify_page_free(page.pid, page.idx)
                 self._page_manager.delete_page(page)
             self._process_manager.del_process(self)
-            game_monitor.notify_process_killed(self._pid)
+            self._monitor.notify_process_killed(self._pid)
 
     def toggle(self, to_e_core=False):
         if self.starvation_level < DEAD_STARVATION_LEVEL:
@@ -369,26 +425,48 @@ class Process(SceneObject):
             for player_action in player_actions:
                 self._check_if_clicked_on(player_action)
 
-    def _handle_pages(self):
-        page_fault = any(
+    @property
+    def _has_page_fault(self):
+        return any(
             page for page in self._pages
             if page.in_use and (page.on_disk or page.swap_in_progress)
         )
+
+    def next_update_time(self, current_time):
+        """Earliest time at which an update may change the process.
+        Blinking is not taken into account."""
+        if self.is_in_motion:
+            return current_time
+        if self._state == ProcessState.ENDED:
+            return inf
+        page_fault = self._has_page_fault
+        if (
+            (self._state == ProcessState.RUNNING and page_fault)
+            or (self._state == ProcessState.BLOCKED_ON_CPU_PAGE_FAULT and not page_fault)
+        ):
+            return current_time
+        return self.next_periodic_update_time
+
+    @property
+    def next_periodic_update_time(self):
+        """Time of the next starvation, I/O, new page and termination checks."""
+        return self._last_periodic_update_time + ONE_SECOND
+
+    def _handle_pages(self):
+        page_fault = self._has_page_fault
         if self.state == ProcessState.RUNNING and page_fault:
             self.apply_state_transition(StateEvent.PAGE_FAULT)
-            game_monitor.notify_process_wait_page(self.pid, True)
+            self._monitor.notify_process_wait_page(self.pid, True)
         elif self.state == ProcessState.BLOCKED_ON_CPU_PAGE_FAULT and not page_fault:
             self.apply_state_transition(StateEvent.PAGE_AVAILABLE)
-            game_monitor.notify_process_wait_page(self.pid, False)
+            self._monitor.notify_process_wait_page(self.pid, False)
 
     def _update_starvation_level(self, current_time):
         if self.state == ProcessState.RUNNING:
             if current_time - self._last_state_change_time >= self.cpu.process_happiness_ms:
                 self._last_starvation_level_change_time = current_time
-                self._starvation_level = 0
-                game_monitor.notify_process_starvation(
-                    self._pid, self._starvation_level, self.time_to_termination
-                )
+                self._set_starvation_level(0)
+                self.notify_starvation()
         elif (self.state != ProcessState.ENDED
               and self.current_starvation_level_duration >= self.time_between_starvation_levels):
             if self._state in [ProcessState.BLOCKED_ON_CPU_IO_REQUESTED,
@@ -396,9 +474,8 @@ class Process(SceneObject):
                 return
             self._last_starvation_level_change_time = current_time
             if self._starvation_level < LAST_ALIVE_STARVATION_LEVEL:
-                self._starvation_level += 1
-                game_monitor.notify_process_starvation(
-                    self._pid, self._starvation_level, self.time_to_termination)
+                self._set_starvation_level(self._starvation_level + 1)
+                self.notify_starvation()
             else:
                 self._terminate_from_starvation()
 
@@ -406,7 +483,8 @@ class Process(SceneObject):
         if self.state == ProcessState.RUNNING:
             if (
                 not self._is_on_io_cooldown
-                and randint(1, 100) <= self._io_probability_numerator
+                and self._random_streams.randint(1, 100, RandomStream.IO)
+                    <= self._io_probability_numerator
             ):
                 self.apply_state_transition(StateEvent.REQUEST_IO)
                 self._is_on_io_cooldown = True
@@ -416,19 +494,20 @@ class Process(SceneObject):
                     self._on_io_event_available,
                     self._on_io_event_delivered
                 )
-                game_monitor.notify_process_wait_io(self.pid, self.is_waiting_for_io)
+                self._monitor.notify_process_wait_io(self.pid, self.is_waiting_for_io)
 
     def _handle_new_page_probability(self):
         if self.state == ProcessState.RUNNING:
             if (
                 len(self._pages) < self._config.max_pages
-                and randint(1, _NEW_PAGE_PROBABILITY_DENOMINATOR) == 1
+                and self._random_streams.randint(
+                    1, _NEW_PAGE_PROBABILITY_DENOMINATOR, RandomStream.PAGES) == 1
             ):
                 new_page = self._page_manager.create_page(
                     self._pid, len(self._pages), self.type == ProcessType.PRIORITY)
                 self._pages.append(new_page)
                 new_page.in_use = True
-                game_monitor.notify_page_new(
+                self._monitor.notify_page_new(
                     new_page.pid, new_page.idx, new_page.on_disk, new_page.in_use)
 
     def _handle_graceful_termination_probability(self, current_time):
@@ -436,27 +515,20 @@ class Process(SceneObject):
             if (
                 current_time - self._last_state_change_time
                     >= ONE_SECOND
-                    and randint(1, 100) <= self._graceful_termination_probability_numerator
+                    and self._random_streams.randint(1, 100, RandomStream.TERMINATION)
+                        <= self._graceful_termination_probability_numerator
             ):
                 self._terminate_gracefully()
 
-    def _handle_blinking_animation(self, current_time):
-        if self.state == ProcessState.BLOCKED_ON_CPU_PAGE_FAULT:
-            self._display_blink_color = int(current_time / _BLINKING_INTERVAL_MS) % 2 == 1
-        else:
-            self._display_blink_color = False
-
     def update(self, current_time, player_actions):  # pylint: disable=arguments-renamed
-        self._last_update_time = current_time
+        self._last_own_update_time = current_time
+        self._process_manager.notify_process_update(self, current_time)
         self._handle_player_actions(player_actions)
         self._handle_pages()
 
-        if current_time >= self._last_periodic_update_time + ONE_SECOND:
+        if current_time >= self.next_periodic_update_time:
             self._last_periodic_update_time = current_time
             self._update_starvation_level(current_time)
             self._handle_io_probability()
             self._handle_new_page_probability()
             self._handle_graceful_termination_probability(current_time)
-
-        self.view.move_towards_target_xy(self._ANIMATION_SPEED)
-        self._handle_blinking_animation(current_time)
@@ -1,11 +1,13 @@
 from math import inf
 import re
 
-from constants import ONE_SECOND
-import game_monitor
+from constants import ONE_SECOND, LAST_ALIVE_STARVATION_LEVEL
+from engine.animation_manager import AnimationManager
 from engine.game_event_type import GameEventType
 from engine.scene_object import SceneObject
-from engine.random import randint
+from engine.random import RandomStream
+from engine.spatial_hash import SpatialHash
+from engine.timer_queue import TimerQueue
 from factories.process_factory import ProcessFactory
 from scene_objects.checkbox import Checkbox
 from scene_objects.cpu_manager import CpuManager
@@ -24,11 +26,11 @@ _NUM_PROCESS_SLOT_COLUMNS = 7
 _MIN_SORT_COOLDOWN_MS = 100
 _AUTO_SORT_CHECKBOX_ANIMATION_SPEED = 30
 
-def _is_sorted(process_list: [Process]):
+def _is_sorted(process_list: [Process], sort_keys: dict[Process, int]):
     if len(process_list) <= 1:
         return True
     for i in range(len(process_list) - 1):
-        if process_list[i].sort_key > process_list[i + 1].sort_key:
+        if sort_keys[process_list[i]] > sort_keys[process_list[i + 1]]:
             return False
     return True
 
@@ -36,11 +38,18 @@ class ProcessManager(SceneObject):
     def __init__(self, stage: 'Stage', stage_config: 'StageConfig'):
         self._stage = stage
         self._stage_config = stage_config
+        self._monitor = stage.game_monitor
+        self._random_streams = stage.random_streams
 
         self._process_factory = ProcessFactory(stage, stage_config)
 
         self._cpu_manager = None
+        self._fixed_children = None
         self._alive_process_list = None
+        self._processes_updated_every_frame = None
+        self._alive_process_count_by_starvation_level = None
+        self._counted_starvation_level_by_alive_process = None
+        self._process_table = None
         self._process_slots = None
         self._user_terminated_process_slots = None
         self._io_queue = None
@@ -59,6 +68,10 @@ class ProcessManager(SceneObject):
         self._sort_in_progress = False
         self._last_sort_time = 0
         self._current_time = 0
+        self._hit_test_index = SpatialHash()
+        self._animation_manager = AnimationManager()
+        self._timer_queue = TimerQueue()
+        self._last_process_update_time = 0
 
         self._new_process_probability_numerator = int(
             self._stage_config.new_process_probability * 100)
@@ -76,10 +89,18 @@ class ProcessManager(SceneObject):
         self._cpu_manager.setup()
         self.children.append(self._cpu_manager)
         self._alive_process_list = []
+        self._processes_updated_every_frame = set()
+        self._alive_process_count_by_starvation_level = [0] * (LAST_ALIVE_STARVATION_LEVEL + 1)
+        self._counted_starvation_level_by_alive_process = {}
+        if self._stage_config.vectorized_process_table:
+            # pylint: disable-next=import-outside-toplevel
+            from scene_objects.process_table import ProcessTable
+            self._process_table = ProcessTable(self._stage_config.max_processes)
         self._process_slots = []
         self._user_terminated_process_slots = []
         self._io_queue = IoQueue(
-            self._stage_config.io_min_waiting_time_ms, self._stage_config.io_max_waiting_time_ms
+            self._stage_config.io_min_waiting_time_ms, self._stage_config.io_max_waiting_time_ms,
+            self._timer_queue, self._monitor, self._random_streams
         )
         self._processes = {}
 
@@ -140,6 +161,9 @@ class ProcessManager(SceneObject):
             self._sort_processes_button.view.x + self._sort_processes_button.view.width + 10
         )
 
+        # Processes are added to the children as they are created.
+        self._fixed_children = list(self.children)
+
     @property
     def view_vars(self):
         return {
@@ -172,15 +196,20 @@ class ProcessManager(SceneObject):
             if slot.process is not None
         ]
 
+    @property
+    def animation_manager(self):
+        """Animation manager that moves the processes."""
+        return self._animation_manager
+
+    @property
+    def last_process_update_time(self):
+        """Time of the last update of the processes. Processes are only updated when
+        they have something to do, so those that were not are up to date as of that time."""
+        return self._last_process_update_time
+
     @property
     def any_process_in_motion(self):
-        processes_in_motion = False
-        for child in self.children:
-            if isinstance(child, Process):
-                if child.is_in_motion:
-                    processes_in_motion = True
-                    break
-        return processes_in_motion
+        return self._animation_manager.is_animating
 
     @property
     def max_processes_terminated_by_user(self):
@@ -220,12 +249,18 @@ class ProcessManager(SceneObject):
             process_slot.process = process
             self.children.append(process)
             self._alive_process_list.append(process)
+            self._count_alive_process(process)
+            if self._process_table is not None:
+                self._process_table.add(process, self._current_time)
 
             process.view.set_xy(process_slot.view.x,
                                 self.view.height + process.view.height)
             process.view.target_y = process_slot.view.y
+            self._hit_test_index.add(process, process.view)
+            self._timer_queue.schedule(process, process.next_periodic_update_time)
 
-            game_monitor.notify_process_new(pid)
+            self._monitor.notify_process_new(pid)
+            process.notify_starvation()
             self._processes[pid] = process
             return True
         return False
@@ -256,9 +291,50 @@ class ProcessManager(SceneObject):
 
         if can_terminate:
             self._alive_process_list.remove(process)
+            self._uncount_alive_process(process)
+            if self._process_table is not None:
+                self._process_table.remove(process)
 
         return can_terminate
 
+    def notify_process_move_complete(self, process):
+        """Called by a process when it reaches its target position."""
+        if (
+            process.state == ProcessState.ENDED
+            and process.view.y <= -process.view.height
+            and process in self.children
+        ):
+            self.children.remove(process)
+            self._hit_test_index.remove(process)
+            self._animation_manager.unregister(process.view)
+            self._timer_queue.cancel(process)
+
+    def notify_process_state_change(self, process):
+        """Called by a process when its state or starvation level changes."""
+        if process in self._counted_starvation_level_by_alive_process:
+            self._uncount_alive_process(process)
+            self._count_alive_process(process)
+            if self._process_table is not None:
+                self._process_table.update(process)
+            if process.state in (ProcessState.RUNNING, ProcessState.BLOCKED_ON_CPU_PAGE_FAULT):
+                # Page faults start and end, and the process blinks, between periodic updates.
+                self._processes_updated_every_frame.add(process)
+                return
+        self._processes_updated_every_frame.discard(process)
+
+    def notify_process_update(self, process, current_time):
+        """Called by a process when it is updated."""
+        if self._process_table is not None:
+            self._process_table.set_last_update_time(process, current_time)
+
+    def _count_alive_process(self, process):
+        self._counted_starvation_level_by_alive_process[process] = process.starvation_level
+        self._alive_process_count_by_starvation_level[process.starvation_level] += 1
+
+    def _uncount_alive_process(self, process):
+        starvation_level = self._counted_starvation_level_by_alive_process.pop(process)
+        self._alive_process_count_by_starvation_level[starvation_level] -= 1
+
     def sort_idle_processes(self):
         self._sort_in_progress = True
         self._last_sort_time = self._current_time
@@ -284,22 +360,39 @@ class ProcessManager(SceneObject):
             if process.is_in_motion:
                 return
 
+        # Sort keys do not change within a frame, so they are computed once
+        # for all idle processes rather than at every comparison.
+        if self._process_table is not None:
+            sort_keys = dict(zip(
+                idle_processes,
+                self._process_table.sort_keys(idle_processes, self._last_process_update_time)
+            ))
+        else:
+            sort_keys = {process: process.sort_key for process in idle_processes}
+
         def simulate_next_sort_step(arr: [Process]):
             if len(arr) <= 1:
                 return arr
-            pivot = arr[len(arr) // 2]
-            left = [process for process in arr if process.sort_key < pivot.sort_key]
-            middle = [process for process in arr if process.sort_key == pivot.sort_key]
-            right = [process for process in arr if process.sort_key > pivot.sort_key]
+            pivot_key = sort_keys[arr[len(arr) // 2]]
+            left = [process for process in arr if sort_keys[process] < pivot_key]
+            middle = [process for process in arr if sort_keys[process] == pivot_key]
+            right = [process for process in arr if sort_keys[process] > pivot_key]
             if (left + middle + right) == arr:
                 return simulate_next_sort_step(left) + middle + simulate_next_sort_step(right)
             return left + middle + right
 
-        if _is_sorted(idle_processes):
+        if _is_sorted(idle_processes, sort_keys):
             self._sort_in_progress = False
         else:
             idle_processes = simulate_next_sort_step(idle_processes)
 
+        if all(
+            slot.process is process for slot, process in zip(self._process_slots, idle_processes)
+        ):
+            # Every process is already at rest in its slot, as is the case on most
+            # frames with auto-sort enabled.
+            return
+
         for process_slot in self._process_slots:
             process_slot.process = None
         for i, process in enumerate(idle_processes):
@@ -308,15 +401,15 @@ class ProcessManager(SceneObject):
             process.view.set_target_xy(process_slot.view.x, process_slot.view.y)
 
     def get_current_stats(self):
+        """Snapshot of the stats used for scoring. The counts are kept up to date
+        as processes change, so this does not depend on the number of processes."""
         cpu_manager_stats = self._cpu_manager.get_current_stats()
 
-        process_count_by_starvation_level = [0, 0, 0, 0, 0, 0]
-        for process in self._alive_process_list:
-            process_count_by_starvation_level[process.starvation_level] += 1
-
         return {
             'alive_process_count': len(self._alive_process_list),
-            'alive_process_count_by_starvation_level': process_count_by_starvation_level,
+            'alive_process_count_by_starvation_level': list(
+                self._alive_process_count_by_starvation_level
+            ),
             'active_process_count': cpu_manager_stats['active_process_count'],
             'active_process_count_by_starvation_level': cpu_manager_stats[
                 'active_process_count_by_starvation_level'
@@ -371,7 +464,8 @@ class ProcessManager(SceneObject):
                 process_created = True
             elif current_time - self._last_new_process_check >= ONE_SECOND:
                 self._last_new_process_check = current_time
-                if randint(1, 100) <= self._new_process_probability_numerator or current_time - \
+                if self._random_streams.randint(1, 100, RandomStream.PROCESS_SPAWN) \
+                        <= self._new_process_probability_numerator or current_time - \
                         self._last_process_creation_time >= self._max_wait_between_new_processes:
                     self._create_process()
                     self._last_process_creation_time = current_time
@@ -382,6 +476,65 @@ class ProcessManager(SceneObject):
                 self._last_new_process_check = current_time
                 self._last_process_creation_time = current_time
 
+    @property
+    def _timed_powerup_pending(self):
+        uptime_ms = self._stage.uptime_manager.uptime_ms
+        return (
+            (
+                uptime_ms >= self._stage_config.time_ms_to_show_sort_button
+                and not self._sort_processes_button.visible
+            )
+            or (
+                uptime_ms >= self._stage_config.time_ms_to_show_auto_sort_checkbox
+                and not self._auto_sort_checkbox.visible
+            )
+        )
+
+    def _next_process_creation_time(self, current_time):
+        if len(self._alive_process_list) >= self._stage_config.max_processes:
+            return inf
+        if (
+            not self.any_process_in_motion
+            and len(self._alive_process_list) < self._current_min_processes(current_time)
+        ):
+            return current_time
+        next_times = [self._last_new_process_check + ONE_SECOND]
+        if len(self._forced_process_creation) > 0:
+            next_times.append(self._forced_process_creation[0][0])
+        if self._next_pid <= self._stage_config.num_processes_at_startup:
+            next_times.append(self._last_new_process_check + 50)
+        next_times.extend(
+            threshold.time_ms for threshold in self._min_processes_at_times_ms
+            if threshold.time_ms > current_time
+        )
+        return min(next_times)
+
+    def next_update_time(self, current_time):
+        """Earliest time at which an update may change the processes, the I/O queue
+        or the sort controls. Blinking is not taken into account."""
+        if self._stage.stage_completed:
+            return inf
+        if (
+            self._sort_in_progress
+            or self._auto_sort_enabled
+            or self._auto_sort_checkbox.view.target_x is not None
+            or self.any_process_in_motion
+            or self._timed_powerup_pending
+        ):
+            return current_time
+        next_times = [
+            self._next_process_creation_time(current_time),
+            # Periodic updates of the processes and next I/O event check.
+            self._timer_queue.next_deadline,
+        ]
+        if self._last_sort_time + _MIN_SORT_COOLDOWN_MS > current_time:
+            next_times.append(self._last_sort_time + _MIN_SORT_COOLDOWN_MS)
+        next_times.extend(
+            process.next_update_time(current_time)
+            for process in self._processes_updated_every_frame
+        )
+        return min(next_times)
+
     def _handle_timed_powerups(self, current_time):
         if (
             self._stage.uptime_manager.uptime_ms >= self._stage_config.time_ms_to_show_sort_button
@@ -406,15 +559,44 @@ class ProcessManager(SceneObject):
         if self._sort_in_progress or self._auto_sort_enabled:
             self._continue_sorting()
 
+    def _dispatch_mouse_events(self, events):
+        """Return the mouse events that each process needs to handle, that is
+        the ones whose position is on the process."""
+        process_events = {}
+        for event in events:
+            if event.type in (
+                GameEventType.MOUSE_LEFT_CLICK,
+                GameEventType.MOUSE_RIGHT_CLICK,
+                GameEventType.MOUSE_MOTION,
+            ):
+                for process in self._hit_test_index.items_at(*event.get_property('position')):
+                    process_events.setdefault(process, []).append(event)
+        return process_events
+
     def _update_children(self, current_time, events):
-        for scene_object in self.children:
-            scene_object.update(current_time, events)
-            if (
-                isinstance(scene_object, Process)
-                and scene_object.state == ProcessState.ENDED
-                and scene_object.view.y <= -scene_object.view.height
+        process_events = self._dispatch_mouse_events(events)
+        due = self._timer_queue.pop_due(current_time)
+
+        for scene_object in self._fixed_children:
+            if scene_object is self._io_queue and not (
+                events or self._io_queue.event_count > 0 or self._io_queue in due
             ):
-                self.children.remove(scene_object)
+                continue
+            scene_object.update(current_time, events)
+
+        # Only wake the processes whose periodic update is due, that received
+        # mouse events, or that need to follow their pages every frame.
+        # Pids follow the order in which processes were created.
+        self._last_process_update_time = current_time
+        processes = set(process_events)
+        processes.update(self._processes_updated_every_frame)
+        processes.update(key for key in due if key is not self._io_queue)
+        for process in sorted(processes, key=lambda process: process.pid):
+            process.update(current_time, process_events.get(process, []))
+            if process.state != ProcessState.ENDED:
+                self._timer_queue.schedule(process, process.next_periodic_update_time)
+
+        self._animation_manager.update()
 
     def update(self, current_time, events):
         if self._stage.stage_completed:
@@ -0,0 +1,98 @@
+import numpy # pylint: disable=import-error
+
+from constants import LAST_ALIVE_STARVATION_LEVEL
+from scene_objects.process import Process, ProcessState
+
+_STATE_CODES = {state: code for code, state in enumerate(ProcessState)}
+
+_ON_CPU_STATE_CODES = [_STATE_CODES[state] for state in (
+    ProcessState.RUNNING,
+    ProcessState.BLOCKED_ON_CPU_IO_REQUESTED,
+    ProcessState.BLOCKED_ON_CPU_IO_AVAILABLE,
+    ProcessState.BLOCKED_ON_CPU_PAGE_FAULT,
+)]
+
+_BLOCKED_STATE_CODES = [_STATE_CODES[state] for state in (
+    ProcessState.BLOCKED_ON_CPU_IO_REQUESTED,
+    ProcessState.BLOCKED_ON_CPU_IO_AVAILABLE,
+    ProcessState.BLOCKED_ON_CPU_PAGE_FAULT,
+    ProcessState.BLOCKED_OFF_CPU_IO_REQUESTED,
+    ProcessState.BLOCKED_OFF_CPU_IO_AVAILABLE,
+)]
+
+class ProcessTable:
+    """Copy of the state of the alive processes in NumPy arrays, one row per
+    process, so that the sort keys of many processes are computed at once.
+
+    The process manager writes the row of a process whenever the process
+    changes, and frees it when the process is terminated. The `Process`
+    objects remain the reference: the table gives the same sort keys as
+    their `sort_key` property.
+
+    Requires NumPy, which is only a development dependency: it is enabled
+    by the `vectorized_process_table` option of the stage config.
+    """
+
+    def __init__(self, capacity: int):
+        self._rows = {}
+        self._free_rows = list(range(capacity - 1, -1, -1))
+        self._state = numpy.zeros(capacity, dtype=numpy.int8)
+        self._starvation_level = numpy.zeros(capacity, dtype=numpy.int64)
+        self._last_update_time = numpy.zeros(capacity, dtype=numpy.float64)
+        self._last_starvation_level_change_time = numpy.zeros(capacity, dtype=numpy.float64)
+        self._time_between_starvation_levels = numpy.ones(capacity, dtype=numpy.float64)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, process: Process):
+        return process in self._rows
+
+    def add(self, process: Process, current_time):
+        """Give a row to a new process."""
+        row = self._free_rows.pop()
+        self._rows[process] = row
+        self._last_update_time[row] = current_time
+        self._time_between_starvation_levels[row] = process.time_between_starvation_levels
+        self.update(process)
+
+    def remove(self, process: Process):
+        self._free_rows.append(self._rows.pop(process))
+
+    def update(self, process: Process):
+        """Copy the state and starvation level of the process to its row."""
+        row = self._rows.get(process)
+        if row is not None:
+            self._state[row] = _STATE_CODES[process.state]
+            self._starvation_level[row] = process.starvation_level
+            self._last_starvation_level_change_time[row] = (
+                process.last_starvation_level_change_time
+            )
+
+    def set_last_update_time(self, process: Process, current_time):
+        row = self._rows.get(process)
+        if row is not None:
+            self._last_update_time[row] = current_time
+
+    def sort_keys(self, processes: [Process], last_process_update_time):
+        """Sort keys of the processes, in the same order, as computed by the
+        `sort_key` property of `Process`.
+
+        Returns:
+            list[float]: The sort keys.
+        """
+        rows = numpy.fromiter(
+            (self._rows[process] for process in processes), dtype=numpy.intp, count=len(processes)
+        )
+        last_update_time = numpy.maximum(self._last_update_time[rows], last_process_update_time)
+        starvation_level_duration = numpy.maximum(
+            last_update_time - self._last_starvation_level_change_time[rows], 0
+        )
+        keys = numpy.trunc(
+            (LAST_ALIVE_STARVATION_LEVEL - self._starvation_level[rows]) * 100000
+            - (starvation_level_duration / self._time_between_starvation_levels[rows]) * 10000
+        )
+        state = self._state[rows]
+        keys[numpy.isin(state, _BLOCKED_STATE_CODES)] = (LAST_ALIVE_STARVATION_LEVEL + 1) * 100000
+        keys[numpy.isin(state, _ON_CPU_STATE_CODES)] = numpy.inf
+        return keys.tolist()
@@ -22,6 +22,9 @@ class ScoreManager(SceneObject):
     def score(self):
         return int(self._score)
 
+    def next_update_time(self, current_time): # pylint: disable=unused-argument
+        return self._last_update_time + _UPDATE_INTERVAL
+
     def update(self, current_time, events):
         if current_time - self._last_update_time >= _UPDATE_INTERVAL:
             self._last_update_time = current_time
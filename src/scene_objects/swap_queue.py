@@ -0,0 +1,40 @@
+from collections import OrderedDict
+
+
+class SwapQueue:
+    """First-in, first-out queue of the pages waiting for a swap to start.
+
+    Pages whose swap is cancelled are removed from the queue right away,
+    so the depth of the queue is the number of pages actually waiting.
+    """
+
+    def __init__(self):
+        self._pages = OrderedDict()
+
+    def __len__(self):
+        return len(self._pages)
+
+    def __iter__(self):
+        return iter(self._pages)
+
+    def __contains__(self, page):
+        return page in self._pages
+
+    @property
+    def depth(self):
+        return len(self._pages)
+
+    def enqueue(self, page):
+        self._pages[page] = None
+
+    def enqueue_all(self, pages):
+        """Enqueue several pages at once, such as a whole row, in order."""
+        self._pages.update(dict.fromkeys(pages))
+
+    def dequeue(self):
+        """Remove and return the page that has been waiting the longest."""
+        return self._pages.popitem(last=False)[0]
+
+    def cancel(self, page):
+        """Remove the page from the queue, if it is in it."""
+        self._pages.pop(page, None)
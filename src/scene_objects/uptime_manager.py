@@ -22,6 +22,11 @@ class UptimeManager(SceneObject):
     def uptime_text(self):
         return self._uptime_text
 
+    def next_update_time(self, current_time):
+        if self._last_update_time is None:
+            return current_time
+        return self._last_update_time + ONE_SECOND
+
     def update(self, current_time, events):
         if self._last_update_time is None:
             self._last_update_time = current_time
@@ -2,6 +2,7 @@ from game_info import TITLE, VERSION, COPYRIGHT_YEAR
 from engine.modal_view import ModalView
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_XXLARGE, FONT_SECONDARY_SMALL, FONT_SECONDARY_XSMALL
+from ui.text_cache import render_text
 
 
 class AboutDialogView(ModalView):
@@ -21,38 +22,44 @@ class AboutDialogView(ModalView):
         self.about_dialog.close_button.view.y = (
             self.y + self.height - self.about_dialog.close_button.view.height - 40)
 
-        self._title_text = FONT_PRIMARY_XXLARGE.render(
-            TITLE, True, Color.WHITE)
-        self._version_text = FONT_SECONDARY_SMALL.render(
-            'Version ' + VERSION, True, Color.WHITE)
-        self._copyright_text = FONT_SECONDARY_SMALL.render(
-            '© ' + COPYRIGHT_YEAR + ' Pier-Luc Brault', True, Color.WHITE)
-        self._license_text = FONT_SECONDARY_XSMALL.render(
+        self._title_text = render_text(
+            FONT_PRIMARY_XXLARGE, TITLE, True, Color.WHITE)
+        self._version_text = render_text(
+            FONT_SECONDARY_SMALL, 'Version ' + VERSION, True, Color.WHITE)
+        self._copyright_text = render_text(
+            FONT_SECONDARY_SMALL, '© ' + COPYRIGHT_YEAR + ' Pier-Luc Brault', True, Color.WHITE)
+        self._license_text = render_text(
+            FONT_SECONDARY_XSMALL,
             'This game is published under the GNU General Public License Version 3.',
             True,
             Color.WHITE)
-        self._license_url_text = FONT_SECONDARY_XSMALL.render(
-            '<https://www.gnu.org/licenses/gpl-3.0.html>', True, Color.WHITE)
-        self._asset_credits_title = FONT_SECONDARY_XSMALL.render(
-            'Asset Credits and Licenses:', True, Color.WHITE)
+        self._license_url_text = render_text(
+            FONT_SECONDARY_XSMALL, '<https://www.gnu.org/licenses/gpl-3.0.html>', True, Color.WHITE)
+        self._asset_credits_title = render_text(
+            FONT_SECONDARY_XSMALL, 'Asset Credits and Licenses:', True, Color.WHITE)
         self._asset_credits = [
-            FONT_SECONDARY_XSMALL.render(
+            render_text(
+                FONT_SECONDARY_XSMALL,
                 'Game icon/logo: original image by Muhammat Sukirman (CC BY 3.0).',
                 True,
                 Color.WHITE),
-            FONT_SECONDARY_XSMALL.render(
+            render_text(
+                FONT_SECONDARY_XSMALL,
                 'Primary font: VT323 by Peter Hull (SIL Open Font License).',
                 True,
                 Color.WHITE),
-            FONT_SECONDARY_XSMALL.render(
+            render_text(
+                FONT_SECONDARY_XSMALL,
                 'Secondary font: Victor Mono by Rune Bjørnerås (SIL Open Font License).',
                 True,
                 Color.WHITE),
-            FONT_SECONDARY_XSMALL.render(
+            render_text(
+                FONT_SECONDARY_XSMALL,
                 'All emojis are from OpenMoji.org (CC BY-SA 4.0).',
                 True,
                 Color.WHITE),
-            FONT_SECONDARY_XSMALL.render(
+            render_text(
+                FONT_SECONDARY_XSMALL,
                 'Image in the "YOU GOT REBOOTED!" dialog is by Aleksandar Cvetanović (CC0).',
                 True,
                 Color.WHITE),
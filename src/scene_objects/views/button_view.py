@@ -3,6 +3,7 @@ import pygame
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_LARGE
+from ui.text_cache import render_text
 
 
 class ButtonView(Drawable):
@@ -11,10 +12,10 @@ class ButtonView(Drawable):
         super().__init__()
 
         self._min_width = 0
-        self._text_surface = FONT_PRIMARY_LARGE.render(
-            self._button.text.upper(), False, Color.WHITE)
-        self._text_surface_disabled = FONT_PRIMARY_LARGE.render(
-            self._button.text.upper(), False, Color.GREY)
+        self._text_surface = render_text(
+            FONT_PRIMARY_LARGE, self._button.text.upper(), False, Color.WHITE)
+        self._text_surface_disabled = render_text(
+            FONT_PRIMARY_LARGE, self._button.text.upper(), False, Color.GREY)
 
     @property
     def min_width(self):
@@ -32,6 +33,10 @@ class ButtonView(Drawable):
     def height(self):
         return self._text_surface.get_height() + 24
 
+    @property
+    def visual_state(self):
+        return self._button.disabled
+
     def draw(self, surface):
         background_color = Color.ALMOST_BLACK
         text_surface = self._text_surface
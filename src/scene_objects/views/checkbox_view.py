@@ -3,6 +3,7 @@ import pygame
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_SECONDARY_SMALL
+from ui.text_cache import render_text
 
 _checkbox_image = pygame.image.load('assets/checkbox.png')
 _label_font = FONT_SECONDARY_SMALL
@@ -14,8 +15,8 @@ _CHECKBOX_RIGHT_MARGIN = 4
 class CheckboxView(Drawable):
     def __init__(self, checkbox):
         self._checkbox = checkbox
-        self._text_surface = _label_font.render(
-            self._checkbox.text.upper(), True, Color.LIME_GREEN)
+        self._text_surface = render_text(
+            _label_font, self._checkbox.text.upper(), True, Color.LIME_GREEN)
         super().__init__()
 
     @property
@@ -26,6 +27,17 @@ class CheckboxView(Drawable):
     def height(self):
         return 16
 
+    @property
+    def bounds(self):
+        # The label is taller than the checkbox, and drawn slightly above it.
+        return pygame.Rect(
+            self._x, self._y - 2, self.width, max(self.height, self._text_surface.get_height())
+        )
+
+    @property
+    def visual_state(self):
+        return self._checkbox.checked
+
     def draw(self, surface):
         pygame.draw.rect(surface, Color.LIME_GREEN, pygame.Rect(
             self._x, self._y, _CHECKBOX_WIDTH, self.height), 2)
@@ -17,16 +17,29 @@ class CpuManagerView(Drawable):
     def height(self):
         return 0
 
-    def draw(self, surface):
-        for rectangle in self.cpu_manager.view_vars['physical_core_rectangles']:
-            pygame.draw.rect(
-                surface,
-                Color.DARK_GREY,
-                pygame.Rect(
-                    rectangle['x'],
-                    rectangle['y'],
-                    rectangle['width'],
-                    rectangle['height'],
-                ),
-                2,
+    @property
+    def _rectangles(self):
+        return [
+            pygame.Rect(
+                rectangle['x'],
+                rectangle['y'],
+                rectangle['width'],
+                rectangle['height'],
             )
+            for rectangle in self.cpu_manager.view_vars['physical_core_rectangles']
+        ]
+
+    @property
+    def bounds(self):
+        rectangles = self._rectangles
+        if not rectangles:
+            return pygame.Rect(self._x, self._y, 0, 0)
+        return rectangles[0].unionall(rectangles[1:])
+
+    @property
+    def visual_state(self):
+        return tuple(tuple(rectangle) for rectangle in self._rectangles)
+
+    def draw(self, surface):
+        for rectangle in self._rectangles:
+            pygame.draw.rect(surface, Color.DARK_GREY, rectangle, 2)
@@ -4,15 +4,17 @@ from config.cpu_config import CoreType
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_SECONDARY_XXSMALL, FONT_SECONDARY_SMALL
+from ui.text_cache import render_text
 
 
 class CpuView(Drawable):
     def __init__(self, cpu):
         self._cpu = cpu
-        self._id_text_surface = FONT_SECONDARY_XXSMALL.render(
-            'CPU ' + str(self._cpu.logical_id), False, Color.WHITE)
+        self._id_text_surface = render_text(
+            FONT_SECONDARY_XXSMALL, 'CPU ' + str(self._cpu.logical_id), False, Color.WHITE)
         if cpu.core_type != CoreType.STANDARD:
-            self._core_type_text_surface = FONT_SECONDARY_SMALL.render(
+            self._core_type_text_surface = render_text(
+                FONT_SECONDARY_SMALL,
                 'P' if cpu.core_type == CoreType.PERFORMANCE else 'E',
                 False, Color.WHITE
             )
@@ -26,6 +28,10 @@ class CpuView(Drawable):
     def height(self):
         return 64
 
+    @property
+    def visual_state(self):
+        return ()
+
     def draw(self, surface):
         pygame.draw.rect(surface, Color.WHITE, pygame.Rect(
             self._x, self._y, self.width, self.height))
@@ -1,5 +1,6 @@
 from engine.modal_view import ModalView
 from ui.fonts import FONT_SECONDARY_MEDIUM, FONT_PRIMARY_XXLARGE
+from ui.text_cache import render_text
 from ui.color import Color
 
 _OPTION_VERTICAL_SPACING = 25
@@ -9,28 +10,28 @@ class CustomSettingsDialogView(ModalView):
         self._custom_settings_dialog = custom_settings_dialog
         super().__init__()
 
-        self._title_text = FONT_PRIMARY_XXLARGE.render(
-            'Custom Settings', True, Color.WHITE)
-        self._num_cpus_label_text = FONT_SECONDARY_MEDIUM.render(
-            '# CPUs', True, Color.WHITE)
-        self._num_processes_at_startup_label_text = FONT_SECONDARY_MEDIUM.render(
-            '# Processes at startup', True, Color.WHITE)
-        self._max_processes_label_text = FONT_SECONDARY_MEDIUM.render(
-            'Max # Processes', True, Color.WHITE)
-        self._num_ram_rows_label_text = FONT_SECONDARY_MEDIUM.render(
-            '# RAM Rows', True, Color.WHITE)
-        self._swap_delay_label_text = FONT_SECONDARY_MEDIUM.render(
-            'Swap Latency', True, Color.WHITE)
-        self._parallel_swap_label_text = FONT_SECONDARY_MEDIUM.render(
-            'Parallel Swaps', True, Color.WHITE)
-        self._new_process_probability_label_text = FONT_SECONDARY_MEDIUM.render(
-            'New Process Probability', True, Color.WHITE)
-        self._priority_process_probability_label_text = FONT_SECONDARY_MEDIUM.render(
-            'Priority Process Probability', True, Color.WHITE)
-        self._io_probability_label_text = FONT_SECONDARY_MEDIUM.render(
-            'I/O Probability', True, Color.WHITE)
-        self._graceful_termination_label_text = FONT_SECONDARY_MEDIUM.render(
-            'Enable Graceful Termination', True, Color.WHITE)
+        self._title_text = render_text(
+            FONT_PRIMARY_XXLARGE, 'Custom Settings', True, Color.WHITE)
+        self._num_cpus_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, '# CPUs', True, Color.WHITE)
+        self._num_processes_at_startup_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, '# Processes at startup', True, Color.WHITE)
+        self._max_processes_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, 'Max # Processes', True, Color.WHITE)
+        self._num_ram_rows_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, '# RAM Rows', True, Color.WHITE)
+        self._swap_delay_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, 'Swap Latency', True, Color.WHITE)
+        self._parallel_swap_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, 'Parallel Swaps', True, Color.WHITE)
+        self._new_process_probability_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, 'New Process Probability', True, Color.WHITE)
+        self._priority_process_probability_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, 'Priority Process Probability', True, Color.WHITE)
+        self._io_probability_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, 'I/O Probability', True, Color.WHITE)
+        self._graceful_termination_label_text = render_text(
+            FONT_SECONDARY_MEDIUM, 'Enable Graceful Termination', True, Color.WHITE)
 
     @ModalView.x.setter
     def x(self, value):
@@ -1,6 +1,7 @@
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_SECONDARY_MEDIUM
+from ui.text_cache import render_text
 
 
 class DifficultySelectionLabelView(Drawable):
@@ -8,8 +9,8 @@ class DifficultySelectionLabelView(Drawable):
         self._difficulty_selection_label = difficulty_selection_label
         super().__init__()
 
-        self._text = FONT_SECONDARY_MEDIUM.render(
-            "Select Difficulty:", True, Color.WHITE)
+        self._text = render_text(
+            FONT_SECONDARY_MEDIUM, "Select Difficulty:", True, Color.WHITE)
 
     @property
     def width(self):
@@ -19,5 +20,9 @@ class DifficultySelectionLabelView(Drawable):
     def height(self):
         return self._text.get_height()
 
+    @property
+    def visual_state(self):
+        return ()
+
     def draw(self, surface):
         surface.blit(self._text, (self.x, self.y))
@@ -4,6 +4,7 @@ import pygame
 from engine.modal_view import ModalView
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_LARGE, FONT_PRIMARY_XXLARGE
+from ui.text_cache import render_text
 
 _shutdown_image = pygame.image.load(path.join('assets', 'shutdown.jpg'))
 
@@ -15,14 +16,14 @@ class GameOverDialogView(ModalView):
 
         self._image = _shutdown_image
 
-        self._main_text_surface = FONT_PRIMARY_XXLARGE.render(
-            'YOU GOT REBOOTED!', False, Color.WHITE)
-        self._uptime_text_surface = FONT_PRIMARY_LARGE.render(
-            'UPTIME: ' + game_over_dialog.uptime, False, Color.WHITE)
-        self._stage_name_text_surface = FONT_PRIMARY_LARGE.render(
-            game_over_dialog.stage_name.upper(), False, Color.WHITE)
-        self._score_text_surface = FONT_PRIMARY_LARGE.render(
-            'SCORE: ' + str(game_over_dialog.score), False, Color.WHITE)
+        self._main_text_surface = render_text(
+            FONT_PRIMARY_XXLARGE, 'YOU GOT REBOOTED!', False, Color.WHITE)
+        self._uptime_text_surface = render_text(
+            FONT_PRIMARY_LARGE, 'UPTIME: ' + game_over_dialog.uptime, False, Color.WHITE)
+        self._stage_name_text_surface = render_text(
+            FONT_PRIMARY_LARGE, game_over_dialog.stage_name.upper(), False, Color.WHITE)
+        self._score_text_surface = render_text(
+            FONT_PRIMARY_LARGE, 'SCORE: ' + str(game_over_dialog.score), False, Color.WHITE)
 
     @ModalView.x.setter
     def x(self, value):
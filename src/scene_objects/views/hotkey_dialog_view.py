@@ -1,6 +1,7 @@
 from engine.modal_view import ModalView
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_XXLARGE, FONT_SECONDARY_SMALL
+from ui.text_cache import render_text
 
 
 class HotkeyDialogView(ModalView):
@@ -8,43 +9,49 @@ class HotkeyDialogView(ModalView):
         self.dialog = dialog
         super().__init__()
 
-        self._title_text = FONT_PRIMARY_XXLARGE.render(
-            'Hotkeys', True, Color.WHITE)
+        self._title_text = render_text(
+            FONT_PRIMARY_XXLARGE, 'Hotkeys', True, Color.WHITE)
 
-        self._explanation_text = FONT_SECONDARY_SMALL.render(
-            'Step up your game by using these hotkeys:', True, Color.WHITE)
+        self._explanation_text = render_text(
+            FONT_SECONDARY_SMALL, 'Step up your game by using these hotkeys:', True, Color.WHITE)
 
         self._binding_keys = [
-            FONT_SECONDARY_SMALL.render('SPACEBAR', True, Color.WHITE),
-            FONT_SECONDARY_SMALL.render('1-9', True, Color.WHITE),
-            FONT_SECONDARY_SMALL.render('0', True, Color.WHITE),
-            FONT_SECONDARY_SMALL.render('SHIFT + 1-6', True, Color.WHITE),
-            FONT_SECONDARY_SMALL.render('SHIFT + Click', True, Color.WHITE),
-            FONT_SECONDARY_SMALL.render('S', True, Color.WHITE),
+            render_text(FONT_SECONDARY_SMALL, 'SPACEBAR', True, Color.WHITE),
+            render_text(FONT_SECONDARY_SMALL, '1-9', True, Color.WHITE),
+            render_text(FONT_SECONDARY_SMALL, '0', True, Color.WHITE),
+            render_text(FONT_SECONDARY_SMALL, 'SHIFT + 1-6', True, Color.WHITE),
+            render_text(FONT_SECONDARY_SMALL, 'SHIFT + Click', True, Color.WHITE),
+            render_text(FONT_SECONDARY_SMALL, 'S', True, Color.WHITE),
         ]
 
         self._binding_explanations = [
-            FONT_SECONDARY_SMALL.render(
+            render_text(
+                FONT_SECONDARY_SMALL,
                 'Process I/O events',
                 True,
                 Color.WHITE),
-            FONT_SECONDARY_SMALL.render(
+            render_text(
+                FONT_SECONDARY_SMALL,
                 'Remove process from a CPU between #1 and #9',
                 True,
                 Color.WHITE),
-            FONT_SECONDARY_SMALL.render(
+            render_text(
+                FONT_SECONDARY_SMALL,
                 'Remove process from CPU #10',
                 True,
                 Color.WHITE),
-            FONT_SECONDARY_SMALL.render(
+            render_text(
+                FONT_SECONDARY_SMALL,
                 'Remove process from a CPU between #11 and #16',
                 True,
                 Color.WHITE),
-            FONT_SECONDARY_SMALL.render(
+            render_text(
+                FONT_SECONDARY_SMALL,
                 'Swap a whole row of memory pages at once',
                 True,
                 Color.WHITE),
-            FONT_SECONDARY_SMALL.render(
+            render_text(
+                FONT_SECONDARY_SMALL,
                 'Sort Processes (once Sort button is available)',
                 True,
                 Color.WHITE),
@@ -3,6 +3,7 @@ import pygame
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_SECONDARY_SMALL
+from ui.text_cache import render_text
 from window_size import WINDOW_WIDTH, WINDOW_HEIGHT
 
 class HowToPlayPartView(Drawable):
@@ -12,7 +13,8 @@ class HowToPlayPartView(Drawable):
 
         self._text_surfaces = list(
             map(
-                lambda text: FONT_SECONDARY_SMALL.render(
+                lambda text: render_text(
+                    FONT_SECONDARY_SMALL,
                     text, True, Color.BLACK),
                 how_to_play_part.text
             )
@@ -28,6 +30,10 @@ class HowToPlayPartView(Drawable):
     def height(self):
         return WINDOW_HEIGHT
 
+    @property
+    def visual_state(self):
+        return self._how_to_play_part.current_image_id
+
     def draw(self, surface):
         surface.blit(self._images[self._how_to_play_part.current_image_id], (
             self.x +
@@ -3,6 +3,7 @@ import pygame
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_SECONDARY_XXSMALL
+from ui.text_cache import render_text
 
 
 class IoQueueView(Drawable):
@@ -18,10 +19,17 @@ class IoQueueView(Drawable):
     def height(self):
         return 32
 
+    @property
+    def visual_state(self):
+        return (self._io_queue.display_blink_color, self._io_queue.event_count)
+
     def draw(self, surface):
         color = Color.TEAL if self._io_queue.display_blink_color else Color.WHITE
         pygame.draw.rect(surface, color, pygame.Rect(
             self._x, self._y, self.width, self.height))
-        text_surface = FONT_SECONDARY_XXSMALL.render(
-            'I/O EVENTS (' + str(self._io_queue.event_count) + ')', False, Color.BLACK)
+        text_surface = render_text(
+            FONT_SECONDARY_XXSMALL,
+            'I/O EVENTS (' + str(self._io_queue.event_count) + ')',
+            False,
+            Color.BLACK)
         surface.blit(text_surface, (self._x + 20, self._y + 10))
@@ -1,6 +1,7 @@
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_MEDIUM
+from ui.text_cache import render_text
 
 _font = FONT_PRIMARY_MEDIUM
 
@@ -10,13 +11,21 @@ class LabelView(Drawable):
         self._label = label
         super().__init__()
 
+    @property
+    def _text_surface(self):
+        return render_text(_font, self._label.text, False, Color.WHITE)
+
     @property
     def width(self):
-        return _font.size(self._label.text)[0]
+        return self._text_surface.get_width()
 
     @property
     def height(self):
-        return _font.size(self._label.text)[1]
+        return self._text_surface.get_height()
+
+    @property
+    def visual_state(self):
+        return self._label.text
 
     def draw(self, surface):
-        surface.blit(_font.render(self._label.text, False, Color.WHITE), (self.x, self.y))
+        surface.blit(self._text_surface, (self.x, self.y))
@@ -4,6 +4,7 @@ import pygame
 from game_info import TITLE
 from engine.drawable import Drawable
 from ui.fonts import FONT_PRIMARY_XXLARGE
+from ui.text_cache import render_text
 from window_size import WINDOW_WIDTH
 
 _icon_image = pygame.image.load(path.join('assets', 'icon.png'))
@@ -16,7 +17,7 @@ class MainMenuTitleView(Drawable):
 
         self._icon = _icon_image
 
-        self._text = FONT_PRIMARY_XXLARGE.render(TITLE, True, (61, 154, 226))
+        self._text = render_text(FONT_PRIMARY_XXLARGE, TITLE, True, (61, 154, 226))
 
     @property
     def width(self):
@@ -26,6 +27,10 @@ class MainMenuTitleView(Drawable):
     def height(self):
         return self._icon.get_height() + self._text.get_height() + 20
 
+    @property
+    def visual_state(self):
+        return ()
+
     def draw(self, surface):
         surface.blit(self._icon, (self.x + (self.width -
                      self._icon.get_width()) / 2, self.y))
@@ -1,6 +1,7 @@
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_SECONDARY_MEDIUM
+from ui.text_cache import render_text
 
 
 class OptionSelectorView(Drawable):
@@ -13,16 +14,16 @@ class OptionSelectorView(Drawable):
         self._option_surfaces = []
         longest_option_id = 0
         for i, option in enumerate(self._option_selector.options):
-            self._option_surfaces.append(FONT_SECONDARY_MEDIUM.render(
-                option.upper(), False, Color.WHITE))
+            self._option_surfaces.append(render_text(
+                FONT_SECONDARY_MEDIUM, option.upper(), False, Color.WHITE))
             if len(option) > len(
                     self._option_selector.options[longest_option_id]):
                 longest_option_id = i
 
         self._option_error_surfaces = []
         for i, option in enumerate(self._option_selector.options):
-            self._option_error_surfaces.append(FONT_SECONDARY_MEDIUM.render(
-                option.upper(), False, Color.RED))
+            self._option_error_surfaces.append(render_text(
+                FONT_SECONDARY_MEDIUM, option.upper(), False, Color.RED))
 
         self._max_text_width = self._option_surfaces[longest_option_id].get_width(
         )
@@ -64,6 +65,12 @@ class OptionSelectorView(Drawable):
         return max(self._text_height,
                    self._option_selector.previous_button.view.height)
 
+    @property
+    def visual_state(self):
+        return (
+            self._option_selector.selected_option_id, self._option_selector.in_error
+        )
+
     def draw(self, surface):
         text_surface = self._option_surfaces[self._option_selector.selected_option_id]
         if self._option_selector.in_error:
@@ -1,6 +1,9 @@
+import pygame
+
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_LARGE
+from ui.text_cache import render_text
 from window_size import WINDOW_HEIGHT
 
 
@@ -9,10 +12,10 @@ class PageManagerView(Drawable):
         self._page_manager = page_manager
         super().__init__()
 
-        self._pages_in_ram_text_surface = FONT_PRIMARY_LARGE.render(
-            'Memory Pages in RAM :', False, Color.WHITE)
-        self._pages_on_disk_space_text_surface = FONT_PRIMARY_LARGE.render(
-            'Memory Pages on Disk :', False, Color.WHITE)
+        self._pages_in_ram_text_surface = render_text(
+            FONT_PRIMARY_LARGE, 'Memory Pages in RAM :', False, Color.WHITE)
+        self._pages_on_disk_space_text_surface = render_text(
+            FONT_PRIMARY_LARGE, 'Memory Pages on Disk :', False, Color.WHITE)
 
     @property
     def width(self):
@@ -22,6 +25,27 @@ class PageManagerView(Drawable):
     def height(self):
         return WINDOW_HEIGHT
 
+    @property
+    def bounds(self):
+        # The labels are drawn next to the page slots, not at the position of the view.
+        label_rects = [pygame.Rect(
+            self._page_manager.view_vars['pages_in_ram_label_xy'],
+            self._pages_in_ram_text_surface.get_size()
+        )]
+        if self._page_manager.view_vars['pages_on_disk_label_xy'] is not None:
+            label_rects.append(pygame.Rect(
+                self._page_manager.view_vars['pages_on_disk_label_xy'],
+                self._pages_on_disk_space_text_surface.get_size()
+            ))
+        return label_rects[0].unionall(label_rects[1:])
+
+    @property
+    def visual_state(self):
+        return (
+            self._page_manager.view_vars['pages_in_ram_label_xy'],
+            self._page_manager.view_vars['pages_on_disk_label_xy'],
+        )
+
     def draw(self, surface):
         surface.blit(self._pages_in_ram_text_surface,
                      self._page_manager.view_vars['pages_in_ram_label_xy'])
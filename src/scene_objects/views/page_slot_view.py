@@ -13,5 +13,9 @@ class PageSlotView(Drawable):
     def height(self):
         return 32
 
+    @property
+    def visual_state(self):
+        return ()
+
     def draw(self, surface):
         pass
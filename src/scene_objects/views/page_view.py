@@ -3,13 +3,14 @@ import pygame
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_SECONDARY_XXXSMALL
+from ui.text_cache import render_text
 
 
 class PageView(Drawable):
     def __init__(self, page):
         self._page = page
-        self._pid_text_surface = FONT_SECONDARY_XXXSMALL.render(
-            'PID ' + str(self._page.pid), False, Color.BLACK)
+        self._pid_text_surface = render_text(
+            FONT_SECONDARY_XXXSMALL, 'PID ' + str(self._page.pid), False, Color.BLACK)
         super().__init__()
 
     @property
@@ -20,20 +21,37 @@ class PageView(Drawable):
     def height(self):
         return 32
 
-    def draw(self, surface):
-        color = Color.DARK_GREY
+    @property
+    def _color(self):
         if self._page.swap_requested:
-            color = Color.TEAL
-        elif self._page.display_blink_color:
-            color = Color.BLUE
-        elif self._page.in_use:
-            color = Color.WHITE
-        pygame.draw.rect(surface, color, pygame.Rect(
+            return Color.TEAL
+        if self._page.display_blink_color:
+            return Color.BLUE
+        if self._page.in_use:
+            return Color.WHITE
+        return Color.DARK_GREY
+
+    @property
+    def _progress_bar_width(self):
+        if self._page.swap_in_progress:
+            return (self.width - 4) * self._page.swap_percentage_completed
+        return None
+
+    @property
+    def visual_state(self):
+        progress_bar_width = self._progress_bar_width
+        return (
+            self._color,
+            None if progress_bar_width is None else int(progress_bar_width)
+        )
+
+    def draw(self, surface):
+        pygame.draw.rect(surface, self._color, pygame.Rect(
             self._x, self._y, self.width, self.height))
         surface.blit(self._pid_text_surface, (self._x + 1, self._y + 5))
 
-        if self._page.swap_in_progress:
-            progress_bar_width = (self.width - 4) * self._page.swap_percentage_completed
+        progress_bar_width = self._progress_bar_width
+        if progress_bar_width is not None:
             progress_bar_height = 2
             pygame.draw.rect(surface, Color.BLACK, pygame.Rect(
                 self._x + 2,
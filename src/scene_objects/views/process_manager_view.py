@@ -1,6 +1,7 @@
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_LARGE
+from ui.text_cache import render_text
 from scene_objects.views.process_view import ProcessView
 from window_size import WINDOW_WIDTH, WINDOW_HEIGHT
 
@@ -10,8 +11,8 @@ class ProcessManagerView(Drawable):
         self._process_manager = process_manager
         super().__init__()
 
-        self._idle_processes_text_surface = FONT_PRIMARY_LARGE.render(
-            'Idle Processes :', False, Color.WHITE)
+        self._idle_processes_text_surface = render_text(
+            FONT_PRIMARY_LARGE, 'Idle Processes :', False, Color.WHITE)
         self._process_view_height = ProcessView.height
 
     @property
@@ -22,11 +23,18 @@ class ProcessManagerView(Drawable):
     def height(self):
         return WINDOW_HEIGHT
 
+    @property
+    def visual_state(self):
+        return (
+            self._process_manager.user_terminated_process_count,
+            self._process_manager.max_processes_terminated_by_user,
+        )
+
     def draw(self, surface):
         terminated_processes_text = f'User Ragequits ({self._process_manager.user_terminated_process_count} / {self._process_manager.max_processes_terminated_by_user}) :' # pylint: disable=line-too-long
 
-        terminated_processes_text_surface = FONT_PRIMARY_LARGE.render(
-            terminated_processes_text, False, Color.WHITE)
+        terminated_processes_text_surface = render_text(
+            FONT_PRIMARY_LARGE, terminated_processes_text, False, Color.WHITE)
 
         surface.blit(self._idle_processes_text_surface, (50, 120))
         surface.blit(terminated_processes_text_surface, (
@@ -13,5 +13,9 @@ class ProcessSlotView(Drawable):
     def height(self):
         return 64
 
+    @property
+    def visual_state(self):
+        return ()
+
     def draw(self, surface):
         pass
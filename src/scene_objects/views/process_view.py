@@ -6,6 +6,7 @@ from constants import LAST_ALIVE_STARVATION_LEVEL
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_SECONDARY_XXSMALL
+from ui.text_cache import render_text
 
 _starvation_colors = [
     Color.GREEN,
@@ -47,52 +48,66 @@ class ProcessView(Drawable):
         self._process = process
         self._target_x = None
         self._target_y = None
-        self._pid_text_surface = FONT_SECONDARY_XXSMALL.render(
-            'PID ' + str(self._process.pid), False, Color.BLACK)
+        self._pid_text_surface = render_text(
+            FONT_SECONDARY_XXSMALL, 'PID ' + str(self._process.pid), False, Color.BLACK)
         super().__init__()
 
-    def draw(self, surface):
-        if self._process.has_ended_gracefully:
-            color = Color.LIGHT_BLUE
-            starvation_emoji_surface = _gracefully_terminated_emoji
-        else:
-            color = _starvation_colors[self._process.starvation_level]
-            starvation_emoji_surface = _starvation_emojis[self._process.starvation_level]
-
+    @property
+    def _color(self):
         if self._process.display_blink_color:
-            color = Color.BLUE
-
-        pygame.draw.rect(surface, color, pygame.Rect(
-            self._x, self._y, self.width, self.height))
-        surface.blit(starvation_emoji_surface, (self._x, self._y + 2))
-        surface.blit(self._pid_text_surface, (self._x + 28, self._y + 5))
+            return Color.BLUE
+        if self._process.has_ended_gracefully:
+            return Color.LIGHT_BLUE
+        return _starvation_colors[self._process.starvation_level]
 
-        if self._process.is_waiting_for_io:
-            surface.blit(_waiting_for_io_emoji, (self._x + 32, self._y + 32))
+    @property
+    def _starvation_emoji_surface(self):
+        if self._process.has_ended_gracefully:
+            return _gracefully_terminated_emoji
+        return _starvation_emojis[self._process.starvation_level]
 
+    @property
+    def _progress_bar_width(self):
         if self._process.is_progressing_to_happiness:
-            progress_bar_width = min(
+            return min(
                     (self.width - 4),
                     (self.width - 4)
                         - (self._process.cpu.process_happiness_ms
                             - self._process.current_state_duration)
                         * (self.width - 4) / self._process.cpu.process_happiness_ms,
                 )
-            progress_bar_height = 2
-            pygame.draw.rect(surface, Color.BLUE, pygame.Rect(
-                self._x + 2,
-                self._y + self.height - 4,
-                progress_bar_width,
-                progress_bar_height
-            ))
-        elif (
+        if (
             self._process.starvation_level == LAST_ALIVE_STARVATION_LEVEL
             and self._process.state != self._process.ProcessState.RUNNING
         ):
-            progress_bar_width = (
+            return (
                 self._process.time_to_termination
                 / self._process.time_between_starvation_levels
             ) * (self.width - 4)
+        return None
+
+    @property
+    def visual_state(self):
+        progress_bar_width = self._progress_bar_width
+        return (
+            self._color,
+            self._process.has_ended_gracefully,
+            self._process.starvation_level,
+            self._process.is_waiting_for_io,
+            None if progress_bar_width is None else int(progress_bar_width),
+        )
+
+    def draw(self, surface):
+        pygame.draw.rect(surface, self._color, pygame.Rect(
+            self._x, self._y, self.width, self.height))
+        surface.blit(self._starvation_emoji_surface, (self._x, self._y + 2))
+        surface.blit(self._pid_text_surface, (self._x + 28, self._y + 5))
+
+        if self._process.is_waiting_for_io:
+            surface.blit(_waiting_for_io_emoji, (self._x + 32, self._y + 32))
+
+        progress_bar_width = self._progress_bar_width
+        if progress_bar_width is not None:
             progress_bar_height = 2
             pygame.draw.rect(surface, Color.BLUE, pygame.Rect(
                 self._x + 2,
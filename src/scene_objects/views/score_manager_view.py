@@ -1,6 +1,7 @@
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_MEDIUM
+from ui.text_cache import render_text
 
 
 class ScoreManagerView(Drawable):
@@ -8,23 +9,25 @@ class ScoreManagerView(Drawable):
         self._score_manager = score_manager
         super().__init__()
 
+    @property
+    def _text_surface(self):
+        return render_text(
+            FONT_PRIMARY_MEDIUM,
+            'Score: ' + format(self._score_manager.score, '09'),
+            False,
+            Color.WHITE)
+
     @property
     def width(self):
-        return FONT_PRIMARY_MEDIUM.size(
-            'Score: ' + format(self._score_manager.score, '09'))[0]
+        return self._text_surface.get_width()
 
     @property
     def height(self):
-        return FONT_PRIMARY_MEDIUM.size(
-            'Score: ' + format(self._score_manager.score, '09'))[1]
+        return self._text_surface.get_height()
+
+    @property
+    def visual_state(self):
+        return self._score_manager.score
 
     def draw(self, surface):
-        surface.blit(
-            FONT_PRIMARY_MEDIUM.render(
-                'Score: ' +
-                format(
-                    self._score_manager.score,
-                    '09'),
-                False,
-                Color.WHITE),
-            (self.x, self.y))
+        surface.blit(self._text_surface, (self.x, self.y))
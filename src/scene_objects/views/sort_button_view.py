@@ -3,6 +3,7 @@ import pygame
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_LARGE
+from ui.text_cache import render_text
 
 
 class SortButtonView(Drawable):
@@ -11,10 +12,10 @@ class SortButtonView(Drawable):
         super().__init__()
 
         self._min_width = 0
-        self._text_surface = FONT_PRIMARY_LARGE.render(
-            self._button.text.upper(), False, Color.BLACK)
-        self._text_surface_disabled = FONT_PRIMARY_LARGE.render(
-            self._button.text.upper(), False, Color.GREY)
+        self._text_surface = render_text(
+            FONT_PRIMARY_LARGE, self._button.text.upper(), False, Color.BLACK)
+        self._text_surface_disabled = render_text(
+            FONT_PRIMARY_LARGE, self._button.text.upper(), False, Color.GREY)
 
     @property
     def min_width(self):
@@ -32,6 +33,12 @@ class SortButtonView(Drawable):
     def height(self):
         return self._text_surface.get_height()
 
+    @property
+    def visual_state(self):
+        return (
+            self._button.visible, self._button.blinking_hidden, self._button.disabled
+        )
+
     def draw(self, surface):
         if self._button.visible and not self._button.blinking_hidden:
             background_color = Color.LIGHT_BLUE
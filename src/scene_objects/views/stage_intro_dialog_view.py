@@ -7,6 +7,7 @@ from ui.color import Color
 from ui.fonts import (
     FONT_PRIMARY_XLARGE, FONT_PRIMARY_LARGE, FONT_PRIMARY_MEDIUM,
 )
+from ui.text_cache import render_text
 
 _BADGE_SIZE = 64
 _BADGE_SPACING = 16
@@ -29,18 +30,18 @@ class StageIntroDialogView(ModalView):
     def __init__(self, dialog):
         self._dialog = dialog
         super().__init__()
-        self._title_surface = FONT_PRIMARY_XLARGE.render(
-            self._dialog.title, True, Color.WHITE)
+        self._title_surface = render_text(
+            FONT_PRIMARY_XLARGE, self._dialog.title, True, Color.WHITE)
         self._section_headings = []
         self._section_items = []
         for section in self._dialog.sections:
-            heading_surface = FONT_PRIMARY_LARGE.render(
-                section.heading, True, Color.WHITE)
+            heading_surface = render_text(
+                FONT_PRIMARY_LARGE, section.heading, True, Color.WHITE)
             self._section_headings.append(heading_surface)
             items = []
             for item in section.items:
-                item_surface = FONT_PRIMARY_MEDIUM.render(
-                    '\u2022 ' + item, True, Color.WHITE)
+                item_surface = render_text(
+                    FONT_PRIMARY_MEDIUM, '\u2022 ' + item, True, Color.WHITE)
                 items.append(item_surface)
             self._section_items.append(items)
         self._badge_surfaces = []
@@ -59,8 +60,8 @@ class StageIntroDialogView(ModalView):
             surface.blit(_crown, (2, 34))
         if badge.text.startswith('<'):
             digits = badge.text[1:]
-            num_surface = FONT_PRIMARY_XLARGE.render(
-                digits, True, Color.LIME_GREEN)
+            num_surface = render_text(
+                FONT_PRIMARY_XLARGE, digits, True, Color.LIME_GREEN)
             num_y = (_BADGE_SIZE - num_surface.get_height()) // 2
             lt_w = 8
             lt_h = 12
@@ -83,8 +84,8 @@ class StageIntroDialogView(ModalView):
                 num_surface,
                 (lt_right_x + _BADGE_LT_SPACING, num_y))
         else:
-            number_surface = FONT_PRIMARY_XLARGE.render(
-                badge.text, True, Color.LIME_GREEN)
+            number_surface = render_text(
+                FONT_PRIMARY_XLARGE, badge.text, True, Color.LIME_GREEN)
             surface.blit(number_surface, (
                 _BADGE_SIZE - number_surface.get_width() - 4,
                 (_BADGE_SIZE - number_surface.get_height()) // 2,
@@ -92,8 +93,8 @@ class StageIntroDialogView(ModalView):
         return surface
 
     def _render_timer_badge(self, badge):
-        label_surface = FONT_PRIMARY_MEDIUM.render(
-            f'{badge.minutes} min.', True, Color.WHITE)
+        label_surface = render_text(
+            FONT_PRIMARY_MEDIUM, f'{badge.minutes} min.', True, Color.WHITE)
         width = max(_timer.get_width(), label_surface.get_width())
         height = _timer.get_height() + _TIMER_LABEL_SPACING + label_surface.get_height()
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
@@ -5,6 +5,7 @@ import pygame
 from engine.modal_view import ModalView
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_LARGE, FONT_PRIMARY_XXLARGE
+from ui.text_cache import render_text
 
 _image = pygame.image.load(path.join('assets', 'story_stage_victory.png'))
 
@@ -25,14 +26,14 @@ class StoryStageVictoryDialogView(ModalView):
 
         self._image = pygame.transform.scale(_image, (_IMAGE_SIZE, _IMAGE_SIZE))
 
-        self._title_surface = FONT_PRIMARY_XXLARGE.render(
-            'VICTORY!', False, Color.WHITE)
-        self._stage_surface = FONT_PRIMARY_LARGE.render(
-            dialog.stage_name.upper(), False, Color.WHITE)
-        self._uptime_surface = FONT_PRIMARY_LARGE.render(
-            'UPTIME: ' + dialog.uptime, False, Color.WHITE)
-        self._score_surface = FONT_PRIMARY_LARGE.render(
-            'SCORE: ' + str(dialog.score), False, Color.WHITE)
+        self._title_surface = render_text(
+            FONT_PRIMARY_XXLARGE, 'VICTORY!', False, Color.WHITE)
+        self._stage_surface = render_text(
+            FONT_PRIMARY_LARGE, dialog.stage_name.upper(), False, Color.WHITE)
+        self._uptime_surface = render_text(
+            FONT_PRIMARY_LARGE, 'UPTIME: ' + dialog.uptime, False, Color.WHITE)
+        self._score_surface = render_text(
+            FONT_PRIMARY_LARGE, 'SCORE: ' + str(dialog.score), False, Color.WHITE)
 
         stats_row_width = (
             self._uptime_surface.get_width()
@@ -1,6 +1,7 @@
 from engine.drawable import Drawable
 from ui.color import Color
 from ui.fonts import FONT_PRIMARY_MEDIUM
+from ui.text_cache import render_text
 
 
 class UptimeManagerView(Drawable):
@@ -8,21 +9,25 @@ class UptimeManagerView(Drawable):
         self._uptime_manager = uptime_manager
         super().__init__()
 
+    @property
+    def _text_surface(self):
+        return render_text(
+            FONT_PRIMARY_MEDIUM,
+            'Uptime : ' + self._uptime_manager.uptime_text,
+            False,
+            Color.WHITE)
+
     @property
     def width(self):
-        return FONT_PRIMARY_MEDIUM.size(
-            'Uptime : ' + self._uptime_manager.uptime_text)[0]
+        return self._text_surface.get_width()
 
     @property
     def height(self):
-        return FONT_PRIMARY_MEDIUM.size(
-            'Uptime : ' + self._uptime_manager.uptime_text)[1]
+        return self._text_surface.get_height()
+
+    @property
+    def visual_state(self):
+        return self._uptime_manager.uptime_text
 
     def draw(self, surface):
-        surface.blit(
-            FONT_PRIMARY_MEDIUM.render(
-                'Uptime : ' +
-                self._uptime_manager.uptime_text,
-                False,
-                Color.WHITE),
-            (self.x, self.y))
+        surface.blit(self._text_surface, (self.x, self.y))
@@ -1,10 +1,13 @@
 import sys
 from enum import Enum, auto
+from math import inf
 from os.path import dirname, abspath
+import warnings
 
 from constants import ONE_SECOND
-import game_monitor
 from engine.scene import Scene
+from engine.random import RandomStreams
+from game_monitor import GameMonitor
 from scene_objects.button import Button
 from scene_objects.game_over_dialog import GameOverDialog
 from scene_objects.in_game_menu_dialog import InGameMenuDialog
@@ -66,8 +69,16 @@ class Stage(Scene):
         self._config = config
         self._script = script
         self._script_callback = None
+        self._script_accepts_current_time = False
+        self._last_script_call_time = 0
+        self._dropped_event_count = 0
         self._standalone = standalone
+        self._scheduler = None
+        self._event_recorder = None
+        self._seed = None
 
+        self._random_streams = None
+        self._game_monitor = None
         self._process_manager = None
         self._page_manager = None
 
@@ -91,7 +102,11 @@ class Stage(Scene):
         self._last_update_time = 0
         self._last_state_change_time = None
         self._defeat_reason = None
+        self._last_script_call_time = 0
+        self._dropped_event_count = 0
 
+        self._random_streams = RandomStreams(self._seed)
+        self._game_monitor = GameMonitor()
         self._process_manager = ProcessManager(self, self._config)
         self._page_manager = PageManager(self, self._config)
 
@@ -153,6 +168,10 @@ class Stage(Scene):
     def state(self):
         return self._state
 
+    @property
+    def last_update_time(self):
+        return self._last_update_time
+
     @property
     def stage_completed(self):
         return self._state in (
@@ -161,6 +180,51 @@ class Stage(Scene):
             StageState.ENDED,
         )
 
+    @property
+    def game_monitor(self):
+        return self._game_monitor
+
+    @property
+    def random_streams(self):
+        return self._random_streams
+
+    @property
+    def seed(self):
+        """Seed of the random streams of the stage, to make its runs reproducible,
+        or None to seed them from a source of randomness.
+        Takes effect when the stage is set up."""
+        return self._seed
+
+    @seed.setter
+    def seed(self, value):
+        self._seed = value
+
+    @property
+    def scheduler(self):
+        """Callable to use as the scheduler of the automation script, instead of
+        the one defined by the script, such as the one replaying a recorded run.
+        Takes effect when the stage is set up."""
+        return self._scheduler
+
+    @scheduler.setter
+    def scheduler(self, scheduler):
+        self._scheduler = scheduler
+
+    @property
+    def dropped_event_count(self):
+        """Number of game events dropped since the stage was set up, because
+        the automation script did not read them before the buffer was full."""
+        return self._dropped_event_count
+
+    @property
+    def event_recorder(self):
+        """Recorder of the events passed to the automation script and of its actions."""
+        return self._event_recorder
+
+    @event_recorder.setter
+    def event_recorder(self, event_recorder: 'EventRecorder'):
+        self._event_recorder = event_recorder
+
     @property
     def process_manager(self):
         return self._process_manager
@@ -173,6 +237,10 @@ class Stage(Scene):
     def uptime_manager(self):
         return self._uptime_manager
 
+    @property
+    def score_manager(self):
+        return self._score_manager
+
     def check_victory(self) -> bool:
         """
         This method is called each frame to check if the victory conditions have been met.
@@ -241,13 +309,29 @@ class Stage(Scene):
     def _get_script_events(self):
         if self._script_callback is None:
             return []
-        events = self._script_callback(game_monitor.get_events())
-        game_monitor.clear_events()
+        self._last_script_call_time = self._last_update_time
+        dropped_event_count = self._game_monitor.dropped_event_count
+        if dropped_event_count > 0:
+            if self._dropped_event_count == 0:
+                warnings.warn(
+                    f'{self.name}: game events were dropped before the automation script '
+                    'could read them', RuntimeWarning)
+            self._dropped_event_count += dropped_event_count
+        if self._event_recorder is not None:
+            self._event_recorder.record_events(self._last_update_time, self._game_monitor)
+        game_events = self._game_monitor.get_events()
+        if self._script_accepts_current_time:
+            events = self._script_callback(game_events, self._last_update_time)
+        else:
+            events = self._script_callback(game_events)
+        self._game_monitor.clear_events()
         return events
 
     def _process_script_events(self):
         for event in self._get_script_events():
             try:
+                if self._event_recorder is not None:
+                    self._event_recorder.record_action(self._last_update_time, event)
                 if event['type'] == 'io_queue':
                     self._process_manager.io_queue.handle_player_action()
                 elif event['type'] == 'process':
@@ -264,10 +348,21 @@ class Stage(Scene):
                 print(exc.__class__.__name__, *exc.args, event, file=sys.stderr)
 
     def _prepare_automation_script(self):
-        # pylint: disable=exec-used
         self._script_callback = None
-        if self._script is None:
-            return
+        self._script_accepts_current_time = False
+        if self._scheduler is not None:
+            self._script_callback = self._scheduler
+        elif self._script is not None:
+            self._script_callback = self._load_automation_script()
+        if self._script_callback is not None:
+            # Game objects only record events while there is a scheduler to read them.
+            self._game_monitor.set_enabled(True)
+            # Only schedulers that opt in, as automation.Scheduler does, get the time.
+            self._script_accepts_current_time = (
+                getattr(self._script_callback, 'accepts_current_time', False) is True)
+
+    def _load_automation_script(self):
+        # pylint: disable=exec-used
 
         # Add project root to sys.path so scripts can import from automation package
         project_root = dirname(dirname(abspath(self._script.co_filename)))
@@ -290,10 +385,47 @@ class Stage(Scene):
                 )
 
         exec(self._script, script_globals)
-        try:
-            self._script_callback = script_globals['scheduler']
-        except KeyError:
-            pass
+        return script_globals.get('scheduler')
+
+    def _next_script_call_time(self, current_time):
+        if self._script_callback is None:
+            return inf
+        if self._game_monitor.has_events():
+            return current_time
+        wakeup_interval_ms = getattr(self._script_callback, 'wakeup_interval_ms', 0)
+        if wakeup_interval_ms is None:
+            return inf
+        return self._last_script_call_time + wakeup_interval_ms
+
+    def next_update_time(self, current_time):
+        """
+        Returns the earliest time at which an update may change the stage, so that
+        idle frames can be skipped when the stage is simulated headlessly.
+        The automation script is considered idle only if it has no pending events and
+        declares a `wakeup_interval_ms` attribute (see `automation.Scheduler`).
+        Conditions in `check_victory` and `check_defeat` are checked whenever the uptime
+        changes. Override in a subclass if they depend on anything else that changes over time.
+        """
+        if self.modal is not None:
+            return current_time
+        if self._state == StageState.PLAYING:
+            next_script_call_time = self._next_script_call_time(current_time)
+            if next_script_call_time <= current_time:
+                # The script is called on this frame (every frame if its
+                # wakeup interval is 0): no need to ask the game objects.
+                return current_time
+            return min(
+                next_script_call_time,
+                self._process_manager.next_update_time(current_time),
+                self._page_manager.next_update_time(current_time),
+                self._score_manager.next_update_time(current_time),
+                self._uptime_manager.next_update_time(current_time),
+            )
+        if self._state in (StageState.VICTORY, StageState.DEFEAT):
+            return self._last_state_change_time + ONE_SECOND + 1
+        if self._state == StageState.ENDED:
+            return inf
+        return current_time
 
     def apply_state_transition(self, event: StateEvent):
         transitions = self._state_transitions.get(self._state, {})
@@ -0,0 +1,92 @@
+from engine.animation_manager import AnimationManager
+from engine.drawable import Drawable
+
+
+class StubDrawable(Drawable):
+    width = 10
+    height = 10
+
+    def draw(self, surface):
+        pass
+
+
+class TestAnimationManager:
+    def test_moves_drawable_to_target(self):
+        animation_manager = AnimationManager()
+        drawable = StubDrawable(0, 0)
+        animation_manager.register(drawable, 10)
+
+        assert not animation_manager.is_animating
+
+        drawable.set_target_xy(25, 25)
+        assert animation_manager.is_animating
+        assert animation_manager.is_moving(drawable)
+
+        animation_manager.update()
+        assert (drawable.x, drawable.y) == (10, 10)
+        animation_manager.update()
+        assert (drawable.x, drawable.y) == (20, 20)
+        animation_manager.update()
+        assert (drawable.x, drawable.y) == (25, 25)
+
+        assert not animation_manager.is_animating
+        assert drawable.target_x is None
+        assert drawable.target_y is None
+
+    def test_only_moving_drawables_are_advanced(self):
+        animation_manager = AnimationManager()
+        moving = StubDrawable(0, 0)
+        stationary = StubDrawable(0, 0)
+        animation_manager.register(moving, 10)
+        animation_manager.register(stationary, 10)
+
+        moving.target_x = 100
+        animation_manager.update()
+
+        assert animation_manager.is_moving(moving)
+        assert not animation_manager.is_moving(stationary)
+        assert (moving.x, stationary.x) == (10, 0)
+
+    def test_clearing_target_stops_motion(self):
+        animation_manager = AnimationManager()
+        drawable = StubDrawable(0, 0)
+        animation_manager.register(drawable, 10)
+
+        drawable.set_target_xy(100, 100)
+        animation_manager.update()
+        drawable.set_target_xy(None, None)
+
+        assert not animation_manager.is_animating
+        animation_manager.update()
+        assert (drawable.x, drawable.y) == (10, 10)
+
+    def test_on_complete_is_called_on_arrival(self):
+        completed = []
+        animation_manager = AnimationManager()
+        drawable = StubDrawable(0, 0)
+        animation_manager.register(drawable, 10, on_complete=completed.append)
+
+        drawable.target_y = 20
+        animation_manager.update()
+        assert not completed
+        animation_manager.update()
+        assert completed == [drawable]
+
+        # A target set on one axis only is cleared on the next update.
+        assert animation_manager.is_moving(drawable)
+        animation_manager.update()
+        assert not animation_manager.is_moving(drawable)
+        assert completed == [drawable]
+
+    def test_unregister(self):
+        animation_manager = AnimationManager()
+        drawable = StubDrawable(0, 0)
+        animation_manager.register(drawable, 10)
+        drawable.target_x = 100
+
+        animation_manager.unregister(drawable)
+
+        assert drawable not in animation_manager
+        assert not animation_manager.is_animating
+        drawable.target_x = 200
+        assert not animation_manager.is_animating
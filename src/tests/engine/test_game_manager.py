@@ -0,0 +1,136 @@
+import pytest
+
+from engine.game_manager import GameManager
+from engine.scene import Scene
+from engine.window_config import WindowConfig
+from window_size import WINDOW_SIZE
+
+
+class UpdateTrackingScene(Scene):
+    def __init__(self):
+        super().__init__('test')
+        self.update_times = []
+        self.render_call_count = 0
+
+    def setup(self):
+        self._scene_objects = []
+
+    def update(self, current_time, events):
+        self.update_times.append(current_time)
+
+    def render(self):
+        self.render_call_count += 1
+
+
+class IdleScene(UpdateTrackingScene):
+    def __init__(self, active_times):
+        super().__init__()
+        self.active_times = active_times
+
+    def next_update_time(self, current_time):
+        return min(
+            (time for time in self.active_times if time > current_time),
+            default=float('inf')
+        )
+
+
+class TestGameManagerSimulate:
+    @pytest.fixture
+    def scene(self):
+        return UpdateTrackingScene()
+
+    @pytest.fixture
+    def game_manager(self, scene):
+        game_manager = GameManager()
+        game_manager.window_config = WindowConfig(WINDOW_SIZE, 'Test', 'icon.png')
+        game_manager.startup_scene = scene
+        return game_manager
+
+    def test_updates_from_virtual_clock(self, game_manager, scene):
+        game_manager.simulate(100, step_ms=20)
+
+        assert scene.update_times == [0, 20, 40, 60, 80, 100]
+
+    def test_default_step_is_one_frame(self, game_manager, scene):
+        game_manager.simulate(1000)
+
+        assert scene.update_times[1] == 1000 // GameManager.fps
+
+    def test_returns_time_of_last_update(self, game_manager):
+        assert game_manager.simulate(110, step_ms=20) == 100
+
+    def test_scene_is_not_rendered(self, game_manager, scene):
+        game_manager.simulate(1000)
+
+        assert scene.render_call_count == 0
+
+    def test_scene_is_rendered_when_requested(self, game_manager, scene):
+        game_manager.simulate(100, step_ms=20, render=True)
+
+        assert scene.render_call_count == 6
+
+    def test_on_frame_is_called_after_each_frame(self, game_manager, scene):
+        frames = []
+        game_manager.simulate(
+            40, step_ms=20, on_frame=lambda time: frames.append((time, len(scene.update_times))))
+
+        assert frames == [(0, 1), (20, 2), (40, 3)]
+
+    def test_stops_when_stop_condition_is_met(self, game_manager, scene):
+        game_manager.simulate(1000, step_ms=10, stop_condition=lambda: len(scene.update_times) == 3)
+
+        assert scene.update_times == [0, 10, 20]
+
+    def test_scene_has_screen(self, game_manager, scene):
+        game_manager.simulate(0)
+
+        assert scene.screen.get_size() == WINDOW_SIZE
+
+    def test_requires_startup_scene(self):
+        game_manager = GameManager()
+        game_manager.window_config = WindowConfig(WINDOW_SIZE, 'Test', 'icon.png')
+
+        with pytest.raises(ValueError):
+            game_manager.simulate(1000)
+
+
+class TestGameManagerSimulateSkippingIdleFrames:
+    def _simulate(self, scene, time_limit_ms, step_ms=10):
+        game_manager = GameManager()
+        game_manager.window_config = WindowConfig(WINDOW_SIZE, 'Test', 'icon.png')
+        game_manager.startup_scene = scene
+        return game_manager.simulate(time_limit_ms, step_ms=step_ms, skip_idle_frames=True)
+
+    def test_jumps_to_next_update_time(self):
+        scene = IdleScene([100])
+
+        self._simulate(scene, 100)
+
+        assert scene.update_times == [0, 90, 100]
+
+    def test_rounds_up_to_next_frame(self):
+        scene = IdleScene([55, 100])
+
+        self._simulate(scene, 100)
+
+        assert scene.update_times == [0, 50, 60, 90, 100]
+
+    def test_does_not_skip_when_next_frame_is_due(self):
+        scene = IdleScene([10, 20, 30])
+
+        self._simulate(scene, 30)
+
+        assert scene.update_times == [0, 10, 20, 30]
+
+    def test_returns_last_frame_time_when_idle_until_time_limit(self):
+        scene = IdleScene([])
+
+        assert self._simulate(scene, 105) == 100
+        assert scene.update_times == [0]
+
+    def test_default_scene_does_not_skip_frames(self):
+        scene = UpdateTrackingScene()
+
+        self._simulate(scene, 50)
+
+        assert scene.update_times == [0, 10, 20, 30, 40, 50]
@@ -0,0 +1,123 @@
+import pygame
+import pytest
+
+from engine import profiler
+from engine.drawable import Drawable
+from engine.scene_object import SceneObject
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+    def advance(self, seconds):
+        self.time += seconds
+
+clock = FakeClock()
+
+
+class SlowView(Drawable):
+    width = 10
+    height = 10
+
+    def draw(self, surface):
+        clock.advance(0.25)
+
+
+class ParentObject(SceneObject):
+    def update(self, current_time, events):
+        clock.advance(1)
+        super().update(current_time, events)
+
+
+class ChildObject(SceneObject):
+    def update(self, current_time, events):
+        clock.advance(2)
+
+
+class TestProfiler:
+    @pytest.fixture(autouse=True)
+    def profiling(self):
+        profiler.enable(clock=clock)
+        yield
+        profiler.disable()
+        profiler.reset()
+
+    @pytest.fixture
+    def parent(self):
+        parent = ParentObject(SlowView())
+        parent.children.append(ChildObject(SlowView()))
+        return parent
+
+    def test_counts_calls_per_class(self, parent):
+        parent.update(0, [])
+        parent.update(16, [])
+        parent.render(pygame.Surface((10, 10)))
+
+        stats = profiler.get_stats()
+        assert stats[('ParentObject', 'update')].calls == 2
+        assert stats[('ChildObject', 'update')].calls == 2
+        assert stats[('SlowView', 'draw')].calls == 2
+
+    def test_self_time_excludes_children(self, parent):
+        parent.update(0, [])
+
+        parent_stats = profiler.get_stats()[('ParentObject', 'update')]
+        child_stats = profiler.get_stats()[('ChildObject', 'update')]
+        assert parent_stats.total_time == 3
+        assert parent_stats.self_time == 1
+        assert child_stats.total_time == child_stats.self_time == 2
+
+    def test_times_of_draws(self, parent):
+        parent.render(pygame.Surface((10, 10)))
+
+        view_stats = profiler.get_stats()[('SlowView', 'draw')]
+        assert view_stats.calls == 2
+        assert view_stats.total_time == view_stats.self_time == 0.5
+
+    def test_stats_are_sorted_by_self_time(self, parent):
+        parent.update(0, [])
+
+        assert list(profiler.get_stats())[0] == ('ChildObject', 'update')
+
+    def test_disable_restores_methods(self):
+        profiler.disable()
+
+        assert not hasattr(ChildObject.update, '__wrapped__')
+        ChildObject(SlowView()).update(0, [])
+        assert profiler.get_stats() == {}
+
+    def test_stats_per_frame(self, parent):
+        parent.update(0, [])
+        profiler.end_frame()
+        parent.update(16, [])
+        profiler.end_frame()
+
+        lines = profiler.format_stats().splitlines()
+        assert len(lines) == 1 + 2
+        assert lines[1].split() == ['ChildObject', 'update', '1.0', '2000.000', '2000.000']
+        assert lines[2].split() == ['ParentObject', 'update', '1.0', '1000.000', '3000.000']
+
+    def test_overlay(self, parent):
+        surface = pygame.Surface((400, 300))
+        surface.fill((255, 255, 255))
+        parent.update(0, [])
+        profiler.end_frame()
+
+        profiler.toggle_overlay()
+        assert profiler.is_overlay_visible()
+        profiler.draw_overlay(surface)
+        assert surface.get_at((1, 1)) != (255, 255, 255, 255)
+
+        profiler.toggle_overlay()
+        assert not profiler.is_overlay_visible()
+
+    def test_overlay_requires_profiler_enabled(self):
+        profiler.disable()
+
+        profiler.toggle_overlay()
+
+        assert not profiler.is_overlay_visible()
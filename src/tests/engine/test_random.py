@@ -0,0 +1,82 @@
+from engine.random import get_state, randint, seed, set_state, RandomStream, RandomStreams
+
+
+def _draw(stream, count=20):
+    return [randint(1, 1000000, stream) for _ in range(count)]
+
+
+def _draw_from(streams, stream, count=20):
+    return [streams.randint(1, 1000000, stream) for _ in range(count)]
+
+
+class TestRandom:
+    def teardown_method(self):
+        seed(None)
+
+    def test_same_seed_gives_same_numbers(self):
+        seed(42)
+        first = _draw(RandomStream.IO)
+        seed(42)
+        second = _draw(RandomStream.IO)
+
+        assert first == second
+
+    def test_different_seeds_give_different_numbers(self):
+        seed(1)
+        first = _draw(RandomStream.IO)
+        seed(2)
+        second = _draw(RandomStream.IO)
+
+        assert first != second
+
+    def test_streams_are_independent(self):
+        seed(42)
+        undisturbed = _draw(RandomStream.PAGES)
+
+        seed(42)
+        _draw(RandomStream.IO, 100)
+        _draw(RandomStream.TERMINATION, 100)
+        disturbed = _draw(RandomStream.PAGES)
+
+        assert undisturbed == disturbed
+
+    def test_streams_do_not_share_sequences(self):
+        seed(42)
+
+        assert _draw(RandomStream.PROCESS_SPAWN) != _draw(RandomStream.PROCESS_TYPE)
+
+    def test_numbers_in_range(self):
+        seed(42)
+
+        for _ in range(100):
+            assert 3 <= randint(3, 5) <= 5
+
+    def test_restoring_state_repeats_numbers(self):
+        seed(42)
+        _draw(RandomStream.IO)
+        state = get_state()
+        expected = [_draw(stream) for stream in RandomStream]
+
+        _draw(RandomStream.IO)
+        set_state(state)
+
+        assert [_draw(stream) for stream in RandomStream] == expected
+
+    def test_instances_do_not_share_streams(self):
+        expected = _draw_from(RandomStreams(42), RandomStream.IO)
+
+        streams = RandomStreams(42)
+        other_streams = RandomStreams(42)
+        seed(42)
+        drawn = []
+        for _ in range(20):
+            drawn.append(streams.randint(1, 1000000, RandomStream.IO))
+            other_streams.randint(1, 1000000, RandomStream.IO)
+            randint(1, 1000000, RandomStream.IO)
+
+        assert drawn == expected
+
+    def test_instances_are_seeded_like_the_default_streams(self):
+        seed(42)
+
+        assert _draw_from(RandomStreams(42), RandomStream.PAGES) == _draw(RandomStream.PAGES)
@@ -1,9 +1,13 @@
+import pygame
 import pytest
 
+from engine.drawable import Drawable
 from engine.modal import Modal
 from engine.modal_view import ModalView
 from engine.scene import Scene
 from engine.scene_manager import SceneManager
+from engine.scene_object import SceneObject
+from ui.color import Color
 from window_size import WINDOW_SIZE
 
 
@@ -149,3 +153,110 @@ class TestSceneReset:
 
         assert scene.modal is None
         assert scene.setup_call_count == 2
+
+
+class ColoredView(Drawable):
+    width = 10
+    height = 10
+
+    def __init__(self, color, *, known_state=True):
+        super().__init__()
+        self.color = color
+        self.known_state = known_state
+        self.draw_call_count = 0
+
+    @property
+    def visual_state(self):
+        return self.color if self.known_state else None
+
+    def draw(self, surface):
+        self.draw_call_count += 1
+        pygame.draw.rect(surface, self.color, self.bounds)
+
+
+class TestSceneDirtyRectRendering:
+    @pytest.fixture
+    def scene(self):
+        scene_manager = SceneManager()
+        scene_manager.screen = pygame.Surface(WINDOW_SIZE)
+        scene = StubScene()
+        scene_manager.register_scene(scene)
+        scene_manager.start_scene(scene, 0)
+        return scene
+
+    @pytest.fixture
+    def views(self, scene):
+        views = [ColoredView(Color.RED), ColoredView(Color.GREEN)]
+        views[1].set_xy(100, 0)
+        for view in views:
+            scene._scene_objects.append(SceneObject(view))
+        return views
+
+    def test_first_render_draws_everything(self, scene, views):
+        scene.render()
+
+        assert [view.draw_call_count for view in views] == [1, 1]
+        assert scene.screen.get_at((5, 5)) == Color.RED
+
+    def test_unchanged_views_are_not_redrawn(self, scene, views):
+        scene.render()
+        scene.render()
+
+        assert [view.draw_call_count for view in views] == [1, 1]
+
+    def test_only_changed_view_is_redrawn(self, scene, views):
+        scene.render()
+        views[0].color = Color.BLUE
+        scene.render()
+
+        assert [view.draw_call_count for view in views] == [2, 1]
+        assert scene.screen.get_at((5, 5)) == Color.BLUE
+
+    def test_moved_view_is_erased_from_previous_position(self, scene, views):
+        scene.render()
+        views[0].set_xy(50, 50)
+        scene.render()
+
+        assert scene.screen.get_at((5, 5)) == scene.background_color
+        assert scene.screen.get_at((55, 55)) == Color.RED
+        assert views[1].draw_call_count == 1
+
+    def test_overlapping_views_are_redrawn_in_order(self, scene, views):
+        views[1].set_xy(5, 5)
+        scene.render()
+        views[0].color = Color.BLUE
+        scene.render()
+
+        assert views[1].draw_call_count == 2
+        assert scene.screen.get_at((7, 7)) == Color.GREEN
+        assert scene.screen.get_at((2, 2)) == Color.BLUE
+
+    def test_hidden_view_is_erased(self, scene, views):
+        scene.render()
+        scene._scene_objects[0].visible = False
+        scene.render()
+
+        assert scene.screen.get_at((5, 5)) == scene.background_color
+        assert views[0].draw_call_count == 1
+
+    def test_view_with_unknown_state_is_redrawn_every_frame(self, scene, views):
+        views[0].known_state = False
+        scene.render()
+        scene.render()
+
+        assert [view.draw_call_count for view in views] == [2, 1]
+
+    def test_reset_redraws_everything(self, scene, views):
+        scene.render()
+        scene.reset()
+        scene._scene_objects = [SceneObject(view) for view in views]
+        scene.render()
+
+        assert [view.draw_call_count for view in views] == [2, 2]
+
+    def test_everything_is_redrawn_when_disabled(self, scene, views, monkeypatch):
+        monkeypatch.setattr(StubScene, 'dirty_rect_rendering', False)
+        scene.render()
+        scene.render()
+
+        assert [view.draw_call_count for view in views] == [2, 2]
@@ -0,0 +1,86 @@
+from engine.drawable import Drawable
+from engine.spatial_hash import SpatialHash
+
+
+class StubDrawable(Drawable):
+    def __init__(self, x, y, width=10, height=10):
+        super().__init__(x, y)
+        self._width = width
+        self._height = height
+
+    @property
+    def width(self):
+        return self._width
+
+    @property
+    def height(self):
+        return self._height
+
+    def draw(self, surface):
+        pass
+
+
+class TestSpatialHash:
+    def test_items_at(self):
+        spatial_hash = SpatialHash(cell_size=16)
+        drawable1 = StubDrawable(0, 0)
+        drawable2 = StubDrawable(20, 0)
+        spatial_hash.add('item1', drawable1)
+        spatial_hash.add('item2', drawable2)
+
+        assert len(spatial_hash) == 2
+        assert spatial_hash.items_at(5, 5) == ['item1']
+        assert spatial_hash.items_at(25, 5) == ['item2']
+        assert spatial_hash.items_at(15, 5) == []
+        assert spatial_hash.items_at(500, 500) == []
+
+    def test_items_at_matches_collides(self):
+        spatial_hash = SpatialHash(cell_size=16)
+        drawable = StubDrawable(10, 10, 20, 30)
+        spatial_hash.add('item', drawable)
+
+        for x in range(0, 50):
+            for y in range(0, 50):
+                assert (spatial_hash.items_at(x, y) == ['item']) == drawable.collides(x, y)
+
+    def test_items_at_returns_overlapping_items_in_order_added(self):
+        spatial_hash = SpatialHash(cell_size=16)
+        spatial_hash.add('item2', StubDrawable(5, 5))
+        spatial_hash.add('item1', StubDrawable(0, 0))
+        spatial_hash.add('item3', StubDrawable(8, 8))
+
+        assert spatial_hash.items_at(9, 9) == ['item2', 'item1', 'item3']
+
+    def test_item_follows_drawable_moves(self):
+        spatial_hash = SpatialHash(cell_size=16)
+        drawable = StubDrawable(0, 0)
+        spatial_hash.add('item', drawable)
+
+        drawable.set_xy(100, 200)
+        assert spatial_hash.items_at(5, 5) == []
+        assert spatial_hash.items_at(105, 205) == ['item']
+
+        drawable.x += 1
+        assert spatial_hash.items_at(100, 205) == []
+        assert spatial_hash.items_at(110, 205) == ['item']
+
+    def test_remove(self):
+        spatial_hash = SpatialHash(cell_size=16)
+        drawable = StubDrawable(0, 0)
+        spatial_hash.add('item', drawable)
+        spatial_hash.remove('item')
+
+        assert 'item' not in spatial_hash
+        assert spatial_hash.items_at(5, 5) == []
+
+        drawable.set_xy(100, 200)
+        assert spatial_hash.items_at(105, 205) == []
+
+    def test_add_twice(self):
+        spatial_hash = SpatialHash(cell_size=16)
+        spatial_hash.add('item', StubDrawable(0, 0))
+        spatial_hash.add('item', StubDrawable(100, 100))
+
+        assert len(spatial_hash) == 1
+        assert spatial_hash.items_at(5, 5) == []
+        assert spatial_hash.items_at(105, 105) == ['item']
@@ -0,0 +1,63 @@
+from math import inf
+
+from engine.timer_queue import TimerQueue
+
+
+class TestTimerQueue:
+    def test_pop_due_in_deadline_order(self):
+        timer_queue = TimerQueue()
+        timer_queue.schedule('b', 200)
+        timer_queue.schedule('a', 100)
+        timer_queue.schedule('c', 300)
+
+        assert timer_queue.next_deadline == 100
+        assert timer_queue.pop_due(99) == []
+        assert timer_queue.pop_due(200) == ['a', 'b']
+        assert len(timer_queue) == 1
+        assert 'c' in timer_queue
+        assert timer_queue.next_deadline == 300
+
+    def test_equal_deadlines_in_scheduling_order(self):
+        timer_queue = TimerQueue()
+        timer_queue.schedule('b', 100)
+        timer_queue.schedule('a', 100)
+
+        assert timer_queue.pop_due(100) == ['b', 'a']
+
+    def test_reschedule_replaces_deadline(self):
+        timer_queue = TimerQueue()
+        timer_queue.schedule('a', 100)
+        timer_queue.schedule('a', 500)
+
+        assert timer_queue.deadline_of('a') == 500
+        assert timer_queue.pop_due(100) == []
+        assert timer_queue.pop_due(500) == ['a']
+
+    def test_cancel(self):
+        timer_queue = TimerQueue()
+        timer_queue.schedule('a', 100)
+        timer_queue.schedule('b', 200)
+        timer_queue.cancel('a')
+        timer_queue.cancel('unknown')
+
+        assert timer_queue.next_deadline == 200
+        assert timer_queue.pop_due(1000) == ['b']
+        assert timer_queue.next_deadline == inf
+
+    def test_infinite_deadline_cancels(self):
+        timer_queue = TimerQueue()
+        timer_queue.schedule('a', 100)
+        timer_queue.schedule('a', inf)
+
+        assert 'a' not in timer_queue
+        assert timer_queue.deadline_of('a') == inf
+
+    def test_many_reschedules(self):
+        timer_queue = TimerQueue()
+        for deadline in range(1000):
+            timer_queue.schedule('a', deadline)
+            timer_queue.schedule('b', deadline + 1)
+
+        assert timer_queue.pop_due(999) == ['a']
+        assert timer_queue.pop_due(1000) == ['b']
+        assert len(timer_queue) == 0
@@ -434,4 +434,30 @@ class TestCPUManager:
         cpu_manager.remove_process_from_cpu(process2)
         assert cpu1_1.process is None
         assert cpu1_2.process is None
-        
\ No newline at end of file
+        
+    def test_indexes_follow_process_moving_between_cpus(self, cpu_config_hyperthreading, create_process):
+        cpu_manager = CpuManager(cpu_config_hyperthreading)
+        cpu_manager.setup()
+
+        process1 = create_process(cpu_manager, 1)
+        process2 = create_process(cpu_manager, 2)
+
+        cpu1_1 = cpu_manager.get_cpu_by_logical_id(1)
+        cpu1_2 = cpu_manager.get_cpu_by_logical_id(2)
+        cpu2_1 = cpu_manager.get_cpu_by_logical_id(3)
+
+        cpu1_1.process = process1
+        cpu1_2.process = process2
+        assert cpu_manager.select_free_cpu() is cpu2_1
+
+        cpu1_2.process = None
+        cpu2_1.process = process2
+        assert cpu_manager.find_cpu_with_process(process2) is cpu2_1
+        assert cpu_manager.check_cpu_for_penalty(cpu1_1) is False
+        assert cpu_manager.select_free_cpu() is cpu_manager.get_cpu_by_logical_id(5)
+
+        cpu2_1.process = None
+        cpu1_1.process = process2
+        assert cpu_manager.find_cpu_with_process(process1) is None
+        assert cpu_manager.find_cpu_with_process(process2) is cpu1_1
+        assert cpu_manager.select_free_cpu() is cpu2_1
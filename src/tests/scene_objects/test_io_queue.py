@@ -192,10 +192,12 @@ class TestIoQueue:
         io_queue.wait_for_event(0, lambda: None, lambda: None)
 
         game_monitor.clear_events()
+        game_monitor.set_enabled(True)
 
         io_queue.update(6000, [])
 
         events = game_monitor.get_events()
+        game_monitor.set_enabled(False)
         io_queue_events = [e for e in events if e.etype == 'IO_QUEUE']
         assert len(io_queue_events) == 1
         assert io_queue_events[0].io_count == 1
@@ -217,3 +219,14 @@ class TestIoQueue:
         assert io_queue.wasted_action_count == 2
         io_queue.handle_player_action()
         assert io_queue.wasted_action_count == 3
+
+    def test_next_update_time_without_waiter(self, io_queue):
+        assert io_queue.next_update_time(0) == float('inf')
+
+    def test_next_update_time_with_waiter(self, io_queue, monkeypatch):
+        monkeypatch.setattr(Random, 'get_number', lambda self, min, max: max)
+
+        io_queue.wait_for_event(0, lambda: None, lambda: None)
+        io_queue.update(1000, [])
+
+        assert io_queue.next_update_time(1000) == 2000
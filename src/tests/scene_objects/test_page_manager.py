@@ -1,7 +1,9 @@
 import pytest
 
 from constants import PAGES_PER_ROW
-from scene_objects.page import Page
+from engine.game_event import GameEvent
+from engine.game_event_type import GameEventType
+from scene_objects.page import Page, PageMouseDragAction
 from scene_objects.page_slot import PageSlot
 from scene_objects.page_manager import PageManager
 from config.cpu_config import CpuConfig
@@ -351,6 +353,62 @@ class TestPageManager:
         page_manager.cancel_page_swap(pages[0], cancel_whole_row=True)
         assert cancel_calls == PAGES_PER_ROW
 
+    def test_cancelled_swap_in_progress_lets_next_swap_start(self, page_manager):
+        pages = [page_manager.create_page(1, i) for i in range(2)]
+
+        page_manager.swap_page(pages[0])
+        page_manager.swap_page(pages[1])
+        page_manager.update(1000, [])
+        assert pages[0].swap_in_progress
+        assert not pages[1].swap_in_progress
+
+        page_manager.cancel_page_swap(pages[0])
+        page_manager.update(1001, [])
+        assert not pages[0].swap_requested
+        assert pages[1].swap_in_progress
+
+    def test_deleted_swap_in_progress_lets_next_swap_start(self, page_manager):
+        pages = [page_manager.create_page(1, i) for i in range(2)]
+
+        page_manager.swap_page(pages[0])
+        page_manager.swap_page(pages[1])
+        page_manager.update(1000, [])
+        assert pages[0].swap_in_progress
+
+        page_manager.delete_page(pages[0])
+        page_manager.update(1001, [])
+        assert pages[1].swap_in_progress
+
+    def test_cancelled_swaps_are_removed_from_swap_queue(self, page_manager):
+        pages = [page_manager.create_page(1, i) for i in range(PAGES_PER_ROW)]
+
+        page_manager.swap_page(pages[0], swap_whole_row=True)
+        assert page_manager.swap_out_queue_depth == PAGES_PER_ROW
+        assert page_manager.swap_in_queue_depth == 0
+
+        page_manager.cancel_page_swap(pages[1])
+        assert page_manager.swap_out_queue_depth == PAGES_PER_ROW - 1
+
+        page_manager.delete_page(pages[2])
+        assert page_manager.swap_out_queue_depth == PAGES_PER_ROW - 2
+
+        page_manager.cancel_page_swap(pages[0], cancel_whole_row=True)
+        assert page_manager.swap_out_queue_depth == 0
+
+    def test_swap_requested_again_after_cancellation_starts_once(self, page_manager):
+        pages = [page_manager.create_page(1, i) for i in range(3)]
+
+        page_manager.swap_page(pages[0])
+        page_manager.swap_page(pages[1])
+        page_manager.cancel_page_swap(pages[0])
+        page_manager.swap_page(pages[0])
+        assert page_manager.swap_out_queue_depth == 2
+
+        page_manager.update(1000, [])
+        assert pages[1].swap_in_progress
+        assert not pages[0].swap_in_progress
+        assert page_manager.swap_out_queue_depth == 1
+
     def test_delete_page_in_ram(self, page_manager):
         pages = []
 
@@ -451,4 +509,61 @@ class TestPageManager:
         assert not other_disk_page.on_disk
         assert not other_disk_page.swap_requested
         assert not other_disk_page.swap_in_progress
-         
\ No newline at end of file
+         
+    def test_click_on_page(self, page_manager):
+        pages = [page_manager.create_page(1, i) for i in range(3)]
+
+        click_event = GameEvent(GameEventType.MOUSE_LEFT_CLICK, {
+            'position': (pages[1].view.x + 1, pages[1].view.y + 1), 'shift': False
+        })
+        page_manager.update(1000, [click_event])
+
+        assert not pages[0].swap_requested
+        assert pages[1].swap_requested
+        assert not pages[2].swap_requested
+
+    def test_click_on_moved_page(self, page_manager, stage_config):
+        pages = [page_manager.create_page(1, i) for i in range(PageManager.get_num_cols() + 1)]
+        disk_page = pages[-1]
+        assert disk_page.on_disk
+        page_manager.delete_page(pages[0])
+
+        page_manager.swap_page(disk_page)
+        page_manager.update(1000, [])
+        page_manager.update(1000 + stage_config.swap_delay_ms, [])
+        assert disk_page.in_ram
+
+        click_event = GameEvent(GameEventType.MOUSE_LEFT_CLICK, {
+            'position': (disk_page.view.x + 1, disk_page.view.y + 1), 'shift': False
+        })
+        page_manager.update(5000, [click_event])
+        assert disk_page.swap_requested
+
+    def test_mouse_drag_over_pages(self, page_manager):
+        pages = [page_manager.create_page(1, i) for i in range(4)]
+
+        for page in pages[:3]:
+            page_manager.update(1000, [GameEvent(GameEventType.MOUSE_MOTION, {
+                'position': (page.view.x + 1, page.view.y + 1),
+                'shift': False,
+                'left_button_down': True
+            })])
+
+        assert page_manager.current_mouse_drag_action == PageMouseDragAction.REQUEST_SWAP
+        assert all(page.swap_requested for page in pages[:3])
+        assert not pages[3].swap_requested
+
+        page_manager.update(1000, [GameEvent(GameEventType.MOUSE_LEFT_CLICK, {
+            'position': (0, 0), 'shift': False
+        })])
+        assert page_manager.current_mouse_drag_action is None
+
+    def test_click_on_deleted_page(self, page_manager):
+        page = page_manager.create_page(1, 0)
+        position = (page.view.x + 1, page.view.y + 1)
+        page_manager.delete_page(page)
+
+        page_manager.update(1000, [GameEvent(GameEventType.MOUSE_LEFT_CLICK, {
+            'position': position, 'shift': False
+        })])
+        assert not page.swap_requested
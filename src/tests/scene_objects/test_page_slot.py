@@ -0,0 +1,59 @@
+from scene_objects.page_slot import PageSlot, PageSlotPool
+
+
+class TestPageSlotPool:
+    def _create_pool(self, num_slots):
+        pool = PageSlotPool()
+        for _ in range(num_slots):
+            pool.append(PageSlot())
+        return pool
+
+    def test_initial_state(self):
+        pool = self._create_pool(3)
+        assert len(pool) == 3
+        assert [slot.index for slot in pool] == [0, 1, 2]
+        assert pool.has_free_slot
+        assert pool.first_free_slot() is pool[0]
+
+    def test_empty_pool(self):
+        pool = PageSlotPool()
+        assert not pool.has_free_slot
+        assert pool.first_free_slot() is None
+
+    def test_first_free_slot(self):
+        pool = self._create_pool(3)
+        pool[0].page = 'page1'
+        assert pool.first_free_slot() is pool[1]
+        pool[1].page = 'page2'
+        assert pool.first_free_slot() is pool[2]
+        pool[2].page = 'page3'
+        assert not pool.has_free_slot
+        assert pool.first_free_slot() is None
+
+        pool[1].page = None
+        assert pool.has_free_slot
+        assert pool.first_free_slot() is pool[1]
+        pool[0].page = None
+        assert pool.first_free_slot() is pool[0]
+
+    def test_slot_of(self):
+        pool = self._create_pool(3)
+        assert pool.slot_of('page1') is None
+
+        pool[1].page = 'page1'
+        pool[2].page = 'page2'
+        assert pool.slot_of('page1') is pool[1]
+        assert pool.slot_of('page2') is pool[2]
+
+        pool[1].page = 'page3'
+        assert pool.slot_of('page1') is None
+        assert pool.slot_of('page3') is pool[1]
+
+        pool[2].page = None
+        assert pool.slot_of('page2') is None
+
+    def test_slot_outside_of_pool(self):
+        slot = PageSlot()
+        slot.page = 'page1'
+        assert slot.has_page
+        assert slot.index is None
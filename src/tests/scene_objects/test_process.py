@@ -992,7 +992,7 @@ class TestProcess:
         counter = 0
         while process.view.target_x != None or process.view.target_y != None:
             counter += 1
-            process.update(counter, [])
+            stage.process_manager.animation_manager.update()
             assert counter < 100 # prevents infinite loop if test fails
 
         assert process.view.x == target_x
@@ -504,6 +504,85 @@ class TestProcessManager:
         stats = process_manager_4.get_current_stats()
         assert stats['blocked_active_process_count'] == 1
 
+    def test_get_current_stats_follows_processes_on_cpus(self, ready_process_manager_custom_config):
+        process_manager, stage = ready_process_manager_custom_config(StageConfig(
+            num_processes_at_startup = 10,
+            new_process_probability = 0,
+            graceful_termination_probability = 0,
+            io_probability = 0
+        ))
+
+        process1 = process_manager.get_process(1)
+        process2 = process_manager.get_process(2)
+        process1.use_cpu()
+        process2.use_cpu()
+
+        stats = process_manager.get_current_stats()
+        assert stats['active_process_count'] == 2
+        assert stats['active_process_count_by_starvation_level'][1] == 2
+        assert stats['blocked_active_process_count'] == 0
+
+        time = 0
+        while process1.starvation_level > 0 and time < 1000000:
+            process1.update(time, [])
+            time += ONE_SECOND
+        assert process1.starvation_level == 0
+
+        stats = process_manager.get_current_stats()
+        assert stats['active_process_count_by_starvation_level'][0] == 1
+        assert stats['active_process_count_by_starvation_level'][1] == 1
+        assert stats['alive_process_count_by_starvation_level'][0] == 1
+        assert stats['alive_process_count_by_starvation_level'][1] == 9
+
+        process2.yield_cpu()
+
+        stats = process_manager.get_current_stats()
+        assert stats['active_process_count'] == 1
+        assert stats['active_process_count_by_starvation_level'][0] == 1
+        assert stats['active_process_count_by_starvation_level'][1] == 0
+
+    def test_update_only_wakes_processes_with_something_to_do(
+        self, ready_process_manager_custom_config, monkeypatch
+    ):
+        process_manager, stage = ready_process_manager_custom_config(StageConfig(
+            num_processes_at_startup = 3,
+            new_process_probability = 0,
+            graceful_termination_probability = 0,
+            io_probability = 0
+        ))
+        running_process = process_manager.get_process(1)
+        running_process.use_cpu()
+        while process_manager.any_process_in_motion:
+            process_manager.update(0, [])
+
+        updated_pids = []
+        original_update = Process.update
+        def update(self, current_time, events):
+            updated_pids.append(self.pid)
+            original_update(self, current_time, events)
+        monkeypatch.setattr(Process, 'update', update)
+
+        idle_process = process_manager.get_process(2)
+        other_idle_process = process_manager.get_process(3)
+        assert other_idle_process.next_periodic_update_time > idle_process.next_periodic_update_time
+
+        time = idle_process.next_periodic_update_time - 1
+        process_manager.update(time, [])
+        assert updated_pids == [1]
+
+        updated_pids.clear()
+        starvation_level_duration = other_idle_process.current_starvation_level_duration
+        process_manager.update(time + 1, [])
+        assert updated_pids == [1, 2]
+        assert other_idle_process.current_starvation_level_duration == starvation_level_duration + 1
+
+        updated_pids.clear()
+        event = GameEvent(GameEventType.MOUSE_LEFT_CLICK, {
+            'position': (other_idle_process.view.x + 1, other_idle_process.view.y + 1)
+        })
+        process_manager.update(time + 2, [event])
+        assert updated_pids == [1, 3]
+
     def test_sort(self, ready_process_manager_custom_config):
         process_manager, stage = ready_process_manager_custom_config(StageConfig(
             cpu_config=CpuConfig(num_cores=4),
@@ -718,6 +797,29 @@ class TestProcessManager:
             assert cpu.process is None
             assert process.cpu is None
 
+    def test_click_on_process(self, ready_process_manager):
+        process_manager = ready_process_manager
+        process1 = process_manager.get_process(1)
+        process2 = process_manager.get_process(2)
+
+        event = GameEvent(GameEventType.MOUSE_LEFT_CLICK, {
+            'position': (process1.view.x + 1, process1.view.y + 1)
+        })
+        process_manager.update(1000, [event])
+
+        assert process1.has_cpu
+        assert not process2.has_cpu
+
+        while process1.is_in_motion:
+            process_manager.update(1000, [])
+
+        event = GameEvent(GameEventType.MOUSE_LEFT_CLICK, {
+            'position': (process1.view.x + 1, process1.view.y + 1)
+        })
+        process_manager.update(1000, [event])
+
+        assert not process1.has_cpu
+
     def test_forced_standard_process_created_at_scheduled_time(self, ready_process_manager_custom_config):
         process_manager, _ = ready_process_manager_custom_config(StageConfig(
             num_processes_at_startup=0,
@@ -0,0 +1,103 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from constants import FRAMERATE, ONE_SECOND
+from scene_objects.process import ProcessState
+from scenes.stage import Stage
+from config.cpu_config import CpuConfig
+from config.stage_config import StageConfig
+
+class TestProcessTable:
+    def _config(self, vectorized_process_table):
+        return StageConfig(
+            cpu_config=CpuConfig(num_cores=4),
+            num_processes_at_startup=30,
+            new_process_probability=0.5,
+            io_probability=0.1,
+            graceful_termination_probability=0.05,
+            time_ms_to_show_sort_button=0,
+            time_ms_to_show_auto_sort_checkbox=0,
+            vectorized_process_table=vectorized_process_table,
+        )
+
+    def _play(self, scene_manager, vectorized_process_table, on_frame):
+        stage = Stage('Test Stage', self._config(vectorized_process_table))
+        stage.scene_manager = scene_manager
+        stage.seed = 7
+        stage.setup()
+        process_manager = stage.process_manager
+        orders = []
+        time = 0
+        for frame in range(90 * FRAMERATE):
+            time = frame * ONE_SECOND / FRAMERATE
+            if frame == FRAMERATE:
+                process_manager._auto_sort_checkbox.checked = True
+            if frame % 7 == 0:
+                pid = frame // 7 % 50 + 1
+                try:
+                    process = process_manager.get_process(pid)
+                except KeyError:
+                    process = None
+                if process is not None and process.state != ProcessState.ENDED:
+                    process.toggle()
+            stage.update(time, [])
+            orders.append([
+                slot.process.pid if slot.process is not None else None
+                for slot in process_manager.process_slots
+            ])
+            on_frame(process_manager)
+        return orders
+
+    def test_sort_keys_match_processes(self, scene_manager):
+        checked_keys = []
+
+        def check_keys(process_manager):
+            processes = list(process_manager._process_table._rows)
+            keys = process_manager._process_table.sort_keys(
+                processes, process_manager.last_process_update_time)
+            assert keys == [process.sort_key for process in processes]
+            checked_keys.extend(keys)
+
+        self._play(scene_manager, True, check_keys)
+        assert len(set(checked_keys)) > 100
+
+    def test_slot_order_matches_object_path(self, scene_manager):
+        orders = self._play(scene_manager, False, lambda process_manager: None)
+        vectorized_orders = self._play(scene_manager, True, lambda process_manager: None)
+        assert vectorized_orders == orders
+        assert len({tuple(order) for order in orders}) > 100
+
+    def test_terminated_processes_free_their_rows(self, scene_manager):
+        def check_rows(process_manager):
+            alive_processes = set(process_manager._counted_starvation_level_by_alive_process)
+            assert set(process_manager._process_table._rows) == alive_processes
+
+        self._play(scene_manager, True, check_rows)
+
+    def test_sort_keys_of_processes_updated_directly(self, stage_custom_config):
+        stage = stage_custom_config(StageConfig(
+            num_processes_at_startup=5,
+            new_process_probability=0,
+            io_probability=0,
+            graceful_termination_probability=0,
+            vectorized_process_table=True,
+        ))
+        process_manager = stage.process_manager
+        time = 0
+        while process_manager.process_slots[4].process is None:
+            time += 50
+            stage.update(time, [])
+
+        processes = [process_manager.get_process(pid) for pid in range(1, 6)]
+        for i, process in enumerate(processes[:4]):
+            process_time = time
+            while process.starvation_level < i + 2:
+                process_time += ONE_SECOND / 3
+                process.update(process_time, [])
+            process.update(process_time + 100, [])
+        processes[4].use_cpu()
+
+        keys = process_manager._process_table.sort_keys(
+            processes, process_manager.last_process_update_time)
+        assert keys == [process.sort_key for process in processes]
@@ -0,0 +1,48 @@
+from scene_objects.swap_queue import SwapQueue
+
+
+class TestSwapQueue:
+    def test_initial_state(self):
+        swap_queue = SwapQueue()
+        assert len(swap_queue) == 0
+        assert swap_queue.depth == 0
+        assert not swap_queue
+
+    def test_first_in_first_out(self):
+        swap_queue = SwapQueue()
+        swap_queue.enqueue('page1')
+        swap_queue.enqueue('page2')
+        swap_queue.enqueue('page3')
+        assert swap_queue.depth == 3
+        assert list(swap_queue) == ['page1', 'page2', 'page3']
+
+        assert swap_queue.dequeue() == 'page1'
+        assert swap_queue.dequeue() == 'page2'
+        assert swap_queue.depth == 1
+        assert swap_queue.dequeue() == 'page3'
+        assert swap_queue.depth == 0
+
+    def test_enqueue_all(self):
+        swap_queue = SwapQueue()
+        swap_queue.enqueue('page1')
+        swap_queue.enqueue_all(['page2', 'page3'])
+        assert list(swap_queue) == ['page1', 'page2', 'page3']
+
+    def test_cancel(self):
+        swap_queue = SwapQueue()
+        swap_queue.enqueue_all(['page1', 'page2', 'page3'])
+
+        swap_queue.cancel('page2')
+        assert swap_queue.depth == 2
+        assert 'page2' not in swap_queue
+        assert list(swap_queue) == ['page1', 'page3']
+
+        swap_queue.cancel('page2')
+        assert swap_queue.depth == 2
+
+    def test_enqueue_again_after_cancel(self):
+        swap_queue = SwapQueue()
+        swap_queue.enqueue_all(['page1', 'page2'])
+        swap_queue.cancel('page1')
+        swap_queue.enqueue('page1')
+        assert list(swap_queue) == ['page2', 'page1']
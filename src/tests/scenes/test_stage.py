@@ -1045,4 +1045,69 @@ class TestStage:
         assert stage.on_victory_call_count == 0
 
         stage.update(int(time) + ONE_SECOND + 1, [])
-        assert stage.on_victory_call_count == 1
\ No newline at end of file
+        assert stage.on_victory_call_count == 1
+
+class TestStageRandomStreams:
+    @pytest.fixture
+    def stage_config(self):
+        return StageConfig(
+            cpu_config=CpuConfig(num_cores=4),
+            num_processes_at_startup=20,
+            new_process_probability=0.5,
+            priority_process_probability=0.2,
+            io_probability=0.2,
+            graceful_termination_probability=0.1,
+        )
+
+    def _create_stage(self, scene_manager, stage_config, seed):
+        stage = Stage('Test Stage', stage_config)
+        stage.scene_manager = scene_manager
+        stage.seed = seed
+        stage.setup()
+        return stage
+
+    def _step(self, stage, frame):
+        process_manager = stage.process_manager
+        if frame % 10 == 0:
+            pid = frame // 10 % 40 + 1
+            try:
+                process_manager.get_process(pid).toggle()
+            except KeyError:
+                pass
+        stage.update(frame * ONE_SECOND / FRAMERATE, [])
+        return (
+            process_manager.get_current_stats(),
+            [
+                (process.pid, process.type, process.state, process.starvation_level)
+                for process in process_manager.children if isinstance(process, Process)
+            ],
+        )
+
+    def test_stages_with_the_same_seed_give_the_same_run(self, scene_manager, stage_config):
+        first_stage = self._create_stage(scene_manager, stage_config, 3)
+        second_stage = self._create_stage(scene_manager, stage_config, 3)
+
+        for frame in range(60 * FRAMERATE):
+            assert self._step(first_stage, frame) == self._step(second_stage, frame)
+
+    def test_stages_in_one_process_do_not_disturb_each_other(self, scene_manager, stage_config):
+        stage = self._create_stage(scene_manager, stage_config, 3)
+        undisturbed = [self._step(stage, frame) for frame in range(60 * FRAMERATE)]
+
+        stage = self._create_stage(scene_manager, stage_config, 3)
+        other_stage = self._create_stage(scene_manager, stage_config, 4)
+        disturbed = []
+        for frame in range(60 * FRAMERATE):
+            self._step(other_stage, frame)
+            self._step(other_stage, frame)
+            disturbed.append(self._step(stage, frame))
+
+        assert disturbed == undisturbed
+
+    def test_setup_restarts_the_random_streams_from_the_seed(self, scene_manager, stage_config):
+        stage = self._create_stage(scene_manager, stage_config, 3)
+        first_run = [self._step(stage, frame) for frame in range(30 * FRAMERATE)]
+
+        stage.setup()
+
+        assert [self._step(stage, frame) for frame in range(30 * FRAMERATE)] == first_run
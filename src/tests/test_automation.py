@@ -1,7 +1,6 @@
 import pytest
 from types import SimpleNamespace
 
-import game_monitor
 from constants import DEAD_STARVATION_LEVEL
 from config.stage_config import StageConfig
 from config.cpu_config import CpuConfig
@@ -476,13 +475,283 @@ class TestSchedulerIntegration:
         assert (1, 1) not in scheduler.pages
 
 
+class TestSchedulerDispatch:
+    """Tests for the dispatch of events to the handlers of a Scheduler subclass."""
+
+    def test_event_codes_match_game_monitor(self):
+        """Test that event codes are the values of the game monitor event types."""
+        from automation.api import EVENT_CODES
+        from game_monitor import EventType
+
+        assert EVENT_CODES == {event_type.name: event_type.value for event_type in EventType}
+
+    def test_monitor_events_are_dispatched_by_code(self):
+        """Test that events from the game monitor are dispatched to overridden handlers."""
+        from automation.api import Scheduler
+        from game_monitor import GameMonitor
+
+        class TrackingScheduler(Scheduler):
+            def __init__(self):
+                super().__init__()
+                self.starved = []
+
+            def _update_PROC_STARV(self, event):
+                super()._update_PROC_STARV(event)
+                self.starved.append(event.pid)
+
+            def schedule(self):
+                pass
+
+        monitor = GameMonitor()
+        monitor.set_enabled(True)
+        monitor.notify_process_new(1)
+        monitor.notify_process_starvation(1, 3, 5000, 6000)
+        scheduler = TrackingScheduler()
+
+        scheduler(monitor.get_events())
+
+        assert scheduler.starved == [1]
+        assert scheduler.processes[1].starvation_level == 3
+
+    def test_batch_handler_receives_runs_of_events(self):
+        """Test that a batch handler gets each run of consecutive events of its type."""
+        from automation.api import Scheduler
+
+        class BatchScheduler(Scheduler):
+            def __init__(self):
+                super().__init__()
+                self.batches = []
+
+            def _update_batch_PROC_NEW(self, events):
+                self.batches.append([event.pid for event in events])
+                for event in events:
+                    self._update_PROC_NEW(event)
+
+            def schedule(self):
+                pass
+
+        scheduler = BatchScheduler()
+        scheduler([
+            SimpleNamespace(etype='PROC_NEW', pid=1),
+            SimpleNamespace(etype='PROC_NEW', pid=2),
+            SimpleNamespace(etype='PROC_CPU', pid=1, cpu=True),
+            SimpleNamespace(etype='UNKNOWN_EVENT'),
+            SimpleNamespace(etype='PROC_NEW', pid=3),
+        ])
+
+        assert scheduler.batches == [[1, 2], [3]]
+        assert set(scheduler.processes) == {1, 2, 3}
+        assert scheduler.used_cpus == 1
+
+    @pytest.mark.parametrize('with_batch_handler', [False, True])
+    def test_events_without_a_table_entry_are_dispatched_by_name(self, with_batch_handler):
+        """Test that events of other types, or with a code out of the table,
+        are dispatched to the handler named after their type."""
+        from automation.api import Scheduler
+
+        class CustomScheduler(Scheduler):
+            def __init__(self):
+                super().__init__()
+                self.custom_events = []
+
+            def _update_CUSTOM(self, event):
+                self.custom_events.append(event.value)
+
+            def schedule(self):
+                pass
+
+        class BatchCustomScheduler(CustomScheduler):
+            def _update_batch_PROC_END(self, events):
+                for event in events:
+                    self._update_PROC_END(event)
+
+        scheduler = BatchCustomScheduler() if with_batch_handler else CustomScheduler()
+        scheduler([
+            SimpleNamespace(etype='CUSTOM', value=1),
+            SimpleNamespace(etype='PROC_NEW', code=999, pid=1),
+            SimpleNamespace(etype='CUSTOM', code=-1, value=2),
+        ])
+
+        assert scheduler.custom_events == [1, 2]
+        assert set(scheduler.processes) == {1}
+
+
+class TestSchedulerIndexes:
+    """Tests for the indexes of processes and pages kept by the Scheduler."""
+
+    @pytest.fixture
+    def scheduler(self):
+        """Create a fresh Scheduler instance for each test."""
+        from automation.api import Scheduler
+        return Scheduler()
+
+    def test_idle_processes_are_indexed_by_starvation_level(self, scheduler):
+        """Test that idle processes are listed most starved first."""
+        scheduler([
+            SimpleNamespace(etype='PROC_NEW', pid=1),
+            SimpleNamespace(etype='PROC_NEW', pid=2),
+            SimpleNamespace(etype='PROC_NEW', pid=3),
+            SimpleNamespace(etype='PROC_STARV', pid=2, starvation_level=4, time_to_termination=0),
+            SimpleNamespace(etype='PROC_CPU', pid=3, cpu=True),
+        ])
+
+        assert [proc.pid for proc in scheduler.iter_idle_processes()] == [2, 1]
+        assert set(scheduler.idle_processes_by_starvation) == {1, 4}
+        assert list(scheduler.running_processes) == [3]
+
+    def test_blocked_processes_are_not_idle(self, scheduler):
+        """Test that processes waiting for I/O or a page are not idle."""
+        scheduler([
+            SimpleNamespace(etype='PROC_NEW', pid=1),
+            SimpleNamespace(etype='PROC_NEW', pid=2),
+            SimpleNamespace(etype='PROC_WAIT_IO', pid=1, waiting_for_io=True),
+            SimpleNamespace(etype='PROC_WAIT_PAGE', pid=2, waiting_for_page=True),
+        ])
+        assert list(scheduler.iter_idle_processes()) == []
+        assert list(scheduler.processes_waiting_for_page) == [2]
+
+        scheduler([SimpleNamespace(etype='PROC_WAIT_PAGE', pid=2, waiting_for_page=False)])
+        assert [proc.pid for proc in scheduler.iter_idle_processes()] == [2]
+        assert scheduler.processes_waiting_for_page == {}
+
+    def test_ended_processes_leave_the_indexes(self, scheduler):
+        """Test that terminated and killed processes are removed from the indexes."""
+        scheduler([
+            SimpleNamespace(etype='PROC_NEW', pid=1),
+            SimpleNamespace(etype='PROC_NEW', pid=2),
+            SimpleNamespace(etype='PAGE_NEW', pid=2, idx=0, swap=False, use=False),
+            SimpleNamespace(etype='PROC_CPU', pid=1, cpu=True),
+            SimpleNamespace(etype='PROC_TERM', pid=1),
+            SimpleNamespace(etype='PROC_END', pid=1),
+            SimpleNamespace(etype='PROC_KILL', pid=2),
+        ])
+
+        assert scheduler.running_processes == {}
+        assert scheduler.idle_processes_by_starvation == {}
+        assert scheduler.evictable_pages == {}
+
+    def test_pages_are_indexed_by_state(self, scheduler):
+        """Test the indexes of pages in use on disk and of evictable pages."""
+        scheduler([
+            SimpleNamespace(etype='PROC_NEW', pid=1),
+            SimpleNamespace(etype='PAGE_NEW', pid=1, idx=0, swap=False, use=False),
+            SimpleNamespace(etype='PAGE_NEW', pid=1, idx=1, swap=True, use=True),
+        ])
+        assert list(scheduler.evictable_pages) == [(1, 0)]
+        assert list(scheduler.pages_on_disk_in_use) == [(1, 1)]
+
+        scheduler([
+            SimpleNamespace(etype='PAGE_SWAP_QUEUE', pid=1, idx=0, waiting=True),
+            SimpleNamespace(etype='PAGE_SWAP_QUEUE', pid=1, idx=1, waiting=True),
+            SimpleNamespace(etype='PAGE_SWAP_START', pid=1, idx=1),
+        ])
+        assert scheduler.evictable_pages == {}
+
+        scheduler([
+            SimpleNamespace(etype='PAGE_SWAP', pid=1, idx=1, swap=False),
+            SimpleNamespace(etype='PAGE_SWAP_START', pid=1, idx=0),
+            SimpleNamespace(etype='PAGE_SWAP', pid=1, idx=0, swap=True),
+            SimpleNamespace(etype='PAGE_FREE', pid=1, idx=1),
+        ])
+        assert scheduler.pages_on_disk_in_use == {}
+        assert scheduler.evictable_pages == {}
+        assert [page.key for page in scheduler.processes[1].pages] == [(1, 0)]
+
+    def test_idle_processes_of_a_level_are_listed_by_pid(self, scheduler):
+        """Test that idle processes of the same starvation level are listed oldest first."""
+        scheduler([
+            SimpleNamespace(etype='PROC_NEW', pid=1),
+            SimpleNamespace(etype='PROC_NEW', pid=2),
+            SimpleNamespace(etype='PROC_NEW', pid=3),
+            SimpleNamespace(etype='PROC_STARV', pid=3, starvation_level=2, time_to_termination=0),
+            SimpleNamespace(etype='PROC_STARV', pid=1, starvation_level=2, time_to_termination=0),
+        ])
+
+        assert [proc.pid for proc in scheduler.iter_idle_processes()] == [1, 3, 2]
+
+    def test_evictable_pages_are_listed_in_creation_order(self, scheduler):
+        """Test that evictable pages are listed in the order of `pages`."""
+        scheduler([
+            SimpleNamespace(etype='PROC_NEW', pid=1),
+            SimpleNamespace(etype='PROC_NEW', pid=2),
+            SimpleNamespace(etype='PAGE_NEW', pid=1, idx=0, swap=False, use=False),
+            SimpleNamespace(etype='PAGE_NEW', pid=2, idx=0, swap=False, use=False),
+            SimpleNamespace(etype='PAGE_NEW', pid=1, idx=1, swap=False, use=False),
+            SimpleNamespace(etype='PAGE_USE', pid=1, idx=0, use=True),
+            SimpleNamespace(etype='PAGE_USE', pid=1, idx=0, use=False),
+        ])
+
+        assert list(scheduler.evictable_pages) == [(2, 0), (1, 1), (1, 0)]
+        assert [page.key for page in scheduler.iter_evictable_pages()] == list(scheduler.pages)
+
+    def test_starvation_event_without_deadline_keeps_the_deadline(self, scheduler):
+        """Test that a starvation event sent without a deadline keeps the known one."""
+        scheduler([
+            SimpleNamespace(etype='PROC_NEW', pid=1),
+            SimpleNamespace(etype='PROC_STARV', pid=1, starvation_level=1,
+                            time_to_termination=0, deadline=30000),
+            SimpleNamespace(etype='PROC_STARV', pid=1, starvation_level=2,
+                            time_to_termination=0, deadline=None),
+        ])
+
+        assert scheduler.processes[1].starvation_level == 2
+        assert scheduler.processes[1].deadline == 30000
+        assert scheduler.next_idle_process_to_die().pid == 1
+
+    def test_idle_processes_are_ordered_by_deadline(self, scheduler):
+        """Test that the idle process that dies next is found from the deadlines."""
+        def starv(pid, deadline):
+            return SimpleNamespace(etype='PROC_STARV', pid=pid, starvation_level=1,
+                                   time_to_termination=0, deadline=deadline)
+
+        scheduler([
+            SimpleNamespace(etype='PROC_NEW', pid=1),
+            SimpleNamespace(etype='PROC_NEW', pid=2),
+            SimpleNamespace(etype='PROC_NEW', pid=3),
+            starv(1, 30000),
+            starv(2, 10000),
+            starv(3, 20000),
+        ], 5000)
+        assert scheduler.current_time == 5000
+        assert scheduler.next_idle_process_to_die().pid == 2
+        assert [proc.pid for proc in scheduler.idle_processes_by_deadline(2)] == [2, 3]
+
+        scheduler([
+            SimpleNamespace(etype='PROC_CPU', pid=2, cpu=True),
+            starv(3, 40000),
+        ])
+        assert scheduler.current_time is None
+        assert scheduler.next_idle_process_to_die().pid == 1
+        assert [proc.pid for proc in scheduler.idle_processes_by_deadline(5)] == [1, 3]
+
+        scheduler([
+            SimpleNamespace(etype='PROC_KILL', pid=1),
+            SimpleNamespace(etype='PROC_WAIT_IO', pid=3, waiting_for_io=True),
+        ])
+        assert scheduler.next_idle_process_to_die() is None
+
+
 class TestGameObjectsEmitEvents:
-    """Tests that real game objects emit events to game_monitor.
+    """Tests that real game objects emit events to the game monitor of their stage.
     
     These tests verify that the actual game objects (ProcessManager, PageManager, etc.)
-    call the appropriate game_monitor.notify_* functions when state changes occur.
+    call the appropriate GameMonitor.notify_* methods when state changes occur.
     """
 
+    @pytest.fixture
+    def stage(self, stage):
+        """Stage whose game objects record events, as if a scheduler was attached."""
+        stage.game_monitor.set_enabled(True)
+        return stage
+
+    @pytest.fixture
+    def stage_custom_config(self, stage_custom_config):
+        def create_stage(custom_config):
+            stage = stage_custom_config(custom_config)
+            stage.game_monitor.set_enabled(True)
+            return stage
+        return create_stage
+
     def test_process_manager_emits_process_new_event(self, stage):
         """Test that ProcessManager emits PROC_NEW event when creating processes at startup."""
         # Run updates to trigger process creation at startup
@@ -491,13 +760,27 @@ class TestGameObjectsEmitEvents:
             stage.process_manager.update(current_time, [])
             current_time += 1000
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         proc_new_events = [e for e in events if e.etype == 'PROC_NEW']
 
         # Stage config has num_processes_at_startup = 14
         assert len(proc_new_events) >= 14, "ProcessManager should emit PROC_NEW for each process at startup"
         assert proc_new_events[0].pid == 1, "First process should have pid=1"
 
+    def test_stages_do_not_share_events(self, stage_custom_config, stage_config):
+        """Test that two stages in the same process each receive only their own events."""
+        stage_1 = stage_custom_config(stage_config)
+        stage_2 = stage_custom_config(stage_config)
+
+        current_time = 0
+        for _ in range(20):
+            stage_1.process_manager.update(current_time, [])
+            current_time += 1000
+
+        proc_new_events = [e for e in stage_1.game_monitor.get_events() if e.etype == 'PROC_NEW']
+        assert len(proc_new_events) >= 14
+        assert not stage_2.game_monitor.has_events()
+
     def test_process_emits_page_new_event_when_using_cpu(self, stage, monkeypatch):
         """Test that Process emits PAGE_NEW event when it starts using CPU and creates pages."""
         # Run updates to create processes at startup
@@ -513,12 +796,12 @@ class TestGameObjectsEmitEvents:
         cpu = stage.process_manager.cpu_manager.select_free_cpu()
         assert cpu is not None, "Need a free CPU for this test"
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # When process uses CPU for the first time, it creates pages
         process.use_cpu()
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         page_new_events = [e for e in events if e.etype == 'PAGE_NEW']
 
         assert len(page_new_events) >= 1, "Process.use_cpu should emit PAGE_NEW events when creating pages"
@@ -532,11 +815,11 @@ class TestGameObjectsEmitEvents:
         
         io_queue.update(6000, [])
         
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
         
         io_queue.handle_player_action()
         
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         io_queue_events = [e for e in events if e.etype == 'IO_QUEUE']
         
         assert len(io_queue_events) >= 1, "IoQueue.handle_player_action should emit IO_QUEUE event"
@@ -553,12 +836,12 @@ class TestGameObjectsEmitEvents:
         # Use existing process from stage setup
         process = stage.process_manager.get_process(1)
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Toggle process (should assign to CPU)
         process.toggle()
         
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         proc_cpu_events = [e for e in events if e.etype == 'PROC_CPU']
         
         assert len(proc_cpu_events) >= 1, "Process.toggle should emit PROC_CPU event"
@@ -577,16 +860,42 @@ class TestGameObjectsEmitEvents:
         # Put process on CPU first so it becomes happy
         process.toggle()
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Run update to trigger happiness (starvation -> 0)
         process.update(current_time + process.cpu.process_happiness_ms + 1000, [])
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         starv_events = [e for e in events if e.etype == 'PROC_STARV']
 
         assert len(starv_events) >= 1, "Process should emit PROC_STARV when starvation level changes"
 
+    def test_starvation_events_carry_the_deadline(self, stage):
+        """Test that PROC_STARV events give the time at which the process is killed."""
+        current_time = 0
+        for _ in range(20):
+            stage.process_manager.update(current_time, [])
+            current_time += 1000
+
+        process = stage.process_manager.get_process(1)
+        new_process_deadlines = {
+            e.pid: e.deadline for e in stage.game_monitor.get_events() if e.etype == 'PROC_STARV'
+        }
+        deadline = new_process_deadlines[1]
+        assert deadline == process.starvation_deadline
+        assert deadline == current_time - 1000 + process.time_to_termination
+
+        stage.game_monitor.clear_events()
+        update_time = current_time
+        while process.starvation_level < DEAD_STARVATION_LEVEL:
+            process.update(update_time, [])
+            update_time += 100
+
+        starv_events = [e for e in stage.game_monitor.get_events() if e.etype == 'PROC_STARV']
+        assert starv_events
+        assert all(e.deadline == deadline for e in starv_events)
+        assert deadline <= update_time - 100 < deadline + 1000
+
     def test_process_emits_wait_page_event(self, stage):
         """Test that Process emits PROC_WAIT_PAGE event when waiting for page."""
         # Run updates to create processes at startup
@@ -612,12 +921,12 @@ class TestGameObjectsEmitEvents:
             if page.on_disk:
                 break
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Update process to trigger page availability check
         process.update(swap_time, [])
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         wait_page_events = [e for e in events if e.etype == 'PROC_WAIT_PAGE']
 
         assert len(wait_page_events) >= 1, "Process should emit PROC_WAIT_PAGE when waiting for page"
@@ -637,7 +946,7 @@ class TestGameObjectsEmitEvents:
         # Get page through PageManager
         page = stage.page_manager.get_page(process.pid, 0)
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Request swap
         page.request_swap()
@@ -652,7 +961,7 @@ class TestGameObjectsEmitEvents:
             if page.on_disk:
                 break
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         swap_events = [e for e in events if e.etype == 'PAGE_SWAP']
 
         assert len(swap_events) >= 1, "Page should emit PAGE_SWAP when swap completes"
@@ -672,12 +981,12 @@ class TestGameObjectsEmitEvents:
         # Get page through PageManager
         page = stage.page_manager.get_page(process.pid, 0)
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Request swap
         page.request_swap()
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         swap_queue_events = [e for e in events if e.etype == 'PAGE_SWAP_QUEUE']
 
         assert len(swap_queue_events) >= 1, "Page should emit PAGE_SWAP_QUEUE when swap requested"
@@ -700,7 +1009,7 @@ class TestGameObjectsEmitEvents:
         # Get page through PageManager
         page = stage.page_manager.get_page(process.pid, 0)
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Request swap
         page.request_swap()
@@ -708,7 +1017,7 @@ class TestGameObjectsEmitEvents:
         # Run update to start the swap
         stage.page_manager.update(current_time, [])
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         swap_start_events = [e for e in events if e.etype == 'PAGE_SWAP_START']
 
         assert len(swap_start_events) >= 1, "Page should emit PAGE_SWAP_START when swap starts"
@@ -733,12 +1042,12 @@ class TestGameObjectsEmitEvents:
         # Request swap
         page.request_swap()
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Cancel swap
         page.request_swap_cancellation()
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         swap_queue_events = [e for e in events if e.etype == 'PAGE_SWAP_QUEUE']
         
         assert len(swap_queue_events) >= 1, "Page should emit PAGE_SWAP_QUEUE when swap cancelled"
@@ -768,7 +1077,7 @@ class TestGameObjectsEmitEvents:
         num_pages = len(pages_for_process)
         assert num_pages > 0, "Process should have created at least one page"
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Remove process from CPU so it can starve
         process.yield_cpu()
@@ -777,7 +1086,7 @@ class TestGameObjectsEmitEvents:
         for i in range(1, DEAD_STARVATION_LEVEL + 1):
             process.update(current_time + i * process.time_between_starvation_levels, [])
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         page_free_events = [e for e in events if e.etype == 'PAGE_FREE']
 
         assert len(page_free_events) == num_pages, \
@@ -794,13 +1103,13 @@ class TestGameObjectsEmitEvents:
         # Use existing process from stage setup
         process = stage.process_manager.get_process(1)
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Starve the process to death
         for i in range(1, DEAD_STARVATION_LEVEL + 1):
             process.update(current_time + i * process.time_between_starvation_levels, [])
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         kill_events = [e for e in events if e.etype == 'PROC_KILL']
 
         assert len(kill_events) >= 1, "Process should emit PROC_KILL when killed"
@@ -828,12 +1137,12 @@ class TestGameObjectsEmitEvents:
         process = stage.process_manager.get_process(1)
         process.toggle()
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Update process to trigger graceful termination
         process.update(current_time + 1000, [])
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         term_events = [e for e in events if e.etype == 'PROC_TERM']
 
         assert len(term_events) >= 1, "Process should emit PROC_TERM when gracefully terminated"
@@ -864,12 +1173,12 @@ class TestGameObjectsEmitEvents:
         # Gracefully terminate via update
         process.update(current_time + 1000, [])
 
-        game_monitor.clear_events()
+        stage.game_monitor.clear_events()
 
         # Yield CPU (this should trigger PROC_END)
         process.yield_cpu()
 
-        events = game_monitor.get_events()
+        events = stage.game_monitor.get_events()
         end_events = [e for e in events if e.etype == 'PROC_END']
 
         assert len(end_events) >= 1, "Process should emit PROC_END when terminated process yields CPU"
@@ -923,8 +1232,8 @@ def scheduler(events):
             lambda pid: MockProcess(pid)
         )
         
-        game_monitor.clear_events()
-        game_monitor.notify_process_new(1)
+        stage_with_script.game_monitor.clear_events()
+        stage_with_script.game_monitor.notify_process_new(1)
         
         # Call update to trigger script processing
         stage_with_script.update(0, [])
@@ -935,6 +1244,111 @@ def scheduler(events):
         assert pid == 1
         assert to_e_core is False  # Default value when not specified
 
+    def test_scheduler_is_passed_the_current_time(self, stage_config, scene_manager):
+        """Test that a Scheduler gets the game time, and that plain functions still work."""
+        script_source = '''
+from automation import Scheduler
+
+class TimedScheduler(Scheduler):
+    def __init__(self):
+        super().__init__()
+        self.times = []
+
+    def schedule(self):
+        self.times.append(self.current_time)
+
+scheduler = TimedScheduler()
+'''
+        stage = Stage('Test Stage', stage_config,
+                      script=compile(script_source, '<test>', 'exec'), standalone=True)
+        stage.scene_manager = scene_manager
+        stage.setup()
+
+        stage.update(0, [])
+        stage.update(50, [])
+
+        assert stage._script_callback.times == [0, 50]
+
+    @pytest.mark.parametrize('parameters, extra_argument, expected', [
+        ('events, *args', 'args', ()),
+        ('events, state=None', 'state', None),
+    ])
+    def test_plain_functions_are_not_passed_the_current_time(
+            self, parameters, extra_argument, expected, stage_config, scene_manager):
+        """Test that scripts that do not opt in only get the events,
+        even if they could take a second argument."""
+        script_source = f'''
+def scheduler({parameters}):
+    scheduler.extra_arguments.append({extra_argument})
+    return []
+
+scheduler.extra_arguments = []
+'''
+        stage = Stage('Test Stage', stage_config,
+                      script=compile(script_source, '<test>', 'exec'), standalone=True)
+        stage.scene_manager = scene_manager
+        stage.setup()
+
+        stage.update(0, [])
+
+        assert stage._script_callback.extra_arguments == [expected]
+
+    def test_scripts_called_every_frame_skip_no_frame(self, stage_config, scene_manager,
+                                                      monkeypatch):
+        """Test that the game objects are not asked for their next update
+        when the script is called every frame anyway."""
+        stage = Stage('Test Stage', stage_config,
+                      script=compile('def scheduler(events): return []', '<test>', 'exec'),
+                      standalone=True)
+        stage.scene_manager = scene_manager
+        stage.setup()
+        stage.update(0, [])
+
+        def fail(_current_time):
+            raise AssertionError('next_update_time of a game object was called')
+        monkeypatch.setattr(stage.process_manager, 'next_update_time', fail)
+
+        assert stage.next_update_time(16) == 16
+
+    def test_overridden_call_is_not_passed_the_current_time(self):
+        """Test that subclasses overriding __call__ opt out unless they opt in again."""
+        from automation.api import Scheduler
+
+        class EventsOnlyScheduler(Scheduler):
+            def __call__(self, events):
+                return super().__call__(events)
+
+        class TimedScheduler(EventsOnlyScheduler):
+            accepts_current_time = True
+
+            def __call__(self, events, current_time=None):
+                return super(EventsOnlyScheduler, self).__call__(events, current_time)
+
+        assert Scheduler.accepts_current_time
+        assert not EventsOnlyScheduler.accepts_current_time
+        assert not type('Derived', (EventsOnlyScheduler,), {}).accepts_current_time
+        assert TimedScheduler.accepts_current_time
+
+    def test_plain_functions_can_opt_in_to_the_current_time(self, stage_config, scene_manager):
+        """Test that a function with accepts_current_time set gets the game time."""
+        script_source = '''
+def scheduler(events, current_time):
+    scheduler.times.append(current_time)
+    return []
+
+scheduler.times = []
+scheduler.accepts_current_time = True
+'''
+        stage = Stage('Test Stage', stage_config,
+                      script=compile(script_source, '<test>', 'exec'), standalone=True)
+        stage.scene_manager = scene_manager
+        stage.setup()
+
+        stage.update(0, [])
+        stage.update(50, [])
+
+        assert stage._script_callback.times == [0, 50]
+
     def test_script_uses_to_e_core_parameter(self, stage_config, scene_manager, monkeypatch):
         """Test that script can use to_e_core parameter in move_process."""
         script_source = '''
@@ -972,8 +1386,8 @@ def scheduler(events):
             lambda pid: mock_process
         )
         
-        game_monitor.clear_events()
-        game_monitor.notify_process_new(1)
+        stage.game_monitor.clear_events()
+        stage.game_monitor.notify_process_new(1)
         
         stage.update(0, [])
         
@@ -986,8 +1400,8 @@ def scheduler(events):
 
     def test_stage_without_script_does_not_crash(self, stage_without_script):
         """Test that stage without script handles update without errors."""
-        game_monitor.clear_events()
-        game_monitor.notify_process_new(1)
+        stage_without_script.game_monitor.clear_events()
+        stage_without_script.game_monitor.notify_process_new(1)
         
         # Should not raise
         stage_without_script.update(0, [])
@@ -1022,8 +1436,8 @@ def scheduler(events):
             lambda pid, idx: MockPage(pid, idx)
         )
         
-        game_monitor.clear_events()
-        game_monitor.notify_page_new(1, 0, False, True)
+        stage.game_monitor.clear_events()
+        stage.game_monitor.notify_page_new(1, 0, False, True)
         
         stage.update(0, [])
         
@@ -1052,8 +1466,8 @@ def scheduler(events):
             lambda: io_processed.append(True)
         )
         
-        game_monitor.clear_events()
-        game_monitor.notify_io_event_count(5)
+        stage.game_monitor.clear_events()
+        stage.game_monitor.notify_io_event_count(5)
         
         stage.update(0, [])
         
@@ -1071,8 +1485,8 @@ def scheduler(events):
             raise_error
         )
         
-        game_monitor.clear_events()
-        game_monitor.notify_process_new(1)
+        stage_with_script.game_monitor.clear_events()
+        stage_with_script.game_monitor.notify_process_new(1)
         
         # Should not raise
         stage_with_script.update(0, [])
@@ -1092,8 +1506,8 @@ x = 1
         stage.scene_manager = scene_manager
         stage.setup()
         
-        game_monitor.clear_events()
-        game_monitor.notify_process_new(1)
+        stage.game_monitor.clear_events()
+        stage.game_monitor.notify_process_new(1)
         
         # Should not raise
         stage.update(0, [])
@@ -1133,8 +1547,8 @@ def scheduler(events):
             lambda pid: MockProcess()
         )
 
-        game_monitor.clear_events()
-        game_monitor.notify_process_new(1)
+        stage.game_monitor.clear_events()
+        stage.game_monitor.notify_process_new(1)
 
         # If cpu_core_types wasn't available, no action would have been generated
         # and toggle wouldn't have been called
@@ -1203,8 +1617,8 @@ def scheduler(events):
             lambda pid: MockProcess()
         )
 
-        game_monitor.clear_events()
-        game_monitor.notify_process_new(1)
+        stage.game_monitor.clear_events()
+        stage.game_monitor.notify_process_new(1)
 
         # If cpu_core_types had wrong values, no action would have been generated
         stage.update(0, [])
@@ -1380,3 +1794,90 @@ stage = Stage("Test Sandbox", config)
 
         compiled = compile_auto_script(str(rel_script))
         assert compiled is not None
+
+    def test_simulate_stage_runs_headless(self, temp_script):
+        """Test simulate_stage runs the stage up to the time limit and summarizes it."""
+        from auto import compile_auto_script, create_stage, simulate_stage
+        from config.difficulty_levels import difficulty_levels_map
+
+        easy = difficulty_levels_map['easy']
+        stage = create_stage(compile_auto_script(temp_script), (easy.config, 'Easy'))
+        result = simulate_stage(stage, 5000)
+
+        assert result['stage'] == 'Easy'
+        assert result['state'] == 'PLAYING'
+        assert result['simulated_time_ms'] <= 5000
+        assert result['uptime_ms'] == 4000
+        assert result['score'] >= 0
+        assert result['user_terminated_process_count'] == 0
+
+    def test_simulate_stage_stops_on_defeat(self, temp_script):
+        """Test simulate_stage stops as soon as the stage is completed."""
+        from auto import compile_auto_script, create_stage, simulate_stage
+        from config.stage_config import StageConfig
+
+        config = StageConfig(max_processes_terminated_by_user=0)
+        stage = create_stage(compile_auto_script(temp_script), (config, 'Test'))
+        result = simulate_stage(stage, 60000)
+
+        assert result['state'] == 'DEFEAT'
+        assert result['simulated_time_ms'] < 60000
+
+    @pytest.mark.parametrize('difficulty', ['easy', 'normal', 'insane'])
+    def test_simulate_stage_skipping_idle_frames_gives_same_result(
+            self, difficulty, tmp_path, monkeypatch):
+        """Test simulate_stage gives the same result when idle frames are skipped."""
+        from os import path
+        from auto import compile_auto_script, create_stage, simulate_stage
+        from config.difficulty_levels import difficulty_levels_map
+
+        monkeypatch.syspath_prepend(path.abspath('..'))
+        script_file = tmp_path / "event_driven_script.py"
+        script_file.write_text('''
+from automation import Scheduler
+
+class EventDrivenScheduler(Scheduler):
+    wakeup_interval_ms = None
+
+    def __init__(self):
+        super().__init__()
+        self.event_types = []
+        self.requested = set()
+
+    def __call__(self, events):
+        self.event_types.extend(event.etype for event in events)
+        return super().__call__(events)
+
+    def _update_PROC_CPU(self, event):
+        super()._update_PROC_CPU(event)
+        self.requested.discard(event.pid)
+
+    def schedule(self):
+        if self.io_queue.io_count > 0:
+            self.do_io()
+            self.io_queue.io_count = 0
+        free_cpus = num_cpus - self.used_cpus
+        for proc in self.processes.values():
+            if proc.pid in self.requested:
+                continue
+            if proc.has_cpu and (proc.has_ended or proc.waiting_for_io):
+                self.move_process(proc.pid)
+                self.requested.add(proc.pid)
+            elif not proc.has_cpu and not proc.waiting_for_io and free_cpus > 0:
+                self.move_process(proc.pid)
+                self.requested.add(proc.pid)
+                free_cpus -= 1
+
+scheduler = EventDrivenScheduler()
+''')
+
+        def run(skip_idle_frames):
+            level = difficulty_levels_map[difficulty]
+            stage = create_stage(
+                compile_auto_script(str(script_file)), (level.config, level.name))
+            stage.seed = 0
+            result = simulate_stage(stage, 120000, skip_idle_frames=skip_idle_frames)
+            del result['wall_time_s']
+            return result, stage._script_callback.event_types
+
+        assert run(True) == run(False)
@@ -0,0 +1,70 @@
+import pytest
+
+from benchmark import (
+    MAX_LOAD_CONFIG_NAME, benchmark_configs, compare_results, format_regressions,
+    format_results, run_benchmark, summarize_times
+)
+from config.difficulty_levels import difficulty_levels_map
+
+
+def _result(update_p50, render_p50):
+    return {
+        'frames': 100,
+        'update': {'p50': update_p50, 'p99': update_p50 * 2, 'max': update_p50 * 10},
+        'render': {'p50': render_p50, 'p99': render_p50 * 2, 'max': render_p50 * 10},
+    }
+
+
+class TestBenchmark:
+    def test_configs_include_difficulty_levels_and_max_load(self):
+        assert list(benchmark_configs.keys()) == [
+            *difficulty_levels_map.keys(), MAX_LOAD_CONFIG_NAME
+        ]
+
+    def test_summarize_times(self):
+        summary = summarize_times([float(i) for i in range(101)])
+
+        assert summary == {'p50': 50, 'p99': 99, 'max': 100}
+
+    def test_compare_results_flags_slowdowns_above_threshold(self):
+        baseline = {'easy': _result(1.0, 10.0)}
+        results = {'easy': _result(1.3, 10.5)}
+
+        regressions = compare_results(baseline, results, 20)
+
+        assert [(r['method'], r['stat']) for r in regressions] == [
+            ('update', 'p50'), ('update', 'p99')
+        ]
+        assert regressions[0]['baseline_ms'] == 1.0
+        assert regressions[0]['current_ms'] == 1.3
+        assert 'easy update p50' in format_regressions(regressions)
+
+    def test_regressions_from_a_zero_baseline(self):
+        baseline = {'easy': _result(0.0, 10.0)}
+        results = {'easy': _result(0.25, 10.0)}
+
+        regressions = compare_results(baseline, results, 20)
+
+        assert [(r['method'], r['stat']) for r in regressions] == [
+            ('update', 'p50'), ('update', 'p99')
+        ]
+        assert format_regressions(regressions).splitlines()[0] == (
+            'REGRESSION easy update p50: 0.000 ms -> 0.250 ms (+0.250 ms)'
+        )
+
+    def test_compare_results_ignores_max_and_missing_configs(self):
+        baseline = {'easy': _result(1.0, 10.0)}
+        slower_max = _result(1.0, 10.0)
+        slower_max['update']['max'] *= 10
+
+        assert compare_results(baseline, {'easy': slower_max, 'hard': _result(5, 50)}, 20) == []
+
+    def test_run_benchmark_times_each_frame(self):
+        result = run_benchmark('easy', 'automation/example.py', 160, 0)
+
+        assert result['frames'] == 11
+        for method in ('update', 'render'):
+            assert 0 < result[method]['p50'] <= result[method]['p99'] <= result[method]['max']
+
+        table = format_results({'easy': result})
+        assert len(table.splitlines()) == 1 + 2
@@ -0,0 +1,66 @@
+from os import path
+
+import pytest
+
+from cli_utils import (
+    from_project_root, get_stage_or_difficulty, load_sandbox_stage, percentile, read_recording
+)
+from config.difficulty_levels import difficulty_levels_map
+from event_recorder import EventRecorder
+from scenes.stage import Stage
+
+
+class TestCliUtils:
+    def test_from_project_root(self, tmp_path):
+        assert from_project_root(str(tmp_path)) == str(tmp_path)
+        assert from_project_root('script.py') == path.abspath(path.join('..', 'script.py'))
+
+    def test_percentile(self):
+        assert percentile([1, 2, 3, 4, 5], 50) == 3
+        assert percentile([1, 2, 3, 4, 5], 95) == pytest.approx(4.8)
+        assert percentile([10, 20], 0) == 10
+        assert percentile([10, 20], 100) == 20
+        assert percentile([7], 99) == 7
+
+    def test_get_stage_or_difficulty(self):
+        config, name = get_stage_or_difficulty('hard')
+
+        assert config == difficulty_levels_map['hard'].config
+        assert name == 'Difficulty: HARD'
+        assert isinstance(get_stage_or_difficulty(sandbox='sandbox.sample'), Stage)
+
+    def test_load_sandbox_stage_returns_a_new_stage_each_time(self):
+        first = load_sandbox_stage('sandbox.sample')
+        second = load_sandbox_stage('sandbox.sample')
+
+        assert first.name == second.name == 'Sandbox'
+        assert first is not second
+
+    def test_load_sandbox_stage_errors(self, tmp_path, monkeypatch):
+        module_dir = tmp_path / "bad_sandbox"
+        module_dir.mkdir()
+        (module_dir / "__init__.py").write_text("")
+        (module_dir / "no_stage.py").write_text("x = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        with pytest.raises(ValueError, match='not found'):
+            load_sandbox_stage('nonexistent.module')
+        with pytest.raises(ValueError, match="must define 'stage'"):
+            load_sandbox_stage('bad_sandbox.no_stage')
+
+    def test_read_recording(self, tmp_path):
+        filename = tmp_path / 'run.events'
+        metadata = {'difficulty': 'easy', 'sandbox': None, 'seed': 3, 'step_ms': 16}
+        with EventRecorder(filename, metadata=metadata) as recorder:
+            recorder.record_action(16, {'type': 'io_queue'})
+            recorder.record_end(32, 100)
+
+        assert read_recording(filename) == (metadata, (32, 100), [(16, {'type': 'io_queue'})])
+
+    def test_incomplete_recordings_cannot_be_read(self, tmp_path):
+        filename = tmp_path / 'run.events'
+        with EventRecorder(filename, metadata={'seed': 3, 'step_ms': 16}) as recorder:
+            recorder.record_action(16, {'type': 'io_queue'})
+
+        with pytest.raises(ValueError, match='complete run'):
+            read_recording(filename)
@@ -0,0 +1,169 @@
+from math import inf
+
+import pytest
+
+from event_recorder import (
+    ACTION_PAGE, ACTION_PROCESS, DROPPED, HEADER_SIZE, RECORD_SIZE, EventLogReader, EventRecorder
+)
+from game_monitor import EventType, GameMonitor
+from scenes import stage as stage_module
+from scenes.stage import Stage
+
+
+@pytest.fixture
+def monitor():
+    monitor = GameMonitor()
+    monitor.set_enabled(True)
+    return monitor
+
+
+class TestEventRecorder:
+    def test_events_and_actions_round_trip(self, tmp_path, monitor):
+        filename = tmp_path / 'run.events'
+        monitor.notify_page_new(1, 2, False, True)
+        monitor.notify_process_starvation(1, 3, inf, 21000)
+        monitor.notify_io_event_count(4)
+
+        with EventRecorder(filename) as recorder:
+            recorder.record_events(1000, monitor)
+            recorder.record_action(1000, {'type': 'process', 'pid': 1, 'to_e_core': True})
+            recorder.record_action(1000, {'type': 'page', 'pid': 1, 'idx': 2})
+            recorder.record_action(1000, {'type': 'unknown'})
+
+        with EventLogReader(filename) as reader:
+            assert len(reader) == 5
+            assert reader[0] == (1000, EventType.PAGE_NEW.value, 1, 2, 0, 1)
+            assert reader[-1] == (1000, ACTION_PAGE, 1, 2, 0, 0)
+
+            events = [event for _, event in reader.events()]
+            assert [event.etype for event in events] == ['PAGE_NEW', 'PROC_STARV', 'IO_QUEUE']
+            assert (events[0].swap, events[0].use) == (False, True)
+            assert (events[1].starvation_level, events[1].time_to_termination) == (3, inf)
+            assert events[1].deadline == 21000
+            assert events[2].io_count == 4
+
+            assert list(reader.actions()) == [
+                (1000, {'type': 'process', 'pid': 1, 'to_e_core': True}),
+                (1000, {'type': 'page', 'pid': 1, 'idx': 2}),
+            ]
+
+    def test_dropped_events_make_the_recording_lossy(self, tmp_path):
+        filename = tmp_path / 'run.events'
+        monitor = GameMonitor(capacity=2)
+        monitor.set_enabled(True)
+
+        with EventRecorder(filename) as recorder:
+            recorder.record_events(0, monitor)
+            assert not recorder.lossy
+            for pid in range(5):
+                monitor.notify_process_new(pid)
+            recorder.record_events(1000, monitor)
+            assert recorder.lossy
+
+        with EventLogReader(filename) as reader:
+            assert reader.lossy
+            assert list(reader) == [
+                (1000, DROPPED, 3, 0, 0, 0),
+                (1000, EventType.PROC_NEW.value, 3, 0, 0, 0),
+                (1000, EventType.PROC_NEW.value, 4, 0, 0, 0),
+            ]
+            assert [event.pid for _, event in reader.events()] == [3, 4]
+
+    def test_records_are_written_in_chunks(self, tmp_path):
+        filename = tmp_path / 'run.events'
+        recorder = EventRecorder(filename, chunk_records=4)
+
+        for time in range(6):
+            recorder.record(time, ACTION_PROCESS, time)
+        assert filename.stat().st_size == HEADER_SIZE + 4 * RECORD_SIZE
+
+        recorder.close()
+        assert filename.stat().st_size == HEADER_SIZE + 6 * RECORD_SIZE
+        with EventLogReader(filename) as reader:
+            assert [record[0] for record in reader] == list(range(6))
+            assert not reader.lossy
+
+    def test_reader_rejects_other_files(self, tmp_path):
+        filename = tmp_path / 'not.events'
+        filename.write_bytes(b'not an event log')
+
+        with pytest.raises(ValueError):
+            EventLogReader(filename)
+
+    def test_to_numpy(self, tmp_path, monitor):
+        import numpy # pylint: disable=import-outside-toplevel
+        filename = tmp_path / 'run.events'
+        monitor.notify_process_new(7)
+        with EventRecorder(filename) as recorder:
+            recorder.record_events(500, monitor)
+
+        with EventLogReader(filename) as reader:
+            records = reader.to_numpy()
+            assert records['time'].tolist() == [500]
+            assert records['a'].tolist() == [7]
+            assert numpy.all(records['code'] == EventType.PROC_NEW.value)
+
+    def test_to_numpy_array_outlives_the_reader(self, tmp_path, monitor):
+        filename = tmp_path / 'run.events'
+        monitor.notify_process_new(7)
+        monitor.notify_process_new(8)
+        with EventRecorder(filename) as recorder:
+            recorder.record_events(500, monitor)
+
+        with EventLogReader(filename) as reader:
+            records = reader.to_numpy()
+        assert records['a'].tolist() == [7, 8]
+
+        reader = EventLogReader(filename)
+        times = reader.to_numpy()['time']
+        reader.close()
+        reader.close()
+        assert times.tolist() == [500, 500]
+
+    def test_stage_records_script_events_and_actions(self, tmp_path, stage_config, scene_manager):
+        script_source = '''
+def scheduler(events):
+    return [
+        {'type': 'process', 'pid': event.pid}
+        for event in events if event.etype == 'PROC_NEW'
+    ]
+'''
+        filename = tmp_path / 'run.events'
+        stage = Stage('Test Stage', stage_config,
+                      script=compile(script_source, '<test>', 'exec'), standalone=True)
+        stage.scene_manager = scene_manager
+        stage.event_recorder = EventRecorder(filename)
+        stage.setup()
+
+        for time in range(0, 5000, 50):
+            stage.update(time, [])
+        stage.event_recorder.close()
+
+        with EventLogReader(filename) as reader:
+            new_pids = [event.pid for _, event in reader.events() if event.etype == 'PROC_NEW']
+            action_pids = [action['pid'] for _, action in reader.actions()]
+        assert new_pids
+        assert action_pids == new_pids
+
+    def test_stage_warns_when_events_are_dropped(self, tmp_path, stage_config, scene_manager,
+                                                 monkeypatch):
+        monkeypatch.setattr(stage_module, 'GameMonitor', lambda: GameMonitor(capacity=1))
+        filename = tmp_path / 'run.events'
+        stage = Stage('Test Stage', stage_config,
+                      script=compile('def scheduler(events): return []', '<test>', 'exec'),
+                      standalone=True)
+        stage.scene_manager = scene_manager
+        stage.event_recorder = EventRecorder(filename)
+        stage.setup()
+
+        with pytest.warns(RuntimeWarning, match='game events were dropped') as warnings:
+            for time in range(0, 5000, 50):
+                stage.update(time, [])
+        stage.event_recorder.close()
+
+        assert len(warnings) == 1
+        assert stage.dropped_event_count > 0
+        with EventLogReader(filename) as reader:
+            assert reader.lossy
+            assert sum(record[2] for record in reader if record[1] == DROPPED) \
+                == stage.dropped_event_count
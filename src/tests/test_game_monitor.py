@@ -6,11 +6,13 @@ class TestGameMonitor:
     """Tests for the game_monitor module that collects game events."""
 
     def setup_method(self):
-        """Clear events before each test."""
+        """Record events from an empty buffer in each test."""
         game_monitor.clear_events()
+        game_monitor.set_enabled(True)
 
     def teardown_method(self):
         """Clear events after each test."""
+        game_monitor.set_enabled(False)
         game_monitor.clear_events()
 
     def test_clear_events(self):
@@ -133,6 +135,14 @@ class TestGameMonitor:
         assert events[0].starvation_level == 3
         assert events[0].time_to_termination == 30000
 
+    def test_notify_process_starvation_with_deadline(self):
+        """Test process starvation event with the deadline of the process."""
+        game_monitor.notify_process_starvation(
+            pid=1, level=3, time_to_termination=30000, deadline=45000)
+        events = game_monitor.get_events()
+        assert len(events) == 1
+        assert events[0].deadline == 45000
+
     def test_notify_process_wait_io(self):
         """Test process waiting for IO event generation."""
         game_monitor.notify_process_wait_io(pid=1, value=True)
@@ -186,3 +196,56 @@ class TestGameMonitor:
         assert events[0].etype == 'PROC_NEW'
         assert events[1].etype == 'PAGE_NEW'
         assert events[2].etype == 'PROC_CPU'
+
+    def test_events_are_not_recorded_when_disabled(self):
+        """Test that notifying events is a no-op while no consumer is attached."""
+        game_monitor.set_enabled(False)
+        game_monitor.notify_process_new(1)
+        game_monitor.notify_page_use(1, 0, True)
+        assert not game_monitor.has_events()
+        assert game_monitor.get_events() == []
+
+    def test_oldest_events_are_dropped_when_buffer_is_full(self):
+        """Test that a full buffer overwrites its oldest events and counts them."""
+        monitor = game_monitor.GameMonitor(capacity=3)
+        monitor.set_enabled(True)
+
+        for pid in range(5):
+            monitor.notify_process_new(pid)
+
+        events = monitor.get_events()
+        assert [event.pid for event in events] == [2, 3, 4]
+        assert monitor.dropped_event_count == 2
+
+        monitor.clear_events()
+        assert not monitor.has_events()
+        assert monitor.dropped_event_count == 0
+
+        monitor.notify_process_end(5)
+        assert [event.pid for event in monitor.get_events()] == [5]
+
+    def test_raw_events_have_integer_codes(self):
+        """Test that raw events give the value of the event type, and None for unused values."""
+        monitor = game_monitor.GameMonitor()
+        monitor.set_enabled(True)
+
+        monitor.notify_process_cpu(1, True)
+
+        assert list(monitor.get_raw_events()) == [
+            (game_monitor.EventType.PROC_CPU.value, 1, True, None, None)
+        ]
+
+    def test_monitors_record_events_separately(self):
+        """Test that monitors do not share events with each other or the default monitor."""
+        monitor_1 = game_monitor.GameMonitor()
+        monitor_2 = game_monitor.GameMonitor()
+        monitor_1.set_enabled(True)
+        monitor_2.set_enabled(True)
+
+        monitor_1.notify_process_new(1)
+        monitor_2.notify_process_new(2)
+        monitor_2.notify_process_end(2)
+
+        assert [event.pid for event in monitor_1.get_events()] == [1]
+        assert [event.etype for event in monitor_2.get_events()] == ['PROC_NEW', 'PROC_END']
+        assert not game_monitor.has_events()
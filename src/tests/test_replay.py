@@ -0,0 +1,93 @@
+import pytest
+
+from auto import create_stage, simulate_stage
+from config.difficulty_levels import difficulty_levels_map
+from engine.game_manager import GameManager
+from event_recorder import ACTION_PROCESS, EventLogReader, EventRecorder
+from replay import ReplayScheduler, replay_run
+
+_SCRIPT = '''
+def scheduler(events):
+    return [
+        {'type': 'process', 'pid': event.pid}
+        for event in events if event.etype in ('PROC_NEW', 'PROC_STARV')
+    ]
+'''
+
+
+def record_run(filename, *, seed=7, time_limit_ms=20000, metadata=None):
+    difficulty = difficulty_levels_map['normal']
+    stage = create_stage(
+        compile(_SCRIPT, '<test>', 'exec'), (difficulty.config, difficulty.name))
+    stage.seed = seed
+    if metadata is None:
+        metadata = {'difficulty': 'normal', 'seed': seed, 'step_ms': 1000 // GameManager.fps}
+    with EventRecorder(filename, metadata=metadata) as recorder:
+        stage.event_recorder = recorder
+        result = simulate_stage(stage, time_limit_ms)
+        recorder.record_end(result['simulated_time_ms'], result['score'])
+    return result
+
+
+class StubStage:
+    last_update_time = 0
+
+
+class TestReplayScheduler:
+    def test_returns_actions_at_their_time(self):
+        stage = StubStage()
+        action = {'type': 'io_queue'}
+        scheduler = ReplayScheduler(stage, [(100, action), (100, action), (300, action)])
+
+        assert scheduler.wakeup_interval_ms == 100
+        stage.last_update_time = 50
+        assert scheduler([]) == []
+        assert scheduler.wakeup_interval_ms == 50
+        stage.last_update_time = 100
+        assert scheduler([]) == [action, action]
+        assert scheduler.wakeup_interval_ms == 200
+        stage.last_update_time = 300
+        assert scheduler([]) == [action]
+        assert scheduler.wakeup_interval_ms is None
+
+
+class TestReplay:
+    def test_replay_matches_recording(self, tmp_path):
+        recorded = record_run(tmp_path / 'run.events')
+
+        result = replay_run(tmp_path / 'run.events', tmp_path / 'replay.events')
+
+        assert result['first_difference'] is None
+        assert result['score'] == result['recorded_score'] == recorded['score']
+
+    def test_replay_detects_different_actions(self, tmp_path):
+        record_run(tmp_path / 'run.events')
+        with EventLogReader(tmp_path / 'run.events') as reader:
+            metadata = reader.metadata
+            records = list(reader)
+        first_action = next(i for i, record in enumerate(records) if record[1] == ACTION_PROCESS)
+        # Drop the first action of the script from the recording.
+        with EventRecorder(tmp_path / 'edited.events', metadata=metadata) as recorder:
+            for record in records[:first_action] + records[first_action + 1:]:
+                recorder.record(*record)
+
+        result = replay_run(tmp_path / 'edited.events', tmp_path / 'replay.events')
+
+        assert result['first_difference'] is not None
+        assert result['first_difference'][0] >= first_action
+
+    def test_rendered_frames_are_saved(self, tmp_path):
+        record_run(tmp_path / 'run.events', time_limit_ms=2000)
+
+        replay_run(tmp_path / 'run.events', tmp_path / 'replay.events',
+                   render_frame_times=[1000, 1010], render_dir=tmp_path)
+
+        # Times are rounded down to the frame they fall in (one frame every 16 ms).
+        assert (tmp_path / 'frame-992.png').stat().st_size > 0
+        assert (tmp_path / 'frame-1008.png').stat().st_size > 0
+
+    def test_runs_without_seed_cannot_be_replayed(self, tmp_path):
+        record_run(tmp_path / 'run.events', metadata={'difficulty': 'normal', 'seed': None})
+
+        with pytest.raises(ValueError):
+            replay_run(tmp_path / 'run.events', tmp_path / 'replay.events')
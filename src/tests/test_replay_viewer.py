@@ -0,0 +1,101 @@
+import pygame
+import pytest
+
+from engine.game_event import GameEvent
+from engine.game_event_type import GameEventType
+from engine.scene_manager import SceneManager
+from replay_viewer import ReplayTimeline, ReplayViewer
+from tests.test_replay import record_run
+from window_size import WINDOW_SIZE
+
+
+def _snapshot(stage):
+    return (
+        stage.score_manager.score,
+        stage.uptime_manager.uptime_ms,
+        [
+            (slot.process.pid, slot.process.starvation_level)
+            for slot in stage.process_manager.process_slots
+            if slot.process is not None
+        ],
+    )
+
+
+@pytest.fixture
+def recording(tmp_path):
+    filename = tmp_path / 'run.events'
+    result = record_run(filename, time_limit_ms=10000)
+    return filename, result
+
+
+class TestReplayTimeline:
+    def test_keeps_a_keyframe_every_interval(self, recording):
+        filename, _ = recording
+
+        timeline = ReplayTimeline(filename, keyframe_interval_ms=2000)
+
+        assert timeline.keyframe_count == 6
+        assert timeline.current_time == 0
+
+    def test_seeking_matches_playing_through(self, recording):
+        filename, result = recording
+        timeline = ReplayTimeline(filename, keyframe_interval_ms=2000)
+        snapshots = {}
+        while timeline.current_time < timeline.end_time:
+            timeline.step()
+            snapshots[timeline.current_time] = _snapshot(timeline.stage)
+
+        assert timeline.stage.score_manager.score == result['score']
+        for target_time in (7000, 3010, 3024, 9984, 16, 5008):
+            timeline.seek(target_time)
+            assert timeline.current_time == target_time - target_time % timeline.step_ms
+            assert _snapshot(timeline.stage) == snapshots[timeline.current_time]
+
+    def test_seek_is_limited_to_the_run(self, recording):
+        filename, _ = recording
+        timeline = ReplayTimeline(filename)
+
+        timeline.seek(-1000)
+        assert timeline.current_time == 0
+        timeline.seek(timeline.end_time + 1000)
+        assert timeline.current_time == timeline.end_time
+
+
+class TestReplayViewer:
+    @pytest.fixture
+    def viewer(self, recording):
+        filename, _ = recording
+        scene_manager = SceneManager()
+        scene_manager.screen = pygame.Surface(WINDOW_SIZE)
+        viewer = ReplayViewer(ReplayTimeline(filename))
+        scene_manager.start_scene(viewer, 0)
+        return viewer
+
+    @staticmethod
+    def _key_up(key, shift=False):
+        return GameEvent(GameEventType.KEY_UP, {'key': key, 'shift': shift})
+
+    def test_plays_in_real_time(self, viewer):
+        viewer.update(0, [])
+        viewer.update(1000, [])
+        viewer.render()
+
+        assert viewer.timeline.current_time == 992
+
+    def test_hotkeys(self, viewer):
+        timeline = viewer.timeline
+        viewer.update(0, [self._key_up('space')])
+        viewer.update(1000, [])
+        assert timeline.current_time == 0
+
+        viewer.update(1000, [self._key_up('right')])
+        assert timeline.current_time == 4992
+        viewer.update(1000, [self._key_up('.')])
+        assert timeline.current_time == 5008
+        viewer.update(1000, [self._key_up(','), self._key_up(',')])
+        assert timeline.current_time == 4976
+        viewer.update(1000, [self._key_up('right', shift=True)])
+        assert timeline.current_time == timeline.end_time
+        viewer.update(1000, [self._key_up('home')])
+        assert timeline.current_time == 0
+        viewer.render()
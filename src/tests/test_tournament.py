@@ -0,0 +1,79 @@
+import pytest
+
+from tournament import aggregate_results, format_table, run_match, run_tournament, summarize
+
+
+class TestTournament:
+    @pytest.fixture
+    def temp_script(self, tmp_path):
+        script_file = tmp_path / "test_script.py"
+        script_file.write_text("def scheduler(events): return []\n")
+        return str(script_file)
+
+    def test_summarize(self):
+        summary = summarize([4, 1, 3, 2, 5])
+
+        assert summary['mean'] == 3
+        assert summary['median'] == 3
+        assert summary['p5'] == pytest.approx(1.2)
+        assert summary['p95'] == pytest.approx(4.8)
+
+    def test_summarize_single_value(self):
+        assert summarize([7]) == {'mean': 7, 'median': 7, 'p5': 7, 'p95': 7}
+
+    def test_aggregate_results_groups_by_script_and_difficulty(self):
+        results = [
+            {'script': 'a.py', 'difficulty': 'easy', 'score': 10,
+             'uptime_s': 60, 'user_terminated_process_count': 0},
+            {'script': 'a.py', 'difficulty': 'easy', 'score': 20,
+             'uptime_s': 60, 'user_terminated_process_count': 2},
+            {'script': 'b.py', 'difficulty': 'easy', 'score': 5,
+             'uptime_s': 30, 'user_terminated_process_count': 10},
+        ]
+
+        rows = aggregate_results(results, ['a.py', 'b.py'], ['easy', 'hard'])
+
+        assert [(row['script'], row['difficulty'], row['runs']) for row in rows] == [
+            ('a.py', 'easy', 2),
+            ('b.py', 'easy', 1),
+        ]
+        assert rows[0]['metrics']['score']['mean'] == 15
+        assert rows[0]['metrics']['user_terminated_process_count']['median'] == 1
+        assert rows[1]['metrics']['uptime_s']['p95'] == 30
+
+        table = format_table(rows)
+        assert len(table.splitlines()) == 1 + 2 * 3
+
+    def test_run_match_is_reproducible_with_same_seed(self, temp_script):
+        first = run_match(temp_script, 'easy', 1, 5000)
+        second = run_match(temp_script, 'easy', 1, 5000)
+
+        assert first['seed'] == 1
+        assert first['difficulty'] == 'easy'
+        assert first['score'] == second['score']
+
+    def test_run_tournament_runs_cross_product(self, temp_script):
+        collected = []
+
+        results = run_tournament(
+            [temp_script], ['easy', 'normal'], [0, 1], 2000,
+            max_workers=2, on_result=collected.append
+        )
+
+        assert len(results) == 4
+        assert collected == results
+        assert sorted((result['difficulty'], result['seed']) for result in results) == [
+            ('easy', 0), ('easy', 1), ('normal', 0), ('normal', 1)
+        ]
+
+    def test_run_match_on_sandbox_is_reproducible_with_same_seed(self, temp_script):
+        first = run_match(temp_script, 'sandbox:sandbox.sample', 1, 5000)
+        second = run_match(temp_script, 'sandbox:sandbox.sample', 1, 5000)
+
+        assert first['stage'] == 'Sandbox'
+        assert first['simulated_time_ms'] == second['simulated_time_ms']
+        assert first['score'] == second['score']
+
+    def test_run_match_with_unknown_sandbox(self, temp_script):
+        with pytest.raises(ValueError, match='not found'):
+            run_match(temp_script, 'sandbox:nonexistent.module', 1, 5000)
@@ -0,0 +1,65 @@
+import pygame
+
+from ui.color import Color
+from ui.fonts import FONT_PRIMARY_MEDIUM, FONT_SECONDARY_SMALL
+from ui.text_cache import TextCache
+
+
+class TestTextCache:
+    def test_render(self):
+        text_cache = TextCache()
+        surface = text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE)
+        assert isinstance(surface, pygame.Surface)
+        assert surface.get_size() == FONT_PRIMARY_MEDIUM.size('Hello')
+        assert text_cache.hits == 0
+        assert text_cache.misses == 1
+        assert len(text_cache) == 1
+
+    def test_render_same_text_twice(self):
+        text_cache = TextCache()
+        surface = text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE)
+        assert text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE) is surface
+        assert text_cache.hits == 1
+        assert text_cache.misses == 1
+        assert len(text_cache) == 1
+
+    def test_render_with_color_as_list(self):
+        text_cache = TextCache()
+        surface = text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE)
+        assert text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, list(Color.WHITE)) is surface
+
+    def test_render_different_keys(self):
+        text_cache = TextCache()
+        surfaces = [
+            text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE),
+            text_cache.render(FONT_PRIMARY_MEDIUM, 'World', False, Color.WHITE),
+            text_cache.render(FONT_SECONDARY_SMALL, 'Hello', False, Color.WHITE),
+            text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', True, Color.WHITE),
+            text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.BLACK),
+        ]
+        assert len(set(map(id, surfaces))) == 5
+        assert text_cache.hits == 0
+        assert text_cache.misses == 5
+        assert len(text_cache) == 5
+
+    def test_least_recently_used_text_is_evicted(self):
+        text_cache = TextCache(max_size=2)
+        hello = text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE)
+        text_cache.render(FONT_PRIMARY_MEDIUM, 'World', False, Color.WHITE)
+        text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE)
+        text_cache.render(FONT_PRIMARY_MEDIUM, 'Foo', False, Color.WHITE)
+        assert len(text_cache) == 2
+
+        assert text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE) is hello
+        assert text_cache.misses == 3
+        text_cache.render(FONT_PRIMARY_MEDIUM, 'World', False, Color.WHITE)
+        assert text_cache.misses == 4
+
+    def test_clear(self):
+        text_cache = TextCache()
+        text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE)
+        text_cache.render(FONT_PRIMARY_MEDIUM, 'Hello', False, Color.WHITE)
+        text_cache.clear()
+        assert len(text_cache) == 0
+        assert text_cache.hits == 0
+        assert text_cache.misses == 0
@@ -0,0 +1,206 @@
+"""
+Entry point to compare automated scripts against each other.
+
+Every combination of script, difficulty and seed is simulated
+headlessly, spread over a pool of worker processes. Each run is
+written as a JSON line, and aggregated statistics per script and
+difficulty are printed once all runs are done.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from os import path
+import argparse
+import json
+import os
+import statistics
+import sys
+
+from cli_utils import from_project_root, get_difficulty_config, load_sandbox_stage, percentile
+from constants import ONE_MINUTE, ONE_SECOND
+from config.difficulty_levels import difficulty_levels_map
+from auto import compile_auto_script, create_stage, simulate_stage
+
+_DEFAULT_TIME_LIMIT_MINUTES = 30
+_SANDBOX_PREFIX = 'sandbox:'
+
+_METRICS = [
+    ('score', 'score'),
+    ('uptime (s)', 'uptime_s'),
+    ('ragequits', 'user_terminated_process_count'),
+]
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        prog="pipenv run tournament",
+        description="Compare automated scripts over several difficulties and seeds"
+    )
+
+    parser.add_argument('filenames', nargs='+', metavar='filename',
+        help="filenames of the automated scripts")
+    parser.add_argument('--difficulties', nargs='+', metavar='DIFFICULTY',
+        choices=list(difficulty_levels_map.keys()), default=[],
+        help="built-in difficulty presets to use "
+            "(default: all, unless --sandbox is provided)")
+    parser.add_argument('--sandbox', nargs='+', metavar='MODULE', default=[],
+        help="sandbox config modules to use (e.g., sandbox.sample)")
+    seed_group = parser.add_mutually_exclusive_group()
+    seed_group.add_argument('--seeds', nargs='+', type=int, metavar='SEED',
+        help="seeds to run each script and difficulty with")
+    seed_group.add_argument('--num-seeds', type=int, metavar='N', default=1,
+        help="run each script and difficulty with seeds 0 to N - 1 (default: 1)")
+    parser.add_argument('--time-limit', metavar='MINUTES', type=float,
+        default=_DEFAULT_TIME_LIMIT_MINUTES,
+        help=f"simulated time after which a run stops (default: {_DEFAULT_TIME_LIMIT_MINUTES})")
+    parser.add_argument('--skip-idle-frames', action='store_true',
+        help="jump straight to the next frame at which something may change "
+            "(same results, fewer frames to simulate)")
+    parser.add_argument('--workers', type=int, metavar='N', default=os.cpu_count(),
+        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument('--output', metavar='FILE',
+        help="file to write the result of each run to, as JSON lines (default: stdout)")
+
+    args = parser.parse_args()
+
+    if not args.difficulties and not args.sandbox:
+        args.difficulties = list(difficulty_levels_map.keys())
+    if args.seeds is None:
+        args.seeds = list(range(args.num_seeds))
+
+    return args
+
+def _get_stage_or_difficulty(difficulty):
+    if difficulty.startswith(_SANDBOX_PREFIX):
+        return load_sandbox_stage(difficulty[len(_SANDBOX_PREFIX):])
+    return get_difficulty_config(difficulty)
+
+def run_match(script_filename, difficulty, seed, time_limit_ms, skip_idle_frames=False):
+    """Simulate one script on one difficulty with the given seed.
+
+    `difficulty` is either the name of a built-in difficulty preset,
+    or a sandbox module path prefixed with `sandbox:`.
+    Returns a dict describing the run. Raises ValueError if the sandbox
+    module cannot be loaded.
+    """
+    stage_scene = create_stage(
+        compile_auto_script(script_filename),
+        _get_stage_or_difficulty(difficulty)
+    )
+    stage_scene.seed = seed
+    result = simulate_stage(stage_scene, time_limit_ms, skip_idle_frames=skip_idle_frames)
+    return {
+        'script': script_filename,
+        'difficulty': difficulty,
+        'seed': seed,
+        **result,
+        'uptime_s': result['uptime_ms'] // ONE_SECOND,
+    }
+
+def summarize(values):
+    sorted_values = sorted(values)
+    return {
+        'mean': statistics.fmean(sorted_values),
+        'median': statistics.median(sorted_values),
+        'p5': percentile(sorted_values, 5),
+        'p95': percentile(sorted_values, 95),
+    }
+
+def aggregate_results(results, scripts, difficulties):
+    """Group run results per script and difficulty, and summarize each metric.
+
+    Returns a list of rows in the order of `scripts`, then `difficulties`.
+    """
+    rows = []
+    for script, difficulty in product(scripts, difficulties):
+        runs = [
+            result for result in results
+            if result['script'] == script and result['difficulty'] == difficulty
+        ]
+        if not runs:
+            continue
+        rows.append({
+            'script': script,
+            'difficulty': difficulty,
+            'runs': len(runs),
+            'metrics': {
+                key: summarize([run[key] for run in runs])
+                for _, key in _METRICS
+            },
+        })
+    return rows
+
+def format_table(rows):
+    header = ['script', 'difficulty', 'metric', 'runs', 'mean', 'median', 'p5', 'p95']
+    lines = []
+    for row in rows:
+        for label, key in _METRICS:
+            summary = row['metrics'][key]
+            lines.append([
+                path.basename(row['script']),
+                row['difficulty'],
+                label,
+                str(row['runs']),
+                *(f"{summary[stat]:.1f}" for stat in ('mean', 'median', 'p5', 'p95')),
+            ])
+    widths = [max(len(line[i]) for line in [header] + lines) for i in range(len(header))]
+    return '\n'.join(
+        '  '.join(
+            cell.ljust(width) if i < 3 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(line, widths))
+        )
+        for line in [header] + lines
+    )
+
+def run_tournament(scripts, difficulties, seeds, time_limit_ms, *,
+                   skip_idle_frames=False, max_workers=None, on_result=None):
+    """Run every combination of script, difficulty and seed over a process pool.
+
+    `on_result` is called with each run result as soon as it is available.
+    Returns the list of all run results.
+    """
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_match, script, difficulty, seed, time_limit_ms, skip_idle_frames
+            )
+            for script, difficulty, seed in product(scripts, difficulties, seeds)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+def main():
+    args = parse_arguments()
+    scripts = [from_project_root(filename) for filename in args.filenames]
+    difficulties = args.difficulties + [_SANDBOX_PREFIX + module for module in args.sandbox]
+
+    if args.output is not None:
+        output = open(from_project_root(args.output), 'w', encoding='utf_8') # pylint: disable=consider-using-with
+    else:
+        output = sys.stdout
+
+    def write_result(result):
+        output.write(json.dumps(result) + '\n')
+        output.flush()
+
+    try:
+        results = run_tournament(
+            scripts, difficulties, args.seeds, int(args.time_limit * ONE_MINUTE),
+            skip_idle_frames=args.skip_idle_frames,
+            max_workers=args.workers, on_result=write_result
+        )
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(format_table(aggregate_results(results, scripts, difficulties)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Cache of rendered text surfaces, shared by all views.
+
+Rendering text with a font is one of the most expensive operations of a
+frame, while most texts only change once in a while (score, uptime,
+counters) or never. Rendered surfaces are kept in a bounded cache, keyed
+by font, text, antialiasing and color, and evicted in least recently
+used order.
+
+Cached surfaces are shared between callers, so they must not be modified.
+"""
+
+from collections import OrderedDict
+
+DEFAULT_MAX_SIZE = 512
+
+class TextCache:
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self._max_size = max_size
+        self._surfaces = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, font, text, antialias, color):
+        """Same as `font.render(text, antialias, color)`, but cached."""
+        key = (font, text, antialias, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self._misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+        self._hits = 0
+        self._misses = 0
+
+text_cache = TextCache()
+
+def render_text(font, text, antialias, color):
+    return text_cache.render(font, text, antialias, color)